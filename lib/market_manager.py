@@ -13,9 +13,11 @@ import asyncio
 import time
 from datetime import datetime, timezone
 from dataclasses import dataclass
-from typing import Optional, Dict, Callable, List, Union, Awaitable
+from typing import Any, Optional, Dict, Callable, List, Set, Type, Union, Awaitable
 
 from src.gamma_client import GammaClient
+from src.latency import LatencyRecorder
+from src.recorder import MarketDataRecorder
 from src.websocket_client import MarketWebSocket, OrderbookSnapshot
 
 
@@ -123,6 +125,8 @@ class MarketManager:
     - WebSocket connection with auto-reconnect
     - Market change detection and notification
     - Orderbook caching
+    - Pre-warmed books for the next window, switched with diffed
+      subscriptions so the incoming market is never blind
     """
 
     def __init__(
@@ -130,6 +134,10 @@ class MarketManager:
         coin: str = "BTC",
         market_check_interval: float = 30.0,
         auto_switch_market: bool = True,
+        book_type: Type[Any] = OrderbookSnapshot,
+        recorder: Optional[MarketDataRecorder] = None,
+        latency: Optional[LatencyRecorder] = None,
+        prewarm_seconds: float = 60.0,
     ):
         """
         Initialize market manager.
@@ -138,10 +146,20 @@ class MarketManager:
             coin: Coin symbol (BTC, ETH, SOL, XRP)
             market_check_interval: Seconds between market checks
             auto_switch_market: Auto switch when market changes
+            book_type: Orderbook class for the WebSocket cache
+            recorder: Optional recorder for raw WebSocket frames
+            latency: Latency histograms kept across WebSocket restarts
+                (created if not given)
+            prewarm_seconds: Subscribe to the next window's tokens this
+                many seconds before the current market ends (0 disables)
         """
         self.coin = coin.upper()
         self.market_check_interval = market_check_interval
         self.auto_switch_market = auto_switch_market
+        self.book_type = book_type
+        self.recorder = recorder
+        self.latency = latency if latency is not None else LatencyRecorder()
+        self.prewarm_seconds = prewarm_seconds
 
         # Clients
         self.gamma = GammaClient()
@@ -149,6 +167,8 @@ class MarketManager:
 
         # State
         self.current_market: Optional[MarketInfo] = None
+        self.next_market: Optional[MarketInfo] = None
+        self._current_tokens: Set[str] = set()
         self._previous_slug: Optional[str] = None
         self._running = False
         self._ws_connected = False
@@ -195,6 +215,35 @@ class MarketManager:
             return self.ws.get_orderbook(token_id)
         return None
 
+    def is_stale(self, side: str) -> bool:
+        """
+        Check if the cached orderbook for side can't be trusted.
+
+        True while disconnected, after a detected gap until the book is
+        resynced, or before the first snapshot arrives.
+        """
+        if not self.ws or not self.current_market:
+            return True
+        token_id = self.current_market.token_ids.get(side)
+        return self.ws.is_stale(token_id) if token_id else True
+
+    def last_good_update(self, side: str) -> float:
+        """Get wall-clock time of the last verified book update for side."""
+        if not self.ws or not self.current_market:
+            return 0.0
+        token_id = self.current_market.token_ids.get(side)
+        return self.ws.last_good_update(token_id) if token_id else 0.0
+
+    def live_book(self, token_id: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a token's live book in REST /book shape, if it can be trusted.
+
+        Usable as a ClobClient book source (see TradingBot.set_book_source).
+        """
+        if not self.ws:
+            return None
+        return self.ws.live_book(token_id, max_age)
+
     def get_mid_price(self, side: str) -> float:
         """Get mid price for side."""
         ob = self.get_orderbook(side)
@@ -242,6 +291,10 @@ class MarketManager:
         """Update current market state."""
         self._previous_slug = market.slug
         self.current_market = market
+        self._current_tokens = set(market.token_ids.values())
+        # Drop the pre-warmed market once it is current (or superseded)
+        if self.next_market and not self._should_switch_market(market, self.next_market):
+            self.next_market = None
 
     def _market_sort_key(self, market: MarketInfo) -> Optional[int]:
         """Get comparable timestamp for market ordering."""
@@ -276,14 +329,37 @@ class MarketManager:
             MarketInfo if found, None otherwise
         """
         market_data = self.gamma.get_market_info(self.coin)
+        return self._accept_discovered(market_data, update_state)
+
+    async def adiscover_market(self, update_state: bool = True) -> Optional[MarketInfo]:
+        """Async variant of discover_market() that doesn't block the event loop."""
+        market_data = await self.gamma.aget_market_info(self.coin)
+        return self._accept_discovered(market_data, update_state)
 
+    def _accept_discovered(
+        self,
+        market_data: Optional[Dict[str, Any]],
+        update_state: bool
+    ) -> Optional[MarketInfo]:
+        """Turn discovered market data into MarketInfo if it accepts orders."""
         if not market_data:
             return None
 
         if not market_data.get("accepting_orders", False):
             return None
 
-        market = MarketInfo(
+        market = self._market_from_info(market_data)
+
+        if update_state:
+            # Note: Market change callbacks are fired in _market_check_loop
+            # to ensure they run in the main thread after resubscription
+            self._update_current_market(market)
+        return market
+
+    @staticmethod
+    def _market_from_info(market_data: Dict[str, Any]) -> MarketInfo:
+        """Build MarketInfo from a GammaClient market info dictionary."""
+        return MarketInfo(
             slug=market_data.get("slug", ""),
             question=market_data.get("question", ""),
             end_date=market_data.get("end_date", ""),
@@ -292,21 +368,83 @@ class MarketManager:
             accepting_orders=market_data.get("accepting_orders", False),
         )
 
-        if update_state:
-            # Note: Market change callbacks are fired in _market_check_loop
-            # to ensure they run in the main thread after resubscription
-            self._update_current_market(market)
-        return market
+    def discover_next_market(self) -> Optional[MarketInfo]:
+        """
+        Discover the next 15-minute market (not yet required to be open).
+
+        Returns:
+            MarketInfo if found, None otherwise
+        """
+        market_data = self.gamma.get_next_market_info(self.coin)
+        if not market_data or not market_data.get("token_ids"):
+            return None
+        return self._market_from_info(market_data)
+
+    async def adiscover_next_market(self) -> Optional[MarketInfo]:
+        """Async variant of discover_next_market()."""
+        market_data = await self.gamma.aget_next_market_info(self.coin)
+        if not market_data or not market_data.get("token_ids"):
+            return None
+        return self._market_from_info(market_data)
+
+    def _subscription_targets(self) -> List[str]:
+        """Token IDs that should be subscribed: current plus pre-warmed next market."""
+        tokens: List[str] = []
+        if self.current_market:
+            tokens.extend(self.current_market.token_ids.values())
+        if self.next_market:
+            tokens.extend(self.next_market.token_ids.values())
+        return tokens
+
+    async def _maybe_prewarm_next(self) -> None:
+        """Subscribe to the next window's tokens when the current one ends soon."""
+        market = self.current_market
+        if not (self.ws and market and self.prewarm_seconds > 0):
+            return
+        if self.next_market is not None or not market.is_ending_soon(int(self.prewarm_seconds)):
+            return
+
+        next_market = await self.adiscover_next_market()
+        if not next_market or not self._should_switch_market(market, next_market):
+            return
+
+        self.next_market = next_market
+        await self.ws.set_subscriptions(self._subscription_targets())
+
+    def _next_check_delay(self) -> float:
+        """Seconds until the next market check, waking early for pre-warm and expiry."""
+        delay = self.market_check_interval
+        end_ts = self.current_market.end_timestamp() if self.current_market else None
+        if end_ts is not None:
+            remaining = end_ts - time.time()
+            # Wake for the pre-warm point and just after expiry
+            for wake_in in (remaining - self.prewarm_seconds, remaining + 1.0):
+                if wake_in > 0:
+                    delay = min(delay, wake_in)
+        return max(delay, 1.0)
+
+    async def _switch_market(self, market: MarketInfo) -> None:
+        """Make market current, keeping warm books and evicting only expired ones."""
+        self._update_current_market(market)
+        if self.ws:
+            await self.ws.set_subscriptions(self._subscription_targets())
 
     async def _setup_websocket(self) -> bool:
         """Setup WebSocket connection and callbacks."""
         if not self.current_market:
             return False
 
-        self.ws = MarketWebSocket()
+        self.ws = MarketWebSocket(
+            book_type=self.book_type,
+            recorder=self.recorder,
+            latency=self.latency,
+        )
 
         @self.ws.on_book
         async def handle_book(snapshot: OrderbookSnapshot):  # pyright: ignore[reportUnusedFunction]
+            # Pre-warmed next-market books are cached but not delivered
+            if snapshot.asset_id not in self._current_tokens:
+                return
             for callback in self._on_book_callbacks:
                 try:
                     result = callback(snapshot)
@@ -333,8 +471,8 @@ class MarketManager:
                 except Exception:
                     pass
 
-        # Subscribe to current market tokens
-        token_list = list(self.current_market.token_ids.values())
+        # Subscribe to current (and any pre-warmed) market tokens
+        token_list = self._subscription_targets()
         if token_list:
             await self.ws.subscribe(token_list, replace=True)
 
@@ -348,17 +486,22 @@ class MarketManager:
     async def _market_check_loop(self) -> None:
         """Periodically check for market changes."""
         while self._running:
-            await asyncio.sleep(self.market_check_interval)
+            await asyncio.sleep(self._next_check_delay())
 
             if not self._running:
                 break
 
+            if self.auto_switch_market:
+                try:
+                    await self._maybe_prewarm_next()
+                except Exception:
+                    pass
+
             old_market = self.current_market
             old_tokens = set(old_market.token_ids.values()) if old_market else set()
             old_slug = old_market.slug if old_market else None
 
-            # Run synchronous HTTP call in thread pool to avoid blocking
-            market = await asyncio.to_thread(self.discover_market, update_state=False)
+            market = await self.adiscover_market(update_state=False)
 
             if not market:
                 continue
@@ -376,9 +519,8 @@ class MarketManager:
             if not self._should_switch_market(old_market, market):
                 continue
 
-            # Market changed - resubscribe to new tokens
-            await self.ws.subscribe(list(new_tokens), replace=True)
-            self._update_current_market(market)
+            # Market changed - send only subscription deltas
+            await self._switch_market(market)
 
             # Fire market change callbacks in main thread
             if old_slug and old_slug != market.slug:
@@ -398,7 +540,7 @@ class MarketManager:
         self._running = True
 
         # Discover initial market
-        if not self.discover_market():
+        if not await self.adiscover_market():
             self._running = False
             return False
 
@@ -440,6 +582,7 @@ class MarketManager:
             await self.ws.disconnect()
             self.ws = None
 
+        await self.gamma.aclose()
         self._ws_connected = False
 
     async def wait_for_data(self, timeout: float = 5.0) -> bool:
@@ -470,8 +613,7 @@ class MarketManager:
         old_market = self.current_market
         old_tokens = set(old_market.token_ids.values()) if old_market else set()
 
-        # Run synchronous HTTP call in thread pool to avoid blocking
-        market = await asyncio.to_thread(self.discover_market, update_state=False)
+        market = await self.adiscover_market(update_state=False)
 
         if not market:
             return None
@@ -484,8 +626,5 @@ class MarketManager:
         if not self._should_switch_market(old_market, market):
             return old_market
 
-        if self.ws:
-            await self.ws.subscribe(list(new_tokens), replace=True)
-
-        self._update_current_market(market)
+        await self._switch_market(market)
         return market
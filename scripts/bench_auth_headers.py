@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Auth Header Benchmark - Per-order Header Building Cost
+
+Measures how long it takes to build the authentication headers for one
+POST /order: Builder attribution plus L2 API-key headers, as
+ClobClient._build_headers does on every authenticated call.
+
+Compares the cached builders in src/auth.py (secret decoded once,
+keyed HMAC state copied per request) against rebuilding the HMAC from
+the raw secret on every call, and checks both produce identical
+signatures.
+
+Usage:
+    python scripts/bench_auth_headers.py
+    python scripts/bench_auth_headers.py --iterations 200000
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.auth import BuilderHeaderBuilder, L2HeaderBuilder
+
+
+API_KEY = "00000000-1111-2222-3333-444444444444"
+SECRET = base64.urlsafe_b64encode(os.urandom(32)).decode()
+PASSPHRASE = "f" * 64
+ADDRESS = "0x" + "ab" * 20
+
+BUILDER_KEY = "builder-key"
+BUILDER_SECRET = "builder-secret-" + "x" * 32
+BUILDER_PASSPHRASE = "builder-passphrase"
+
+
+def order_body() -> str:
+    """Compact JSON body shaped like a signed POST /order."""
+    order = {
+        "salt": 1234567890123,
+        "maker": ADDRESS,
+        "signer": ADDRESS,
+        "taker": "0x0000000000000000000000000000000000000000",
+        "tokenId": "71321045679252212594626385532706912750332728571942532289631379312455583992563",
+        "makerAmount": "5000000",
+        "takerAmount": "10000000",
+        "expiration": "0",
+        "nonce": "0",
+        "feeRateBps": "0",
+        "side": "BUY",
+        "signatureType": 2,
+        "signature": "0x" + "cd" * 65,
+    }
+    return json.dumps({"order": order, "owner": API_KEY, "orderType": "GTC"}, separators=(",", ":"))
+
+
+def legacy_headers(method: str, path: str, body: str, timestamp: str) -> Dict[str, str]:
+    """Headers built the way ClobClient did before caching."""
+    headers = {}
+
+    message = f"{timestamp}{method}{path}{body}"
+    signature = hmac.new(BUILDER_SECRET.encode(), message.encode(), hashlib.sha256).hexdigest()
+    headers.update({
+        "POLY_BUILDER_API_KEY": BUILDER_KEY,
+        "POLY_BUILDER_TIMESTAMP": timestamp,
+        "POLY_BUILDER_PASSPHRASE": BUILDER_PASSPHRASE,
+        "POLY_BUILDER_SIGNATURE": signature,
+    })
+
+    message = f"{timestamp}{method}{path}"
+    if body:
+        message += body
+    base64_secret = base64.urlsafe_b64decode(SECRET)
+    h = hmac.new(base64_secret, message.encode("utf-8"), hashlib.sha256)
+    signature = base64.urlsafe_b64encode(h.digest()).decode("utf-8")
+    headers.update({
+        "POLY_ADDRESS": ADDRESS,
+        "POLY_API_KEY": API_KEY,
+        "POLY_TIMESTAMP": timestamp,
+        "POLY_PASSPHRASE": PASSPHRASE,
+        "POLY_SIGNATURE": signature,
+    })
+    return headers
+
+
+def cached_headers_factory() -> Callable[[str, str, str, str], Dict[str, str]]:
+    """Headers built with the cached builders."""
+    builder = BuilderHeaderBuilder(BUILDER_KEY, BUILDER_SECRET, BUILDER_PASSPHRASE)
+    l2 = L2HeaderBuilder(API_KEY, SECRET, PASSPHRASE, ADDRESS)
+
+    def build(method: str, path: str, body: str, timestamp: str) -> Dict[str, str]:
+        headers = builder.headers(method, path, body, timestamp)
+        headers.update(l2.headers(method, path, body, timestamp))
+        return headers
+
+    return build
+
+
+def bench(build: Callable[[str, str, str, str], Dict[str, str]], body: str, iterations: int) -> float:
+    """Return mean microseconds per header set."""
+    timestamp = str(int(time.time()))
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build("POST", "/order", body, timestamp)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark auth header building")
+    parser.add_argument("--iterations", type=int, default=100000, help="Header sets built per case")
+    args = parser.parse_args()
+
+    body = order_body()
+    cached = cached_headers_factory()
+
+    timestamp = str(int(time.time()))
+    if legacy_headers("POST", "/order", body, timestamp) != cached("POST", "/order", body, timestamp):
+        print("Signature mismatch between legacy and cached headers")
+        return 1
+
+    print(f"Body: {len(body)} bytes, iterations per case: {args.iterations}\n")
+    print(f"{'builder':<10} {'us/order':>9}")
+    print("-" * 20)
+    legacy_us = bench(legacy_headers, body, args.iterations)
+    cached_us = bench(cached, body, args.iterations)
+    print(f"{'legacy':<10} {legacy_us:>9.2f}")
+    print(f"{'cached':<10} {cached_us:>9.2f}")
+    print(f"\nSpeedup: {legacy_us / cached_us:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
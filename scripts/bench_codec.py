@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Codec Benchmark - Per-message WebSocket Decode Cost
+
+Measures how long it takes to turn a raw market-channel frame into the
+typed events MarketWebSocket hands to callbacks (OrderbookSnapshot,
+PriceChange, LastTradePrice), for every JSON backend that is installed,
+and for msgspec decoding straight into typed events ("structs").
+
+Frames are synthetic but shaped like the busiest 15-minute crypto
+markets: deep books on both sides, paired price_change batches for the
+Up/Down tokens and last_trade_price prints. Captured frames can be
+replayed instead with --file (one raw frame per line).
+
+Usage:
+    python scripts/bench_codec.py
+    python scripts/bench_codec.py --iterations 50000
+    python scripts/bench_codec.py --file frames.jsonl
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import codec
+from src.websocket_client import LastTradePrice, MarketWebSocket, OrderbookSnapshot, PriceChange
+
+
+UP_TOKEN = "71321045679252212594626385532706912750332728571942532289631379312455583992563"
+DOWN_TOKEN = "52114319501245915516055106046884209969926127482827954674443846427813813222426"
+MARKET = "0x5f65177b394277fd294cd75650044e32ba009a95022d88a0c1d565897d72f8f1"
+
+
+def _levels(start: float, step: float, count: int) -> List[Dict[str, str]]:
+    """Build a side of the book as exchange-formatted level dicts."""
+    return [
+        {"price": f"{start + i * step:.2f}", "size": f"{random.uniform(5, 5000):.2f}"}
+        for i in range(count)
+    ]
+
+
+def synthetic_frames() -> Dict[str, str]:
+    """Build one raw frame per event type."""
+    timestamp = str(int(time.time() * 1000))
+    book = {
+        "event_type": "book",
+        "asset_id": UP_TOKEN,
+        "market": MARKET,
+        "timestamp": timestamp,
+        "hash": "0x" + "ab" * 20,
+        # Exchange sends bids ascending and asks descending
+        "bids": _levels(0.01, 0.01, 48),
+        "asks": _levels(0.99, -0.01, 48),
+    }
+    price_change = {
+        "event_type": "price_change",
+        "market": MARKET,
+        "timestamp": timestamp,
+        "price_changes": [
+            {
+                "asset_id": token,
+                "price": price,
+                "size": "125.5",
+                "side": side,
+                "hash": "0x" + "cd" * 20,
+                "best_bid": "0.48",
+                "best_ask": "0.49",
+            }
+            for token, price, side in ((UP_TOKEN, "0.48", "BUY"), (DOWN_TOKEN, "0.52", "SELL"))
+        ],
+    }
+    trade = {
+        "event_type": "last_trade_price",
+        "asset_id": UP_TOKEN,
+        "market": MARKET,
+        "price": "0.49",
+        "size": "219.21",
+        "side": "BUY",
+        "timestamp": timestamp,
+        "fee_rate_bps": "0",
+    }
+    return {
+        "book": json.dumps(book),
+        "price_change": json.dumps(price_change),
+        "last_trade_price": json.dumps(trade),
+    }
+
+
+def load_frames(path: str) -> Dict[str, List[str]]:
+    """Group captured raw frames by event type."""
+    grouped: Dict[str, List[str]] = {}
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            data = json.loads(line)
+            first = data[0] if isinstance(data, list) and data else data
+            event_type = first.get("event_type", "unknown") if isinstance(first, dict) else "unknown"
+            grouped.setdefault(event_type, []).append(line)
+    return grouped
+
+
+def available_backends() -> Dict[str, Callable[[Any], Any]]:
+    """Collect the JSON decoders installed in this environment."""
+    backends: Dict[str, Callable[[Any], Any]] = {"json": json.loads}
+    try:
+        import orjson
+        backends["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        backends["msgspec"] = msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+    return backends
+
+
+def to_events(data: Any) -> None:
+    """Build typed events the same way MarketWebSocket does."""
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        event_type = item.get("event_type", "")
+        if event_type == "book":
+            OrderbookSnapshot.from_message(item)
+        elif event_type == "price_change":
+            [PriceChange.from_dict(pc) for pc in item.get("price_changes", [])]
+        elif event_type == "last_trade_price":
+            LastTradePrice.from_message(item)
+
+
+def typed_frame_decoder() -> Optional[Callable[[Any], Any]]:
+    """Decode frames the way MarketWebSocket does when msgspec is installed."""
+    ws = MarketWebSocket()
+    if ws._decode_typed is None:
+        return None
+    return ws._decode
+
+
+def from_typed(events: List[Any]) -> None:
+    """Finish typed events the same way MarketWebSocket does."""
+    for event in events:
+        if hasattr(event, "bids"):
+            OrderbookSnapshot.from_event(event)
+
+
+def bench(
+    decode: Callable[[Any], Any],
+    frames: List[str],
+    iterations: int,
+    typed: bool,
+    finish: Callable[[Any], None] = to_events,
+) -> float:
+    """Return mean microseconds per frame."""
+    count = len(frames)
+    start = time.perf_counter()
+    for i in range(iterations):
+        data = decode(frames[i % count])
+        if typed:
+            finish(data)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket frame decoding")
+    parser.add_argument("--iterations", type=int, default=20000, help="Frames decoded per case")
+    parser.add_argument("--file", help="Replay captured frames (one raw frame per line)")
+    args = parser.parse_args()
+
+    if args.file:
+        grouped = load_frames(args.file)
+    else:
+        grouped = {name: [frame] for name, frame in synthetic_frames().items()}
+
+    backends = available_backends()
+    structs = typed_frame_decoder()
+    print(f"Active codec backend: {codec.BACKEND}")
+    print(f"Iterations per case: {args.iterations}\n")
+    print(f"{'event':<18} {'bytes':>7} {'backend':<9} {'parse us':>9} {'typed us':>9}")
+    print("-" * 56)
+
+    for event_type, frames in grouped.items():
+        avg_bytes = sum(len(f) for f in frames) // len(frames)
+        for name, decode in backends.items():
+            parse_us = bench(decode, frames, args.iterations, typed=False)
+            typed_us = bench(decode, frames, args.iterations, typed=True)
+            print(f"{event_type:<18} {avg_bytes:>7} {name:<9} {parse_us:>9.2f} {typed_us:>9.2f}")
+        if structs is not None:
+            parse_us = bench(structs, frames, args.iterations, typed=False)
+            typed_us = bench(structs, frames, args.iterations, typed=True, finish=from_typed)
+            print(f"{event_type:<18} {avg_bytes:>7} {'structs':<9} {parse_us:>9.2f} {typed_us:>9.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Record Market - Capture Raw Market Data
+
+Records every raw market-channel frame for a coin's 15-minute markets
+into rotating, compressed capture files. Markets are followed as they
+roll over, so a multi-hour run covers every window in between.
+
+Each record holds the raw frame, monotonic and wall-clock receive
+timestamps and the connection ID (see src/recorder.py).
+
+Usage:
+    python scripts/record_market.py --coin BTC --hours 2
+    python scripts/record_market.py --coin ETH --hours 24 --out captures/eth
+    python scripts/record_market.py --coin SOL --hours 1 --compression gzip
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.market_manager import MarketManager
+from src.recorder import MarketDataRecorder
+
+
+async def record(args: argparse.Namespace) -> int:
+    """Record until the requested duration has elapsed."""
+    recorder = MarketDataRecorder(
+        args.out,
+        prefix=f"{args.coin.lower()}-market",
+        compression=args.compression,
+        rotate_bytes=args.rotate_mb * 1024 * 1024,
+        rotate_seconds=args.rotate_minutes * 60,
+    )
+    manager = MarketManager(coin=args.coin, recorder=recorder)
+
+    @manager.on_market_change
+    def handle_market_change(old_slug: str, new_slug: str):  # pyright: ignore[reportUnusedFunction]
+        print(f"Market changed: {old_slug} -> {new_slug}")
+
+    recorder.start()
+    try:
+        if not await manager.start():
+            print(f"No active {args.coin} market found")
+            return 1
+
+        market = manager.current_market
+        print(f"Recording {args.coin} to {args.out} for {args.hours}h ({recorder.compression})")
+        if market:
+            print(f"Current market: {market.slug}")
+
+        deadline = time.monotonic() + args.hours * 3600
+        while time.monotonic() < deadline:
+            await asyncio.sleep(min(args.status_interval, max(deadline - time.monotonic(), 0)))
+            print(
+                f"recorded={recorder.recorded} dropped={recorder.dropped} "
+                f"connected={manager.is_connected} file={recorder.current_path}"
+            )
+    finally:
+        await manager.stop()
+        recorder.stop()
+
+    print(f"Done: {recorder.recorded} frames recorded, {recorder.dropped} dropped")
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run the recorder."""
+    parser = argparse.ArgumentParser(description="Record raw Polymarket market data")
+    parser.add_argument("--coin", default="BTC", help="Coin symbol (BTC, ETH, SOL, XRP)")
+    parser.add_argument("--hours", type=float, default=1.0, help="Recording duration in hours")
+    parser.add_argument("--out", default="captures", help="Output directory")
+    parser.add_argument(
+        "--compression",
+        choices=["auto", "zstd", "gzip"],
+        default="auto",
+        help="Capture compression (auto uses zstd when installed)",
+    )
+    parser.add_argument("--rotate-mb", type=int, default=256, help="Rotate after this many MB (uncompressed)")
+    parser.add_argument("--rotate-minutes", type=float, default=60.0, help="Rotate after this many minutes")
+    parser.add_argument("--status-interval", type=float, default=60.0, help="Seconds between status lines")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    try:
+        return asyncio.run(record(args))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Signing Backend Validation - Cross-check ECDSA Backends
+
+Signs random digests and random orders with every available backend in
+src/secp256k1.py and checks, for each case, that:
+- all backends return byte-identical signatures
+- they match eth_keys' pure-Python reference implementation
+- the signature recovers to the signer's address
+
+Then reports signatures per second for each backend.
+
+Exits non-zero on any mismatch.
+
+Usage:
+    python scripts/validate_signing_backends.py
+    python scripts/validate_signing_backends.py --keys 20 --cases 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eth_account import Account
+from eth_keys import KeyAPI
+from eth_keys.backends import NativeECCBackend
+
+from src.secp256k1 import BACKENDS, COINCURVE_AVAILABLE, create_backend
+from src.signer import Order, OrderSigner
+
+
+REFERENCE = KeyAPI(NativeECCBackend)
+
+
+def reference_signature(private_key: bytes, digest: bytes) -> bytes:
+    """Sign with eth_keys' pure-Python backend (v = 27/28)."""
+    signature = REFERENCE.PrivateKey(private_key).sign_msg_hash(digest).to_bytes()
+    return signature[:64] + bytes((signature[64] + 27,))
+
+
+def recover_address(digest: bytes, signature: bytes) -> str:
+    """Recover the signer address from a 65-byte signature."""
+    vrs = REFERENCE.Signature(signature_bytes=signature[:64] + bytes((signature[64] - 27,)))
+    return vrs.recover_public_key_from_msg_hash(digest).to_checksum_address()
+
+
+def random_digests(rng: random.Random, count: int) -> List[bytes]:
+    """Random digests plus the edge values 0x00.. and 0xff..."""
+    return [bytes(32), b"\xff" * 32] + [rng.getrandbits(256).to_bytes(32, "big") for _ in range(count)]
+
+
+def random_orders(rng: random.Random, count: int) -> List[Order]:
+    """Orders with varied fields, salts and nonces."""
+    return [
+        Order(
+            token_id=str(rng.getrandbits(255)),
+            price=rng.randint(1, 99) / 100,
+            size=rng.randint(1, 5000) / 10,
+            side=rng.choice(("BUY", "SELL")),
+            maker="0x" + os.urandom(20).hex(),
+            nonce=rng.getrandbits(32),
+            salt=rng.getrandbits(53),
+        )
+        for _ in range(count)
+    ]
+
+
+def validate(keys: int, cases: int) -> int:
+    """Cross-check every backend; return the number of mismatches."""
+    rng = random.Random(7)
+    names = [name for name in BACKENDS if name != "auto" and (name != "coincurve" or COINCURVE_AVAILABLE)]
+    failures = 0
+    checked = 0
+
+    for _ in range(keys):
+        private_key = os.urandom(32)
+        account = Account.from_key(private_key)
+        backends = {name: create_backend(account, name) for name in names}
+        signers = {name: OrderSigner(private_key.hex(), backend=name) for name in names}
+
+        for digest in random_digests(rng, cases):
+            expected = reference_signature(private_key, digest)
+            for name, backend in backends.items():
+                signature = backend.sign_hash(digest)
+                if signature != expected or recover_address(digest, signature) != account.address:
+                    failures += 1
+                    print(f"MISMATCH {name} key={account.address} digest={digest.hex()}")
+            checked += 1
+
+        for order in random_orders(rng, max(1, cases // 4)):
+            digest = signers[names[0]].order_digest(order)
+            expected = "0x" + reference_signature(private_key, digest).hex()
+            for name, signer in signers.items():
+                if signer.sign_order(order)["signature"] != expected:
+                    failures += 1
+                    print(f"MISMATCH {name} order={order}")
+            checked += 1
+
+    print(f"Backends: {', '.join(names)}; {checked} cases checked against eth_keys reference, {failures} mismatches")
+    return failures
+
+
+def bench(iterations: int) -> None:
+    """Print signatures per second for each backend."""
+    account = Account.from_key(os.urandom(32))
+    digests = [os.urandom(32) for _ in range(iterations)]
+    rates: Dict[str, float] = {}
+
+    print(f"\n{'backend':<12} {'sigs/s':>10} {'us/sig':>10}")
+    print("-" * 34)
+    for name in BACKENDS:
+        if name == "auto" or (name == "coincurve" and not COINCURVE_AVAILABLE):
+            continue
+        backend = create_backend(account, name)
+        start = time.perf_counter()
+        for digest in digests:
+            backend.sign_hash(digest)
+        rates[name] = iterations / (time.perf_counter() - start)
+        print(f"{name:<12} {rates[name]:>10.0f} {1e6 / rates[name]:>10.1f}")
+
+    if "coincurve" in rates:
+        print(f"\nSpeedup: {rates['coincurve'] / rates['eth_account']:.1f}x")
+    else:
+        print("\ncoincurve not installed (pip install coincurve)")
+
+
+def main() -> int:
+    """Run validation and the benchmark."""
+    parser = argparse.ArgumentParser(description="Cross-validate ECDSA signing backends")
+    parser.add_argument("--keys", type=int, default=5, help="Random keys to test")
+    parser.add_argument("--cases", type=int, default=50, help="Random digests per key")
+    parser.add_argument("--iterations", type=int, default=500, help="Signatures per backend in the benchmark")
+    args = parser.parse_args()
+
+    if validate(args.keys, args.cases):
+        return 1
+    bench(args.iterations)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -37,6 +37,19 @@ from .crypto import KeyManager
 from .config import Config, BuilderConfig
 from .gamma_client import GammaClient
 from .websocket_client import MarketWebSocket, OrderbookManager, OrderbookSnapshot
+from .tick_orderbook import TickOrderbook
+from .websocket_pool import MarketWebSocketPool
+from .user_websocket import UserWebSocket
+from .recorder import MarketDataRecorder
+from .latency import LatencyHistogram, LatencyRecorder
+from .rate_limit import RateLimiter, TokenBucket, get_rate_limiter
+from .retry import RetryPolicy, CircuitBreaker
+from .warmer import ConnectionWarmer
+from .cache import ReadCache, get_read_cache
+from .clock import ClockSync, get_clock
+from .signing_service import SigningService
+from .presign import OrderLadder
+from .allocator import OrderIdAllocator, get_allocator
 
 # Utility functions
 from .utils import (
@@ -67,6 +80,26 @@ __all__ = [
     "MarketWebSocket",
     "OrderbookManager",
     "OrderbookSnapshot",
+    "TickOrderbook",
+    "MarketWebSocketPool",
+    "UserWebSocket",
+    "MarketDataRecorder",
+    "LatencyHistogram",
+    "LatencyRecorder",
+    "RateLimiter",
+    "TokenBucket",
+    "get_rate_limiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "ConnectionWarmer",
+    "ReadCache",
+    "get_read_cache",
+    "ClockSync",
+    "get_clock",
+    "SigningService",
+    "OrderLadder",
+    "OrderIdAllocator",
+    "get_allocator",
     # Utility functions
     "create_bot_from_env",
     "validate_address",
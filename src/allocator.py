@@ -0,0 +1,183 @@
+"""
+Allocator Module - Order Salts and Exchange Nonce
+
+Gives every order a unique salt and the maker's current exchange
+nonce, so identical orders placed in the same second still produce
+distinct payloads:
+- Salts come from a counter; blocks of salts are reserved in a state
+  file, so restarts and other processes sharing the file never reuse
+  one (without a file, the counter starts at a random offset)
+- The exchange nonce is the on-chain value orders must carry (0 until
+  the maker increments it to invalidate all open orders); it is
+  persisted in the same file
+- Thread-safe; salts are assigned when an Order is built, so signing
+  worker processes receive orders that already carry them
+
+Example:
+    from src.allocator import get_allocator
+
+    allocator = get_allocator()
+    allocator.configure(path="credentials/order_ids.json")
+
+    salt = allocator.next_salt()
+    nonce = allocator.nonce
+    allocator.set_nonce(1)  # after incrementNonce on the exchange
+"""
+
+import json
+import logging
+import os
+import secrets
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+try:
+    import fcntl
+    FILE_LOCKS_AVAILABLE = True
+except ImportError:  # Windows: state file is only locked within the process
+    fcntl = None
+    FILE_LOCKS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Salts stay below 2**53 so they survive JSON number parsing as doubles
+MAX_SALT = 1 << 53
+
+
+class OrderIdAllocator:
+    """
+    Allocates order salts and tracks the exchange nonce.
+
+    Salts are unique per state file (or, without one, per process with
+    overwhelming probability).
+    """
+
+    def __init__(self, path: Optional[str] = None, block_size: int = 1024):
+        """
+        Initialize allocator.
+
+        Args:
+            path: JSON state file (None = in-memory, random salt offset)
+            block_size: Salts reserved from the state file at a time
+        """
+        self.path = Path(path) if path else None
+        self.block_size = max(1, block_size)
+
+        self._lock = threading.Lock()
+        self._next_salt = 0
+        self._block_end = 0
+        self._nonce = 0
+        if self.path is not None:
+            self._nonce = int(self._update_state(lambda state: state).get("nonce", 0))
+
+    def configure(self, path: Optional[str] = None, block_size: Optional[int] = None) -> None:
+        """
+        Switch to a state file (drops the current salt block).
+
+        Args:
+            path: JSON state file
+            block_size: Salts reserved at a time
+        """
+        with self._lock:
+            if block_size is not None:
+                self.block_size = max(1, block_size)
+            if path is not None and (self.path is None or Path(path) != self.path):
+                self.path = Path(path)
+                self._next_salt = self._block_end = 0
+                self._nonce = int(self._update_state(lambda state: state).get("nonce", 0))
+
+    def _update_state(self, update: Callable[[Dict[str, int]], Dict[str, int]]) -> Dict[str, int]:
+        """Read, update and write the state file under an exclusive lock."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+") as f:
+            if FILE_LOCKS_AVAILABLE:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                content = f.read()
+                state = json.loads(content) if content.strip() else {}
+                new_state = update(dict(state))
+                if new_state != state:
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(new_state, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                return new_state
+            finally:
+                if FILE_LOCKS_AVAILABLE:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _reserve_block(self) -> None:
+        """Reserve the next block of salts (lock held)."""
+        if self.path is None:
+            if self._block_end == 0:
+                self._next_salt = 1 + secrets.randbelow(MAX_SALT >> 1)
+            self._block_end = MAX_SALT
+            return
+
+        def reserve(state: Dict[str, int]) -> Dict[str, int]:
+            start = int(state.get("next_salt", 1))
+            state["next_salt"] = start + self.block_size
+            return state
+
+        state = self._update_state(reserve)
+        self._nonce = int(state.get("nonce", self._nonce))
+        self._block_end = state["next_salt"]
+        self._next_salt = self._block_end - self.block_size
+
+    def next_salt(self) -> int:
+        """Allocate a unique order salt."""
+        with self._lock:
+            if self._next_salt >= self._block_end:
+                self._reserve_block()
+            salt = self._next_salt
+            self._next_salt += 1
+            return salt
+
+    @property
+    def nonce(self) -> int:
+        """Exchange nonce new orders must carry (as last read from the state file)."""
+        return self._nonce
+
+    def set_nonce(self, nonce: int) -> None:
+        """
+        Set the exchange nonce (after it changed on the exchange).
+
+        Orders signed with an older nonce are no longer valid.
+        """
+        if nonce < 0:
+            raise ValueError(f"Invalid nonce: {nonce}")
+        self._change_nonce(lambda current: nonce)
+
+    def bump_nonce(self) -> int:
+        """
+        Increment the exchange nonce, mirroring incrementNonce on-chain.
+
+        Returns:
+            New nonce
+        """
+        return self._change_nonce(lambda current: current + 1)
+
+    def _change_nonce(self, change: Callable[[int], int]) -> int:
+        """Apply change(current nonce) atomically, persisting the result."""
+        with self._lock:
+            if self.path is None:
+                self._nonce = change(self._nonce)
+            else:
+                def store(state: Dict[str, int]) -> Dict[str, int]:
+                    state["nonce"] = change(int(state.get("nonce", 0)))
+                    return state
+
+                self._nonce = self._update_state(store)["nonce"]
+        logger.info(f"Exchange nonce set to {self._nonce}")
+        return self._nonce
+
+
+_shared_allocator = OrderIdAllocator()
+
+
+def get_allocator() -> OrderIdAllocator:
+    """Get the process-wide order salt and nonce allocator."""
+    return _shared_allocator
@@ -32,14 +32,20 @@ Example:
 import os
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, Dict, Any, List, Callable, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum
 
 from .config import Config, BuilderConfig
 from .signer import OrderSigner, Order
-from .client import ClobClient, RelayerClient, ApiCredentials
+from .client import ClobClient, RelayerClient, ApiCredentials, BookSource
+from .allocator import get_allocator
+from .clock import get_clock
 from .crypto import KeyManager, CryptoError, InvalidPasswordError
+from .warmer import ConnectionWarmer
+from .signing_service import SigningService
 
 
 # Configure logging
@@ -81,7 +87,7 @@ class OrderResult:
 
         return cls(
             success=success,
-            order_id=response.get("orderId"),
+            order_id=response.get("orderId") or response.get("orderID"),
             status=response.get("status"),
             message=error_msg if not success else "Order placed successfully",
             data=response
@@ -125,7 +131,8 @@ class TradingBot:
         encrypted_key_path: Optional[str] = None,
         password: Optional[str] = None,
         api_creds_path: Optional[str] = None,
-        log_level: int = logging.INFO
+        log_level: int = logging.INFO,
+        signing_workers: int = 0
     ):
         """
         Initialize trading bot.
@@ -162,6 +169,8 @@ class TradingBot:
             password: Password for encrypted key
             api_creds_path: Path to API credentials file
             log_level: Logging level
+            signing_workers: Worker processes for order signing
+                (0 = sign on the event loop)
         """
         # Set log level
         logger.setLevel(log_level)
@@ -185,14 +194,37 @@ class TradingBot:
         self.signer: Optional[OrderSigner] = None
         self.clob_client: Optional[ClobClient] = None
         self.relayer_client: Optional[RelayerClient] = None
+        self.warmer: Optional[ConnectionWarmer] = None
+        self.signing_service: Optional[SigningService] = None
         self._api_creds: Optional[ApiCredentials] = None
 
+        # Server clock shared by auth headers and latency metrics
+        self.clock = get_clock()
+        self.clock.configure(host=self.config.clob.host, interval=self.config.clob.clock_sync_interval)
+        self._owns_clock_sync = False
+
+        # Dedicated threads for blocking order-path work, so their
+        # sessions stay warm instead of landing on arbitrary pool threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.clob.warm_connections),
+            thread_name_prefix="clob-io",
+        )
+
         # Load private key
         if private_key:
             self.signer = OrderSigner(private_key)
         elif encrypted_key_path and password:
             self._load_encrypted_key(encrypted_key_path, password)
 
+        # Order salts and the exchange nonce, persisted so restarts never reuse them
+        self.allocator = get_allocator()
+        if self.signer:
+            self.allocator.configure(path=os.path.join(self.config.data_dir, "order_ids.json"))
+
+        # Sign orders in worker processes, off the event loop
+        if self.signer and signing_workers > 0:
+            self.signing_service = SigningService.from_signer(self.signer, signing_workers)
+
         # Load API credentials
         if api_creds_path:
             self._load_api_creds(api_creds_path)
@@ -235,6 +267,9 @@ class TradingBot:
             return
 
         try:
+            # L1 auth is rejected if its timestamp is too far from server time
+            if not self.clock.synced:
+                self.clock.sync()
             logger.info("Deriving L2 API credentials...")
             self._api_creds = self.clob_client.create_or_derive_api_key(self.signer)
             self.clob_client.set_api_creds(self._api_creds)
@@ -253,6 +288,14 @@ class TradingBot:
             funder=self.config.safe_address,
             api_creds=self._api_creds,
             builder_creds=self.config.builder if self.config.use_gasless else None,
+            http2=self.config.clob.http2,
+            executor=self._executor,
+        )
+        self.warmer = ConnectionWarmer(
+            self.clob_client,
+            connections=self.config.clob.warm_connections,
+            interval=self.config.clob.keepalive_interval,
+            executor=self._executor,
         )
 
         # Relayer client (for gasless)
@@ -266,8 +309,78 @@ class TradingBot:
             logger.info("Relayer client initialized (gasless enabled)")
 
     async def _run_in_thread(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
-        """Run a blocking call in a worker thread to avoid event loop stalls."""
-        return await asyncio.to_thread(func, *args, **kwargs)
+        """Run a blocking call on the bot's executor to avoid event loop stalls."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def warm_up(self) -> int:
+        """
+        Sync the server clock, start signing workers, open warm CLOB
+        connections and start keep-alive probes and clock re-syncs.
+
+        Call once the event loop is running, before the first order.
+
+        Returns:
+            Number of warm connections
+        """
+        if not self.clock.synced:
+            await self.clock.async_sync()
+        if self.clock.start():
+            self._owns_clock_sync = True
+        if self.signing_service:
+            await self.signing_service.warm()
+
+        if not self.warmer or self.config.clob.warm_connections <= 0:
+            return 0
+        warmed = await self.warmer.warm()
+        self.warmer.start()
+        return warmed
+
+    async def cool_down(self) -> None:
+        """
+        Stop the keep-alive probes and clock re-syncs started by warm_up().
+
+        Connections, signing workers and credentials stay usable, so the
+        bot can be warmed up again; close() releases everything.
+        """
+        if self.warmer:
+            await self.warmer.stop()
+        if self._owns_clock_sync:
+            self._owns_clock_sync = False
+            await self.clock.stop()
+
+    async def close(self) -> None:
+        """Stop keep-alive probes, clock re-syncs, signing workers and I/O threads and close pooled async HTTP connections."""
+        if self.warmer:
+            await self.warmer.stop()
+        if self.signing_service:
+            self.signing_service.shutdown()
+            self.signing_service = None
+        if self._owns_clock_sync:
+            self._owns_clock_sync = False
+            await self.clock.stop()
+        if self.clob_client:
+            await self.clob_client.aclose()
+        if self.relayer_client:
+            await self.relayer_client.aclose()
+        # Don't block the loop on in-flight sync calls; they finish on their own
+        self._executor.shutdown(wait=False)
+
+    def set_book_source(self, source: Optional[BookSource]) -> None:
+        """
+        Serve order book reads from a live source when it is fresh.
+
+        Args:
+            source: Callable returning a REST-shaped book or None
+                (e.g. MarketWebSocket.live_book); None to always use REST
+        """
+        if self.clob_client:
+            self.clob_client.book_source = source
+
+    @property
+    def api_creds(self) -> Optional[ApiCredentials]:
+        """Get L2 API credentials (None if not derived/loaded)."""
+        return self._api_creds
 
     def is_initialized(self) -> bool:
         """Check if bot is properly initialized."""
@@ -285,6 +398,65 @@ class TradingBot:
             )
         return self.signer
 
+    def build_order(
+        self,
+        token_id: str,
+        price: float,
+        size: float,
+        side: str,
+        fee_rate_bps: int = 0
+    ) -> Order:
+        """
+        Build an unsigned order for the bot's maker address.
+
+        Raises:
+            ValueError: If side, price or size is invalid
+        """
+        return Order(
+            token_id=token_id,
+            price=price,
+            size=size,
+            side=side,
+            maker=self.config.safe_address,
+            fee_rate_bps=fee_rate_bps,
+        )
+
+    async def _sign_order(self, order: Order) -> Dict[str, Any]:
+        """Sign an order in the signing service, or inline without one."""
+        if self.signing_service:
+            return await self.signing_service.asign(order)
+        return self.require_signer().sign_order(order)
+
+    async def sign_orders(self, orders: List[Order]) -> List[Any]:
+        """
+        Sign orders off the event loop.
+
+        Uses the signing service when configured, otherwise the bot's
+        worker threads.
+
+        Args:
+            orders: Orders to sign
+
+        Returns:
+            Signed order dicts, or the exception for orders that failed,
+            in input order
+        """
+        if self.signing_service:
+            return await self.signing_service.asign_batch(orders)
+
+        signer = self.require_signer()
+
+        def sign_all() -> List[Any]:
+            results: List[Any] = []
+            for order in orders:
+                try:
+                    results.append(signer.sign_order(order))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        return await self._run_in_thread(sign_all)
+
     async def place_order(
         self,
         token_id: str,
@@ -308,32 +480,42 @@ class TradingBot:
         Returns:
             OrderResult with order status
         """
-        signer = self.require_signer()
+        self.require_signer()
 
         try:
-            # Create order
-            order = Order(
-                token_id=token_id,
-                price=price,
-                size=size,
-                side=side,
-                maker=self.config.safe_address,
-                fee_rate_bps=fee_rate_bps,
+            order = self.build_order(token_id, price, size, side, fee_rate_bps)
+            signed = await self._sign_order(order)
+        except Exception as e:
+            logger.error(f"Failed to place order: {e}")
+            return OrderResult(
+                success=False,
+                message=str(e)
             )
 
-            # Sign order
-            signed = signer.sign_order(order)
+        return await self.place_signed_order(signed, order_type)
 
-            # Submit to CLOB
-            response = await self._run_in_thread(
-                self.clob_client.post_order,
-                signed,
-                order_type,
-            )
+    async def place_signed_order(
+        self,
+        signed: Dict[str, Any],
+        order_type: str = "GTC"
+    ) -> OrderResult:
+        """
+        Submit an already signed order (e.g. from an OrderLadder).
+
+        Args:
+            signed: Signed order dict from OrderSigner.sign_order
+            order_type: Order type (GTC, GTD, FOK)
 
+        Returns:
+            OrderResult with order status
+        """
+        try:
+            response = await self.clob_client.apost_order(signed, order_type)
+
+            order = signed.get("order", {})
             logger.info(
-                f"Order placed: {side} {size}@{price} "
-                f"(token: {token_id[:16]}...)"
+                f"Order placed: {order.get('side')} {order.get('size')}@{order.get('price')} "
+                f"(token: {str(order.get('tokenId', ''))[:16]}...)"
             )
 
             return OrderResult.from_response(response)
@@ -353,32 +535,66 @@ class TradingBot:
         """
         Place multiple orders.
 
+        Orders are signed up front and submitted through the CLOB batch
+        endpoint (chunked to the server limit, chunks sent concurrently).
+
         Args:
             orders: List of order dictionaries with keys:
                 - token_id: Market token ID
                 - price: Price per share
                 - size: Number of shares
                 - side: 'BUY' or 'SELL'
+                - fee_rate_bps: Fee rate in basis points (optional)
             order_type: Order type (GTC, GTD, FOK)
 
         Returns:
-            List of OrderResults
-        """
-        results = []
-        for order_data in orders:
-            result = await self.place_order(
-                token_id=order_data["token_id"],
-                price=order_data["price"],
-                size=order_data["size"],
-                side=order_data["side"],
-                order_type=order_type,
-            )
-            results.append(result)
-
-            # Small delay between orders to avoid rate limits
-            await asyncio.sleep(0.1)
+            List of OrderResults, in the same order as the input
+        """
+        self.require_signer()
+
+        # Sign everything first; orders that fail to build or sign are
+        # reported in place and left out of the batch
+        results: List[Optional[OrderResult]] = [None] * len(orders)
+        built: List[Order] = []
+        built_positions: List[int] = []
+        for i, order_data in enumerate(orders):
+            try:
+                built.append(self.build_order(
+                    token_id=order_data["token_id"],
+                    price=order_data["price"],
+                    size=order_data["size"],
+                    side=order_data["side"],
+                    fee_rate_bps=order_data.get("fee_rate_bps", 0),
+                ))
+                built_positions.append(i)
+            except Exception as e:
+                logger.error(f"Failed to build order {i}: {e}")
+                results[i] = OrderResult(success=False, message=str(e))
+
+        signatures = await self.sign_orders(built) if built else []
+
+        signed_orders: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for i, signed in zip(built_positions, signatures):
+            if isinstance(signed, BaseException):
+                logger.error(f"Failed to sign order {i}: {signed}")
+                results[i] = OrderResult(success=False, message=str(signed))
+            else:
+                signed_orders.append(signed)
+                positions.append(i)
+
+        if signed_orders:
+            try:
+                responses = await self.clob_client.apost_orders(signed_orders, order_type)
+            except Exception as e:
+                logger.error(f"Failed to place orders: {e}")
+                responses = [{"success": False, "errorMsg": str(e)}] * len(signed_orders)
+            for i, response in zip(positions, responses):
+                results[i] = OrderResult.from_response(response)
 
-        return results
+        placed = sum(1 for r in results if r and r.success)
+        logger.info(f"Batch placed {placed}/{len(orders)} orders")
+        return [r for r in results if r is not None]
 
     async def cancel_order(self, order_id: str) -> OrderResult:
         """
@@ -391,7 +607,7 @@ class TradingBot:
             OrderResult with cancellation status
         """
         try:
-            response = await self._run_in_thread(self.clob_client.cancel_order, order_id)
+            response = await self.clob_client.acancel_order(order_id)
             logger.info(f"Order cancelled: {order_id}")
             return OrderResult(
                 success=True,
@@ -407,6 +623,35 @@ class TradingBot:
                 message=str(e)
             )
 
+    async def cancel_orders(self, order_ids: List[str]) -> OrderResult:
+        """
+        Cancel multiple orders.
+
+        IDs are sent in server-sized chunks concurrently.
+
+        Args:
+            order_ids: Order IDs to cancel
+
+        Returns:
+            OrderResult (success only if every order was cancelled); data
+            holds the merged canceled / not_canceled lists
+        """
+        if not order_ids:
+            return OrderResult(success=True, message="No orders to cancel", data={"canceled": [], "not_canceled": {}})
+
+        try:
+            response = await self.clob_client.acancel_orders(order_ids)
+            not_canceled = response.get("not_canceled") or {}
+            logger.info(f"Cancelled {len(response.get('canceled') or [])}/{len(order_ids)} orders")
+            return OrderResult(
+                success=not not_canceled,
+                message=f"{len(not_canceled)} orders not cancelled" if not_canceled else "Orders cancelled",
+                data=response
+            )
+        except Exception as e:
+            logger.error(f"Failed to cancel orders: {e}")
+            return OrderResult(success=False, message=str(e))
+
     async def cancel_all_orders(self) -> OrderResult:
         """
         Cancel all open orders.
@@ -415,7 +660,7 @@ class TradingBot:
             OrderResult with cancellation status
         """
         try:
-            response = await self._run_in_thread(self.clob_client.cancel_all_orders)
+            response = await self.clob_client.acancel_all_orders()
             logger.info("All orders cancelled")
             return OrderResult(
                 success=True,
@@ -442,11 +687,7 @@ class TradingBot:
             OrderResult with cancellation status
         """
         try:
-            response = await self._run_in_thread(
-                self.clob_client.cancel_market_orders,
-                market,
-                asset_id,
-            )
+            response = await self.clob_client.acancel_market_orders(market, asset_id)
             logger.info(f"Market orders cancelled (market: {market or 'all'}, asset: {asset_id or 'all'})")
             return OrderResult(
                 success=True,
@@ -465,7 +706,7 @@ class TradingBot:
             List of open orders
         """
         try:
-            orders = await self._run_in_thread(self.clob_client.get_open_orders)
+            orders = await self.clob_client.aget_open_orders()
             logger.debug(f"Retrieved {len(orders)} open orders")
             return orders
         except Exception as e:
@@ -483,7 +724,7 @@ class TradingBot:
             Order details or None
         """
         try:
-            return await self._run_in_thread(self.clob_client.get_order, order_id)
+            return await self.clob_client.aget_order(order_id)
         except Exception as e:
             logger.error(f"Failed to get order {order_id}: {e}")
             return None
@@ -491,20 +732,20 @@ class TradingBot:
     async def get_trades(
         self,
         token_id: Optional[str] = None,
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[Dict[str, Any]]:
         """
         Get trade history.
 
         Args:
             token_id: Optional token ID to filter
-            limit: Maximum number of trades
+            limit: Maximum number of trades (None for the full history)
 
         Returns:
             List of trades
         """
         try:
-            trades = await self._run_in_thread(self.clob_client.get_trades, token_id, limit)
+            trades = await self.clob_client.aget_trades(token_id, limit)
             logger.debug(f"Retrieved {len(trades)} trades")
             return trades
         except Exception as e:
@@ -522,7 +763,7 @@ class TradingBot:
             Order book data
         """
         try:
-            return await self._run_in_thread(self.clob_client.get_order_book, token_id)
+            return await self.clob_client.aget_order_book(token_id)
         except Exception as e:
             logger.error(f"Failed to get order book: {e}")
             return {}
@@ -538,7 +779,7 @@ class TradingBot:
             Price data
         """
         try:
-            return await self._run_in_thread(self.clob_client.get_market_price, token_id)
+            return await self.clob_client.aget_market_price(token_id)
         except Exception as e:
             logger.error(f"Failed to get market price: {e}")
             return {}
@@ -555,10 +796,7 @@ class TradingBot:
             return False
 
         try:
-            response = await self._run_in_thread(
-                self.relayer_client.deploy_safe,
-                self.config.safe_address,
-            )
+            response = await self.relayer_client.adeploy_safe(self.config.safe_address)
             logger.info(f"Safe deployment initiated: {response}")
             return True
         except Exception as e:
@@ -0,0 +1,248 @@
+"""
+Cache Module - TTL Read Cache with Single-flight Coalescing
+
+Read-through cache for CLOB market-data reads:
+- Per-endpoint TTLs (e.g. /book, /price)
+- Bounded LRU eviction
+- Single-flight: concurrent identical reads share one HTTP request,
+  for both threads and coroutines
+- One process-wide instance shared by every ClobClient, so several
+  strategies in one process coalesce with each other
+
+Cached values are shared between callers; treat them as read-only.
+
+Example:
+    from src.cache import get_read_cache
+
+    cache = get_read_cache()
+    cache.set_ttl("/book", 0.5)
+
+    book = await cache.aget_or_fetch("/book", token_id, lambda: client.afetch(...))
+    print(cache.stats)
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Seconds a response stays fresh, per endpoint (0 = coalesce only)
+DEFAULT_TTLS: Dict[str, float] = {
+    "/book": 0.25,
+    "/price": 0.25,
+}
+
+_MISSING = object()
+
+
+class _Call:
+    """In-flight sync fetch shared by waiting threads."""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ReadCache:
+    """
+    TTL + LRU cache with single-flight fetches.
+
+    Entries are keyed by (endpoint, key). Endpoints without a TTL are
+    only coalesced, never stored.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 1024):
+        """
+        Initialize read cache.
+
+        Args:
+            ttls: {endpoint: seconds} overrides of DEFAULT_TTLS
+            max_entries: Entries kept before least recently used are evicted
+        """
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_entries = max_entries
+
+        # (endpoint, key) -> (expires_at, value)
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._sync_calls: Dict[Tuple[str, Hashable], _Call] = {}
+        self._async_calls: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def set_ttl(self, endpoint: str, ttl: float) -> None:
+        """Set the TTL for an endpoint (0 disables storing)."""
+        self.ttls[endpoint] = ttl
+
+    def get(self, endpoint: str, key: Hashable) -> Any:
+        """
+        Get a fresh cached value.
+
+        Returns:
+            The value, or None if missing or expired
+        """
+        value = self._lookup((endpoint, key))
+        return None if value is _MISSING else value
+
+    def set(self, endpoint: str, key: Hashable, value: Any) -> None:
+        """Store a value under the endpoint's TTL."""
+        ttl = self.ttls.get(endpoint, 0.0)
+        if ttl <= 0:
+            return
+        with self._lock:
+            entries = self._entries
+            entries[(endpoint, key)] = (time.monotonic() + ttl, value)
+            entries.move_to_end((endpoint, key))
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, endpoint: Optional[str] = None, key: Optional[Hashable] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            endpoint: Only this endpoint (None = all)
+            key: Only this key within the endpoint (None = all)
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            elif key is not None:
+                self._entries.pop((endpoint, key), None)
+            else:
+                for cache_key in [k for k in self._entries if k[0] == endpoint]:
+                    del self._entries[cache_key]
+
+    def _lookup(self, cache_key: Tuple[str, Hashable]) -> Any:
+        """Get a fresh value or _MISSING, counting hits."""
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[cache_key]
+                return _MISSING
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return value
+
+    def get_or_fetch(self, endpoint: str, key: Hashable, fetch: Callable[[], T]) -> T:
+        """
+        Get a cached value, or fetch it once for all concurrent threads.
+
+        Args:
+            endpoint: Endpoint (selects the TTL)
+            key: Request key within the endpoint
+            fetch: Blocking fetch called on a miss
+
+        Returns:
+            Cached or fetched value
+        """
+        cache_key = (endpoint, key)
+        value = self._lookup(cache_key)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            call = self._sync_calls.get(cache_key)
+            leader = call is None
+            if leader:
+                call = self._sync_calls[cache_key] = _Call()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fetch()
+            self.set(endpoint, key, call.value)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._sync_calls.pop(cache_key, None)
+            call.event.set()
+
+    async def aget_or_fetch(self, endpoint: str, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Get a cached value, or fetch it once for all concurrent coroutines.
+
+        The fetch runs as its own task, so a cancelled caller does not
+        cancel the request other callers are waiting on.
+
+        Args:
+            endpoint: Endpoint (selects the TTL)
+            key: Request key within the endpoint
+            fetch: Coroutine function called on a miss
+
+        Returns:
+            Cached or fetched value
+        """
+        cache_key = (endpoint, key)
+        value = self._lookup(cache_key)
+        if value is not _MISSING:
+            return value
+
+        task = self._async_calls.get(cache_key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fill(endpoint, key, fetch))
+            self._async_calls[cache_key] = task
+            task.add_done_callback(self._retrieve_error)
+        return await asyncio.shield(task)
+
+    async def _fill(self, endpoint: str, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run a shared fetch and store its result."""
+        try:
+            value = await fetch()
+            self.set(endpoint, key, value)
+            return value
+        finally:
+            cache_key = (endpoint, key)
+            if self._async_calls.get(cache_key) is asyncio.current_task():
+                del self._async_calls[cache_key]
+
+    @staticmethod
+    def _retrieve_error(task: asyncio.Task) -> None:
+        """Mark a failed fetch as handled even if every caller went away."""
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get entry count and hit/miss/coalesced counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+_shared_cache = ReadCache()
+
+
+def get_read_cache() -> ReadCache:
+    """Get the process-wide read cache shared by all clients."""
+    return _shared_cache
@@ -7,8 +7,13 @@ Provides clients for interacting with:
 
 Features:
 - Gasless transactions via Builder Program
-- HMAC authentication for Builder APIs
-- Automatic retry and error handling
+- HMAC authentication for Builder APIs (cached keyed HMAC state)
+- Retry policy (idempotency-aware, jittered backoff, deadline) and
+  per-host circuit breaker
+- Shared per-endpoint rate limiting with 429 / Retry-After adaptation
+- TTL read cache with single-flight coalescing for /book and /price
+- Native asyncio variants of every call (a-prefixed, e.g. apost_order)
+  over the client's own keep-alive pool when httpx is installed
 
 Example:
     from src.client import ClobClient, RelayerClient
@@ -25,25 +30,40 @@ Example:
         chain_id=137,
         builder_creds=builder_creds
     )
+
+    response = await clob.apost_order(signed_order)
 """
 
+import asyncio
 import time
-import hmac
-import hashlib
-import base64
 import json
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable, Iterator
 from dataclasses import dataclass
 
 import requests
 
+from . import codec, rate_limit
+from .auth import BuilderHeaderBuilder, L2HeaderBuilder
+from .cache import ReadCache, get_read_cache
+from .clock import ClockSync, get_clock
 from .config import BuilderConfig
-from .http import ThreadLocalSessionMixin
+from .http import AsyncSessionMixin, ThreadLocalSessionMixin, httpx
+from .rate_limit import RateLimiter, get_rate_limiter
+from .retry import CircuitBreaker, RetryPolicy, get_circuit_breaker, is_transport_error
+
+
+# Returns a fresh REST-shaped book for a token, or None
+BookSource = Callable[[str], Optional[Dict[str, Any]]]
 
 
 class ApiError(Exception):
     """Base exception for API errors."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class AuthenticationError(ApiError):
@@ -56,6 +76,11 @@ class OrderError(ApiError):
     pass
 
 
+class CircuitOpenError(ApiError):
+    """Raised without sending when the host's circuit breaker is open."""
+    pass
+
+
 @dataclass
 class ApiCredentials:
     """User-level API credentials for CLOB."""
@@ -79,7 +104,7 @@ class ApiCredentials:
         return bool(self.api_key and self.secret and self.passphrase)
 
 
-class ApiClient(ThreadLocalSessionMixin):
+class ApiClient(AsyncSessionMixin, ThreadLocalSessionMixin):
     """
     Base HTTP client with common functionality.
 
@@ -87,13 +112,22 @@ class ApiClient(ThreadLocalSessionMixin):
     - Automatic JSON handling
     - Request/response logging
     - Error handling
+    - Sync (_request) and asyncio (_arequest) transports
+    - Rate limiting through the process-wide RateLimiter
+    - Retry policy and per-host circuit breaker
     """
 
     def __init__(
         self,
         base_url: str,
         timeout: int = 30,
-        retry_count: int = 3
+        retry_count: int = 3,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        executor: Optional[Executor] = None,
+        clock: Optional[ClockSync] = None
     ):
         """
         Initialize API client.
@@ -101,12 +135,35 @@ class ApiClient(ThreadLocalSessionMixin):
         Args:
             base_url: Base URL for all requests
             timeout: Request timeout in seconds
-            retry_count: Number of retries on failure
+            retry_count: Maximum attempts per request (when no retry_policy)
+            http2: Use HTTP/2 for async requests (needs httpx[http2])
+            rate_limiter: Rate limiter (default: shared process-wide limiter)
+            retry_policy: Retry rules (default: RetryPolicy(max_attempts=retry_count)).
+                Its deadline caps every attempt's timeout; leave it unset
+                to size it from timeout and max_attempts
+            circuit_breaker: Circuit breaker (default: shared per host)
+            executor: Worker threads for sync fallbacks of async calls
+                (default: the event loop's default executor)
+            clock: Server clock for auth timestamps (default: shared clock)
         """
         super().__init__()
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.retry_count = retry_count
+        self.http2 = http2
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=retry_count)
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(self.base_url)
+        self.executor = executor
+        self.clock = clock or get_clock()
+
+        # Auth header builders, rebuilt only when credentials change
+        self._builder_header_builder: Optional[BuilderHeaderBuilder] = None
+        self._l2_header_builder: Optional[L2HeaderBuilder] = None
+
+    def _rate_limit_class(self, method: str, endpoint: str) -> str:
+        """Get the rate-limit endpoint class for a request."""
+        return rate_limit.DEFAULT
 
     def _request(
         self,
@@ -114,7 +171,8 @@ class ApiClient(ThreadLocalSessionMixin):
         endpoint: str,
         data: Optional[Any] = None,
         headers: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        params: Optional[Dict] = None,
+        body: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request with error handling.
@@ -125,6 +183,7 @@ class ApiClient(ThreadLocalSessionMixin):
             data: Request body data
             headers: Additional headers
             params: Query parameters
+            body: Pre-serialized JSON body, sent byte-for-byte instead of data
 
         Returns:
             Response JSON data
@@ -132,43 +191,239 @@ class ApiClient(ThreadLocalSessionMixin):
         Raises:
             ApiError: On request failure
         """
+        method = method.upper()
+        if method not in ("GET", "POST", "DELETE"):
+            raise ApiError(f"Unsupported method: {method}")
+
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         request_headers = {"Content-Type": "application/json"}
 
         if headers:
             request_headers.update(headers)
 
-        last_error = None
-        for attempt in range(self.retry_count):
+        content = body.encode("utf-8") if body is not None else None
+        json_data = data if content is None and method != "GET" else None
+
+        policy = self.retry_policy
+        idempotent = policy.is_idempotent(method, endpoint)
+        limit_class = self._rate_limit_class(method, endpoint)
+        deadline = policy.start(self.timeout)
+        last_error: Optional[Exception] = None
+        attempt = 0
+        for attempt in range(policy.max_attempts):
+            self._check_circuit()
+            self.rate_limiter.acquire(limit_class)
+            # The limiter may have held us past the deadline (e.g. Retry-After)
+            timeout = policy.attempt_timeout(self.timeout, deadline)
+            if timeout is None:
+                raise self._deadline_error(attempt, last_error)
             try:
-                session = self.session
-                if method.upper() == "GET":
-                    response = session.get(
-                        url, headers=request_headers,
-                        params=params, timeout=self.timeout
-                    )
-                elif method.upper() == "POST":
-                    response = session.post(
-                        url, headers=request_headers,
-                        json=data, params=params, timeout=self.timeout
-                    )
-                elif method.upper() == "DELETE":
-                    response = session.delete(
-                        url, headers=request_headers,
-                        json=data, params=params, timeout=self.timeout
-                    )
-                else:
-                    raise ApiError(f"Unsupported method: {method}")
+                response = self.session.request(
+                    method, url, headers=request_headers,
+                    data=content, json=json_data, params=params,
+                    timeout=timeout
+                )
+            except requests.exceptions.RequestException as e:
+                if is_transport_error(e):
+                    self.circuit_breaker.record_failure()
+                last_error = e
+                if not policy.should_retry_error(e, idempotent):
+                    raise ApiError(f"Request failed: {e}") from e
+                delay = policy.backoff(attempt)
+            else:
+                error = self._response_error(response, method, endpoint, limit_class)
+                if error is None:
+                    return codec.loads(response.content) if response.content else {}
+                last_error = error
+                if not policy.should_retry_status(error.status_code, idempotent):
+                    raise error
+                # 429: the rate limiter holds the next attempt until Retry-After
+                delay = 0.0 if error.status_code == 429 else policy.backoff(attempt)
+
+            if not policy.can_retry(attempt, delay, deadline):
+                break
+            if delay:
+                time.sleep(delay)
+
+        raise ApiError(
+            f"Request failed after {attempt + 1} attempts: {last_error}",
+            status_code=getattr(last_error, "status_code", None)
+        )
 
-                response.raise_for_status()
-                return response.json() if response.text else {}
+    async def _arequest(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        body: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request on the event loop with error handling.
 
-            except requests.exceptions.RequestException as e:
+        Uses this client's httpx.AsyncClient; falls back to running
+        _request on self.executor when httpx is not installed.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            data: Request body data
+            headers: Additional headers
+            params: Query parameters
+            body: Pre-serialized JSON body, sent byte-for-byte instead of data
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            ApiError: On request failure
+        """
+        if not self.async_available:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, partial(self._request, method, endpoint, data, headers, params, body)
+            )
+
+        method = method.upper()
+        if method not in ("GET", "POST", "DELETE"):
+            raise ApiError(f"Unsupported method: {method}")
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        request_headers = {"Content-Type": "application/json"}
+
+        if headers:
+            request_headers.update(headers)
+
+        content = None
+        if body is not None:
+            content = body.encode("utf-8")
+        elif data is not None and method != "GET":
+            # Same encoding requests uses for json=
+            content = json.dumps(data, allow_nan=False).encode("utf-8")
+
+        policy = self.retry_policy
+        idempotent = policy.is_idempotent(method, endpoint)
+        limit_class = self._rate_limit_class(method, endpoint)
+        deadline = policy.start(self.timeout)
+        session = self._get_async_session()
+        last_error: Optional[Exception] = None
+        attempt = 0
+        for attempt in range(policy.max_attempts):
+            self._check_circuit()
+            await self.rate_limiter.acquire_async(limit_class)
+            # The limiter may have held us past the deadline (e.g. Retry-After)
+            timeout = policy.attempt_timeout(self.timeout, deadline)
+            if timeout is None:
+                raise self._deadline_error(attempt, last_error)
+            try:
+                response = await session.request(
+                    method, url, headers=request_headers, params=params, content=content,
+                    timeout=timeout
+                )
+            except httpx.HTTPError as e:
+                if is_transport_error(e):
+                    self.circuit_breaker.record_failure()
                 last_error = e
-                if attempt < self.retry_count - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                if not policy.should_retry_error(e, idempotent):
+                    raise ApiError(f"Request failed: {e}") from e
+                delay = policy.backoff(attempt)
+            else:
+                error = self._response_error(response, method, endpoint, limit_class)
+                if error is None:
+                    return codec.loads(response.content) if response.content else {}
+                last_error = error
+                if not policy.should_retry_status(error.status_code, idempotent):
+                    raise error
+                # 429: the rate limiter holds the next attempt until Retry-After
+                delay = 0.0 if error.status_code == 429 else policy.backoff(attempt)
+
+            if not policy.can_retry(attempt, delay, deadline):
+                break
+            if delay:
+                await asyncio.sleep(delay)
+
+        raise ApiError(
+            f"Request failed after {attempt + 1} attempts: {last_error}",
+            status_code=getattr(last_error, "status_code", None)
+        )
+
+    @staticmethod
+    def _deadline_error(attempt: int, last_error: Optional[Exception]) -> ApiError:
+        """Error for a request whose deadline ran out before an attempt was sent."""
+        return ApiError(
+            f"Request deadline exceeded before attempt {attempt + 1} was sent"
+            + (f": {last_error}" if last_error is not None else ""),
+            status_code=getattr(last_error, "status_code", None)
+        )
 
-        raise ApiError(f"Request failed after {self.retry_count} attempts: {last_error}")
+    def _check_circuit(self) -> None:
+        """Fail fast while the host's circuit breaker is open."""
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(
+                f"Circuit open for {self.base_url}; retry in {self.circuit_breaker.retry_in:.1f}s"
+            )
+
+    def _response_error(
+        self,
+        response: Any,
+        method: str,
+        endpoint: str,
+        limit_class: str
+    ) -> Optional["ApiError"]:
+        """
+        Feed a response to the rate limiter and circuit breaker.
+
+        Args:
+            response: requests or httpx response
+            method: HTTP method
+            endpoint: API endpoint
+            limit_class: Rate-limit endpoint class of the request
+
+        Returns:
+            ApiError carrying the status code, or None on success
+        """
+        status_code = response.status_code
+        self.rate_limiter.on_response(limit_class, status_code, response.headers.get("Retry-After"))
+        if status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        if status_code < 400:
+            return None
+        return ApiError(
+            f"{method} {endpoint} failed with {status_code}: {response.text[:200]}",
+            status_code=status_code
+        )
+
+    @staticmethod
+    def _data_list(result: Any) -> List[Dict[str, Any]]:
+        """Extract the list from a possibly paginated response."""
+        if isinstance(result, dict) and "data" in result:
+            return result.get("data", [])
+        return result if isinstance(result, list) else []
+
+    def _build_headers(self, method: str, path: str, body: str = "") -> Dict[str, str]:
+        """Build authentication headers (overridden by authenticated clients)."""
+        return {}
+
+    def _builder_auth(self, creds: BuilderConfig) -> BuilderHeaderBuilder:
+        """Get the cached Builder header builder, rebuilding it if credentials changed."""
+        key = (creds.api_key, creds.api_secret, creds.api_passphrase)
+        builder = self._builder_header_builder
+        if builder is None or builder.cache_key != key:
+            builder = self._builder_header_builder = BuilderHeaderBuilder(*key)
+        return builder
+
+    def _signed_request(self, method: str, endpoint: str, body: Optional[Any]) -> Dict[str, Any]:
+        """
+        Build request arguments with headers signed over the body.
+
+        The body is serialized once; the signed string is exactly what
+        the transport sends.
+        """
+        body_json = codec.dumps(body) if body is not None else ""
+        headers = self._build_headers(method, endpoint, body_json)
+        return {"method": method, "endpoint": endpoint, "body": body_json or None, "headers": headers}
 
 
 class ClobClient(ApiClient):
@@ -190,6 +445,14 @@ class ClobClient(ApiClient):
         )
     """
 
+    # Server-side limits for batch endpoints
+    MAX_BATCH_ORDERS = 15
+    MAX_BATCH_CANCELS = 100
+
+    # Pagination cursors (base64 of "0" and "-1")
+    START_CURSOR = "MA=="
+    END_CURSOR = "LTE="
+
     def __init__(
         self,
         host: str = "https://clob.polymarket.com",
@@ -198,7 +461,14 @@ class ClobClient(ApiClient):
         funder: str = "",
         api_creds: Optional[ApiCredentials] = None,
         builder_creds: Optional[BuilderConfig] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        executor: Optional[Executor] = None,
+        read_cache: Optional[ReadCache] = None,
+        book_source: Optional[BookSource] = None,
+        clock: Optional[ClockSync] = None
     ):
         """
         Initialize CLOB client.
@@ -211,14 +481,34 @@ class ClobClient(ApiClient):
             api_creds: User API credentials (optional)
             builder_creds: Builder credentials for attribution (optional)
             timeout: Request timeout
+            http2: Use HTTP/2 for async requests
+            rate_limiter: Rate limiter (default: shared process-wide limiter)
+            retry_policy: Retry rules (default: RetryPolicy()). Its deadline
+                caps every attempt's timeout; leave it unset to size it
+                from timeout and max_attempts
+            executor: Worker threads for sync fallbacks of async calls
+            read_cache: Market-data read cache (default: shared process-wide cache)
+            book_source: Callable returning a fresh live book for a token
+                (e.g. MarketWebSocket.live_book), or None to fall back to REST
+            clock: Server clock for auth timestamps (default: shared clock)
         """
-        super().__init__(base_url=host, timeout=timeout)
+        super().__init__(
+            base_url=host, timeout=timeout, http2=http2,
+            rate_limiter=rate_limiter, retry_policy=retry_policy, executor=executor,
+            clock=clock
+        )
         self.host = host
         self.chain_id = chain_id
         self.signature_type = signature_type
         self.funder = funder
         self.api_creds = api_creds
         self.builder_creds = builder_creds
+        self.read_cache = read_cache or get_read_cache()
+        self.book_source = book_source
+
+    def _rate_limit_class(self, method: str, endpoint: str) -> str:
+        """Classify by endpoint: order posts, cancels, market data or data reads."""
+        return RateLimiter.classify_clob(method, endpoint)
 
     def _build_headers(
         self,
@@ -239,57 +529,53 @@ class ClobClient(ApiClient):
         Returns:
             Dictionary of headers
         """
-        headers = {}
+        headers: Dict[str, str] = {}
+        timestamp = str(int(self.clock.now()))
 
         # Builder HMAC authentication
         if self.builder_creds and self.builder_creds.is_configured():
-            timestamp = str(int(time.time()))
-
-            message = f"{timestamp}{method}{path}{body}"
-            signature = hmac.new(
-                self.builder_creds.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256
-            ).hexdigest()
-
-            headers.update({
-                "POLY_BUILDER_API_KEY": self.builder_creds.api_key,
-                "POLY_BUILDER_TIMESTAMP": timestamp,
-                "POLY_BUILDER_PASSPHRASE": self.builder_creds.api_passphrase,
-                "POLY_BUILDER_SIGNATURE": signature,
-            })
+            headers = self._builder_auth(self.builder_creds).headers(method, path, body, timestamp)
 
         # User API credentials (L2 authentication)
         if self.api_creds and self.api_creds.is_valid():
-            timestamp = str(int(time.time()))
+            l2_headers = self._l2_auth(self.api_creds).headers(method, path, body, timestamp)
+            if headers:
+                headers.update(l2_headers)
+            else:
+                headers = l2_headers
 
-            # Build message: timestamp + method + path + body
-            message = f"{timestamp}{method}{path}"
-            if body:
-                message += body
+        return headers
 
-            # Decode base64 secret and create HMAC signature
-            try:
-                base64_secret = base64.urlsafe_b64decode(self.api_creds.secret)
-                h = hmac.new(base64_secret, message.encode("utf-8"), hashlib.sha256)
-                signature = base64.urlsafe_b64encode(h.digest()).decode("utf-8")
-            except Exception:
-                # Fallback: use secret directly if not base64 encoded
-                signature = hmac.new(
-                    self.api_creds.secret.encode(),
-                    message.encode(),
-                    hashlib.sha256
-                ).hexdigest()
-
-            headers.update({
-                "POLY_ADDRESS": self.funder,
-                "POLY_API_KEY": self.api_creds.api_key,
-                "POLY_TIMESTAMP": timestamp,
-                "POLY_PASSPHRASE": self.api_creds.passphrase,
-                "POLY_SIGNATURE": signature,
-            })
+    def _l2_auth(self, creds: ApiCredentials) -> L2HeaderBuilder:
+        """Get the cached L2 header builder, rebuilding it if credentials changed."""
+        key = (creds.api_key, creds.secret, creds.passphrase, self.funder)
+        builder = self._l2_header_builder
+        if builder is None or builder.cache_key != key:
+            builder = self._l2_header_builder = L2HeaderBuilder(*key)
+        return builder
 
-        return headers
+    def _l1_headers(self, signer: "OrderSigner", nonce: int) -> Dict[str, str]:
+        """Build L1 (EIP-712 signed) authentication headers."""
+        timestamp = str(int(self.clock.now()))
+
+        # Sign the auth message using EIP-712
+        auth_signature = signer.sign_auth_message(timestamp=timestamp, nonce=nonce)
+
+        return {
+            "POLY_ADDRESS": signer.address,
+            "POLY_SIGNATURE": auth_signature,
+            "POLY_TIMESTAMP": timestamp,
+            "POLY_NONCE": str(nonce),
+        }
+
+    @staticmethod
+    def _parse_api_creds(response: Dict[str, Any]) -> ApiCredentials:
+        """Build ApiCredentials from an auth endpoint response."""
+        return ApiCredentials(
+            api_key=response.get("apiKey", ""),
+            secret=response.get("secret", ""),
+            passphrase=response.get("passphrase", ""),
+        )
 
     def derive_api_key(self, signer: "OrderSigner", nonce: int = 0) -> ApiCredentials:
         """
@@ -305,26 +591,15 @@ class ClobClient(ApiClient):
         Returns:
             ApiCredentials with api_key, secret, and passphrase
         """
-        timestamp = str(int(time.time()))
-
-        # Sign the auth message using EIP-712
-        auth_signature = signer.sign_auth_message(timestamp=timestamp, nonce=nonce)
-
-        # L1 headers
-        headers = {
-            "POLY_ADDRESS": signer.address,
-            "POLY_SIGNATURE": auth_signature,
-            "POLY_TIMESTAMP": timestamp,
-            "POLY_NONCE": str(nonce),
-        }
-
+        headers = self._l1_headers(signer, nonce)
         response = self._request("GET", "/auth/derive-api-key", headers=headers)
+        return self._parse_api_creds(response)
 
-        return ApiCredentials(
-            api_key=response.get("apiKey", ""),
-            secret=response.get("secret", ""),
-            passphrase=response.get("passphrase", ""),
-        )
+    async def aderive_api_key(self, signer: "OrderSigner", nonce: int = 0) -> ApiCredentials:
+        """Async variant of derive_api_key()."""
+        headers = self._l1_headers(signer, nonce)
+        response = await self._arequest("GET", "/auth/derive-api-key", headers=headers)
+        return self._parse_api_creds(response)
 
     def create_api_key(self, signer: "OrderSigner", nonce: int = 0) -> ApiCredentials:
         """
@@ -339,26 +614,15 @@ class ClobClient(ApiClient):
         Returns:
             ApiCredentials with api_key, secret, and passphrase
         """
-        timestamp = str(int(time.time()))
-
-        # Sign the auth message using EIP-712
-        auth_signature = signer.sign_auth_message(timestamp=timestamp, nonce=nonce)
-
-        # L1 headers
-        headers = {
-            "POLY_ADDRESS": signer.address,
-            "POLY_SIGNATURE": auth_signature,
-            "POLY_TIMESTAMP": timestamp,
-            "POLY_NONCE": str(nonce),
-        }
-
+        headers = self._l1_headers(signer, nonce)
         response = self._request("POST", "/auth/api-key", headers=headers)
+        return self._parse_api_creds(response)
 
-        return ApiCredentials(
-            api_key=response.get("apiKey", ""),
-            secret=response.get("secret", ""),
-            passphrase=response.get("passphrase", ""),
-        )
+    async def acreate_api_key(self, signer: "OrderSigner", nonce: int = 0) -> ApiCredentials:
+        """Async variant of create_api_key()."""
+        headers = self._l1_headers(signer, nonce)
+        response = await self._arequest("POST", "/auth/api-key", headers=headers)
+        return self._parse_api_creds(response)
 
     def create_or_derive_api_key(self, signer: "OrderSigner", nonce: int = 0) -> ApiCredentials:
         """
@@ -376,63 +640,158 @@ class ClobClient(ApiClient):
         except Exception:
             return self.derive_api_key(signer, nonce)
 
+    async def acreate_or_derive_api_key(self, signer: "OrderSigner", nonce: int = 0) -> ApiCredentials:
+        """Async variant of create_or_derive_api_key()."""
+        try:
+            return await self.acreate_api_key(signer, nonce)
+        except Exception:
+            return await self.aderive_api_key(signer, nonce)
+
     def set_api_creds(self, creds: ApiCredentials) -> None:
         """Set API credentials for authenticated requests."""
         self.api_creds = creds
 
-    def get_order_book(self, token_id: str) -> Dict[str, Any]:
+    def get_order_book(self, token_id: str, fresh: bool = False) -> Dict[str, Any]:
         """
         Get order book for a token.
 
+        Served from the live book source when it is fresh, otherwise
+        read through the shared cache (concurrent calls share one request).
+
         Args:
             token_id: Market token ID
+            fresh: Skip the book source and cache, always fetch
 
         Returns:
             Order book data
         """
-        return self._request(
-            "GET",
-            "/book",
-            params={"token_id": token_id}
+        if fresh:
+            return self._fetch_and_cache("/book", token_id)
+        book = self._live_book(token_id)
+        if book is not None:
+            return book
+        return self.read_cache.get_or_fetch(
+            "/book", (self.base_url, token_id), lambda: self._request(**self._token_read("/book", token_id))
         )
 
-    def get_market_price(self, token_id: str) -> Dict[str, Any]:
+    async def aget_order_book(self, token_id: str, fresh: bool = False) -> Dict[str, Any]:
+        """Async variant of get_order_book()."""
+        if fresh:
+            return await self._afetch_and_cache("/book", token_id)
+        book = self._live_book(token_id)
+        if book is not None:
+            return book
+        return await self.read_cache.aget_or_fetch(
+            "/book", (self.base_url, token_id), lambda: self._arequest(**self._token_read("/book", token_id))
+        )
+
+    def get_market_price(self, token_id: str, fresh: bool = False) -> Dict[str, Any]:
         """
         Get current market price for a token.
 
+        Read through the shared cache (concurrent calls share one request).
+
         Args:
             token_id: Market token ID
+            fresh: Skip the cache, always fetch
 
         Returns:
             Price data
         """
-        return self._request(
-            "GET",
-            "/price",
-            params={"token_id": token_id}
+        if fresh:
+            return self._fetch_and_cache("/price", token_id)
+        return self.read_cache.get_or_fetch(
+            "/price", (self.base_url, token_id), lambda: self._request(**self._token_read("/price", token_id))
         )
 
-    def get_open_orders(self) -> List[Dict[str, Any]]:
+    async def aget_market_price(self, token_id: str, fresh: bool = False) -> Dict[str, Any]:
+        """Async variant of get_market_price()."""
+        if fresh:
+            return await self._afetch_and_cache("/price", token_id)
+        return await self.read_cache.aget_or_fetch(
+            "/price", (self.base_url, token_id), lambda: self._arequest(**self._token_read("/price", token_id))
+        )
+
+    @staticmethod
+    def _token_read(endpoint: str, token_id: str) -> Dict[str, Any]:
+        """Build an unauthenticated per-token market-data request."""
+        return {"method": "GET", "endpoint": endpoint, "params": {"token_id": token_id}}
+
+    def _live_book(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """Get the book from the live book source, if set and fresh."""
+        if self.book_source is None:
+            return None
+        return self.book_source(token_id)
+
+    def _fetch_and_cache(self, endpoint: str, token_id: str) -> Dict[str, Any]:
+        """Fetch uncached and refresh the cache entry."""
+        result = self._request(**self._token_read(endpoint, token_id))
+        self.read_cache.set(endpoint, (self.base_url, token_id), result)
+        return result
+
+    async def _afetch_and_cache(self, endpoint: str, token_id: str) -> Dict[str, Any]:
+        """Async variant of _fetch_and_cache()."""
+        result = await self._arequest(**self._token_read(endpoint, token_id))
+        self.read_cache.set(endpoint, (self.base_url, token_id), result)
+        return result
+
+    def get_open_orders(
+        self,
+        market: Optional[str] = None,
+        asset_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get all open orders for the funder.
+        Get all open orders for the funder, following every page.
+
+        Args:
+            market: Filter by market condition ID (optional)
+            asset_id: Filter by token (optional)
 
         Returns:
             List of open orders
         """
-        endpoint = "/data/orders"
+        params = self._order_filters(market, asset_id)
+        return [order for page in self._iter_pages("/data/orders", params) for order in page]
 
-        headers = self._build_headers("GET", endpoint)
+    async def aget_open_orders(
+        self,
+        market: Optional[str] = None,
+        asset_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of get_open_orders()."""
+        return [order async for order in self.aiter_open_orders(market, asset_id)]
 
-        result = self._request(
-            "GET",
-            endpoint,
-            headers=headers
-        )
+    async def aiter_open_orders(
+        self,
+        market: Optional[str] = None,
+        asset_id: Optional[str] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream open orders page by page.
 
-        # Handle paginated response
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
+        Args:
+            market: Filter by market condition ID (optional)
+            asset_id: Filter by token (optional)
+            prefetch: Fetch the next page while the caller consumes this one
+
+        Yields:
+            Open orders
+        """
+        params = self._order_filters(market, asset_id)
+        async for page in self._aiter_pages("/data/orders", params, prefetch):
+            for order in page:
+                yield order
+
+    @staticmethod
+    def _order_filters(market: Optional[str], asset_id: Optional[str]) -> Dict[str, Any]:
+        """Build /data/orders query filters."""
+        params: Dict[str, Any] = {}
+        if market:
+            params["market"] = market
+        if asset_id:
+            params["asset_id"] = asset_id
+        return params
 
     def get_order(self, order_id: str) -> Dict[str, Any]:
         """
@@ -448,38 +807,140 @@ class ClobClient(ApiClient):
         headers = self._build_headers("GET", endpoint)
         return self._request("GET", endpoint, headers=headers)
 
+    async def aget_order(self, order_id: str) -> Dict[str, Any]:
+        """Async variant of get_order()."""
+        endpoint = f"/data/order/{order_id}"
+        headers = self._build_headers("GET", endpoint)
+        return await self._arequest("GET", endpoint, headers=headers)
+
     def get_trades(
         self,
         token_id: Optional[str] = None,
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[Dict[str, Any]]:
         """
-        Get trade history.
+        Get trade history, following pages until limit is reached.
 
         Args:
             token_id: Filter by token (optional)
-            limit: Maximum number of trades
+            limit: Maximum number of trades (None for the full history)
 
         Returns:
             List of trades
         """
-        endpoint = "/data/trades"
+        trades: List[Dict[str, Any]] = []
+        for page in self._iter_pages("/data/trades", self._trade_filters(token_id)):
+            trades.extend(page)
+            if limit is not None and len(trades) >= limit:
+                return trades[:limit]
+        return trades
+
+    async def aget_trades(
+        self,
+        token_id: Optional[str] = None,
+        limit: Optional[int] = 100
+    ) -> List[Dict[str, Any]]:
+        """Async variant of get_trades()."""
+        trades: List[Dict[str, Any]] = []
+        # No prefetch: a page past the limit would be wasted
+        async for page in self._aiter_pages("/data/trades", self._trade_filters(token_id), prefetch=False):
+            trades.extend(page)
+            if limit is not None and len(trades) >= limit:
+                return trades[:limit]
+        return trades
+
+    async def aiter_trades(
+        self,
+        token_id: Optional[str] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the full trade history page by page.
+
+        Only the current page and at most one prefetched page are held
+        in memory, so fills can be reconciled without loading them all.
+
+        Args:
+            token_id: Filter by token (optional)
+            prefetch: Fetch the next page while the caller consumes this one
+
+        Yields:
+            Trades
+        """
+        async for page in self._aiter_pages("/data/trades", self._trade_filters(token_id), prefetch):
+            for trade in page:
+                yield trade
+
+    @staticmethod
+    def _trade_filters(token_id: Optional[str]) -> Dict[str, Any]:
+        """Build /data/trades query filters."""
+        return {"asset_id": token_id} if token_id else {}
+
+    def _page_request(self, endpoint: str, params: Dict[str, Any], cursor: str) -> Dict[str, Any]:
+        """Build a signed GET request for one page."""
         headers = self._build_headers("GET", endpoint)
-        params: Dict[str, Any] = {"limit": limit}
-        if token_id:
-            params["token_id"] = token_id
+        return {
+            "method": "GET",
+            "endpoint": endpoint,
+            "headers": headers,
+            "params": {**params, "next_cursor": cursor},
+        }
 
-        result = self._request(
-            "GET",
-            endpoint,
-            headers=headers,
-            params=params
-        )
+    def _next_cursor(self, result: Any, cursor: str) -> Optional[str]:
+        """Get the cursor of the page after result, or None on the last page."""
+        if not isinstance(result, dict) or not self._data_list(result):
+            return None
+        next_cursor = result.get("next_cursor")
+        if not next_cursor or next_cursor == self.END_CURSOR or next_cursor == cursor:
+            return None
+        return next_cursor
+
+    def _iter_pages(self, endpoint: str, params: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of a cursor-paginated endpoint."""
+        cursor: Optional[str] = self.START_CURSOR
+        while cursor is not None:
+            result = self._request(**self._page_request(endpoint, params, cursor))
+            yield self._data_list(result)
+            cursor = self._next_cursor(result, cursor)
+
+    async def _aiter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        prefetch: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of a cursor-paginated endpoint.
 
-        # Handle paginated response
-        if isinstance(result, dict) and "data" in result:
-            return result.get("data", [])
-        return result if isinstance(result, list) else []
+        With prefetch, the request for page n+1 is in flight while the
+        caller handles page n.
+        """
+        cursor: Optional[str] = self.START_CURSOR
+        pending: Optional[asyncio.Task] = asyncio.ensure_future(
+            self._arequest(**self._page_request(endpoint, params, cursor))
+        )
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                cursor = self._next_cursor(result, cursor)
+                if cursor is not None and prefetch:
+                    pending = asyncio.ensure_future(
+                        self._arequest(**self._page_request(endpoint, params, cursor))
+                    )
+                yield self._data_list(result)
+                if cursor is not None and pending is None:
+                    pending = asyncio.ensure_future(
+                        self._arequest(**self._page_request(endpoint, params, cursor))
+                    )
+        finally:
+            # Caller stopped early: drop the prefetched page
+            if pending is not None:
+                if pending.done():
+                    if not pending.cancelled():
+                        pending.exception()
+                else:
+                    pending.cancel()
 
     def post_order(
         self,
@@ -496,9 +957,22 @@ class ClobClient(ApiClient):
         Returns:
             Response with order ID and status
         """
-        endpoint = "/order"
+        return self._request(**self._post_order_request(signed_order, order_type))
+
+    async def apost_order(
+        self,
+        signed_order: Dict[str, Any],
+        order_type: str = "GTC"
+    ) -> Dict[str, Any]:
+        """Async variant of post_order()."""
+        return await self._arequest(**self._post_order_request(signed_order, order_type))
 
-        # Build request body
+    def _post_order_request(self, signed_order: Dict[str, Any], order_type: str) -> Dict[str, Any]:
+        """Build the signed POST /order request."""
+        return self._signed_request("POST", "/order", self._order_body(signed_order, order_type))
+
+    def _order_body(self, signed_order: Dict[str, Any], order_type: str) -> Dict[str, Any]:
+        """Build the request body for one signed order."""
         body = {
             "order": signed_order.get("order", signed_order),
             "owner": self.funder,
@@ -509,15 +983,77 @@ class ClobClient(ApiClient):
         if "signature" in signed_order:
             body["signature"] = signed_order["signature"]
 
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
+        return body
 
-        return self._request(
-            "POST",
-            endpoint,
-            data=body,
-            headers=headers
+    def post_orders(
+        self,
+        signed_orders: List[Dict[str, Any]],
+        order_type: str = "GTC"
+    ) -> List[Dict[str, Any]]:
+        """
+        Submit signed orders through the batch endpoint.
+
+        Orders are split into chunks of MAX_BATCH_ORDERS. A chunk that
+        fails as a whole yields an error entry for each of its orders, so
+        the result always lines up with the input.
+
+        Args:
+            signed_orders: Orders with signatures
+            order_type: Order type (GTC, GTD, FOK)
+
+        Returns:
+            One response dict per order, in input order
+        """
+        results: List[Dict[str, Any]] = []
+        for chunk in self._chunks(signed_orders, self.MAX_BATCH_ORDERS):
+            try:
+                response = self._request(**self._post_orders_request(chunk, order_type))
+            except ApiError as e:
+                response = e
+            results.extend(self._batch_results(chunk, response))
+        return results
+
+    async def apost_orders(
+        self,
+        signed_orders: List[Dict[str, Any]],
+        order_type: str = "GTC"
+    ) -> List[Dict[str, Any]]:
+        """Async variant of post_orders(); chunks are submitted concurrently."""
+        chunks = self._chunks(signed_orders, self.MAX_BATCH_ORDERS)
+        responses = await asyncio.gather(
+            *(self._arequest(**self._post_orders_request(chunk, order_type)) for chunk in chunks),
+            return_exceptions=True,
         )
+        results: List[Dict[str, Any]] = []
+        for chunk, response in zip(chunks, responses):
+            results.extend(self._batch_results(chunk, response))
+        return results
+
+    def _post_orders_request(self, signed_orders: List[Dict[str, Any]], order_type: str) -> Dict[str, Any]:
+        """Build the signed POST /orders batch request."""
+        body = [self._order_body(order, order_type) for order in signed_orders]
+        return self._signed_request("POST", "/orders", body)
+
+    @staticmethod
+    def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+        """Split a list into chunks of at most size items."""
+        size = max(1, size)
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    @staticmethod
+    def _batch_results(chunk: List[Any], response: Any) -> List[Dict[str, Any]]:
+        """Line up a batch response with the orders that were sent."""
+        if isinstance(response, BaseException):
+            return [{"success": False, "errorMsg": str(response)} for _ in chunk]
+
+        entries = response if isinstance(response, list) else ApiClient._data_list(response)
+        if len(entries) != len(chunk):
+            message = f"Unexpected batch response ({len(entries)} results for {len(chunk)} orders)"
+            return [
+                entries[i] if i < len(entries) else {"success": False, "errorMsg": message}
+                for i in range(len(chunk))
+            ]
+        return entries
 
     def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """
@@ -529,17 +1065,11 @@ class ClobClient(ApiClient):
         Returns:
             Cancellation response
         """
-        endpoint = "/order"
-        body = {"orderID": order_id}
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("DELETE", endpoint, body_json)
+        return self._request(**self._signed_request("DELETE", "/order", {"orderID": order_id}))
 
-        return self._request(
-            "DELETE",
-            endpoint,
-            data=body,
-            headers=headers
-        )
+    async def acancel_order(self, order_id: str) -> Dict[str, Any]:
+        """Async variant of cancel_order()."""
+        return await self._arequest(**self._signed_request("DELETE", "/order", {"orderID": order_id}))
 
     def cancel_orders(self, order_ids: List[str]) -> Dict[str, Any]:
         """
@@ -549,18 +1079,40 @@ class ClobClient(ApiClient):
             order_ids: List of order IDs to cancel
 
         Returns:
-            Cancellation response with canceled and not_canceled lists
+            Cancellation response with canceled and not_canceled lists.
+            IDs are sent in chunks of MAX_BATCH_CANCELS; IDs from a chunk
+            that fails as a whole are reported in not_canceled.
         """
-        endpoint = "/orders"
-        body_json = json.dumps(order_ids, separators=(',', ':'))
-        headers = self._build_headers("DELETE", endpoint, body_json)
-
-        return self._request(
-            "DELETE",
-            endpoint,
-            data=order_ids,
-            headers=headers
+        chunks = self._chunks(order_ids, self.MAX_BATCH_CANCELS)
+        responses: List[Any] = []
+        for chunk in chunks:
+            try:
+                responses.append(self._request(**self._signed_request("DELETE", "/orders", chunk)))
+            except ApiError as e:
+                responses.append(e)
+        return self._merge_cancel_results(chunks, responses)
+
+    async def acancel_orders(self, order_ids: List[str]) -> Dict[str, Any]:
+        """Async variant of cancel_orders(); chunks are sent concurrently."""
+        chunks = self._chunks(order_ids, self.MAX_BATCH_CANCELS)
+        responses = await asyncio.gather(
+            *(self._arequest(**self._signed_request("DELETE", "/orders", chunk)) for chunk in chunks),
+            return_exceptions=True,
         )
+        return self._merge_cancel_results(chunks, list(responses))
+
+    @staticmethod
+    def _merge_cancel_results(chunks: List[List[str]], responses: List[Any]) -> Dict[str, Any]:
+        """Merge per-chunk cancel responses into one response."""
+        merged: Dict[str, Any] = {"canceled": [], "not_canceled": {}}
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException):
+                for order_id in chunk:
+                    merged["not_canceled"][order_id] = str(response)
+                continue
+            merged["canceled"].extend(response.get("canceled") or [])
+            merged["not_canceled"].update(response.get("not_canceled") or {})
+        return merged
 
     def cancel_all_orders(self) -> Dict[str, Any]:
         """
@@ -578,6 +1130,12 @@ class ClobClient(ApiClient):
             headers=headers
         )
 
+    async def acancel_all_orders(self) -> Dict[str, Any]:
+        """Async variant of cancel_all_orders()."""
+        endpoint = "/cancel-all"
+        headers = self._build_headers("DELETE", endpoint)
+        return await self._arequest("DELETE", endpoint, headers=headers)
+
     def cancel_market_orders(
         self,
         market: Optional[str] = None,
@@ -593,7 +1151,22 @@ class ClobClient(ApiClient):
         Returns:
             Cancellation response with canceled and not_canceled lists
         """
-        endpoint = "/cancel-market-orders"
+        return self._request(**self._cancel_market_orders_request(market, asset_id))
+
+    async def acancel_market_orders(
+        self,
+        market: Optional[str] = None,
+        asset_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of cancel_market_orders()."""
+        return await self._arequest(**self._cancel_market_orders_request(market, asset_id))
+
+    def _cancel_market_orders_request(
+        self,
+        market: Optional[str],
+        asset_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the DELETE /cancel-market-orders request."""
         body = {}
 
         if market:
@@ -601,15 +1174,7 @@ class ClobClient(ApiClient):
         if asset_id:
             body["asset_id"] = asset_id
 
-        body_json = json.dumps(body, separators=(',', ':')) if body else ""
-        headers = self._build_headers("DELETE", endpoint, body_json)
-
-        return self._request(
-            "DELETE",
-            endpoint,
-            data=body if body else None,
-            headers=headers
-        )
+        return self._signed_request("DELETE", "/cancel-market-orders", body if body else None)
 
 
 class RelayerClient(ApiClient):
@@ -633,7 +1198,10 @@ class RelayerClient(ApiClient):
         chain_id: int = 137,
         builder_creds: Optional[BuilderConfig] = None,
         tx_type: str = "SAFE",
-        timeout: int = 60
+        timeout: int = 60,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None
     ):
         """
         Initialize Relayer client.
@@ -644,12 +1212,24 @@ class RelayerClient(ApiClient):
             builder_creds: Builder credentials
             tx_type: Transaction type (SAFE or PROXY)
             timeout: Request timeout
+            http2: Use HTTP/2 for async requests
+            rate_limiter: Rate limiter (default: shared process-wide limiter)
+            retry_policy: Retry rules (default: RetryPolicy()). Its deadline
+                caps every attempt's timeout; leave it unset to size it
+                from timeout and max_attempts
         """
-        super().__init__(base_url=host, timeout=timeout)
+        super().__init__(
+            base_url=host, timeout=timeout, http2=http2,
+            rate_limiter=rate_limiter, retry_policy=retry_policy
+        )
         self.chain_id = chain_id
         self.builder_creds = builder_creds
         self.tx_type = tx_type
 
+    def _rate_limit_class(self, method: str, endpoint: str) -> str:
+        """All relayer calls share one budget."""
+        return rate_limit.RELAYER
+
     def _build_headers(
         self,
         method: str,
@@ -660,21 +1240,8 @@ class RelayerClient(ApiClient):
         if not self.builder_creds or not self.builder_creds.is_configured():
             raise AuthenticationError("Builder credentials required for relayer")
 
-        timestamp = str(int(time.time()))
-
-        message = f"{timestamp}{method}{path}{body}"
-        signature = hmac.new(
-            self.builder_creds.api_secret.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-
-        return {
-            "POLY_BUILDER_API_KEY": self.builder_creds.api_key,
-            "POLY_BUILDER_TIMESTAMP": timestamp,
-            "POLY_BUILDER_PASSPHRASE": self.builder_creds.api_passphrase,
-            "POLY_BUILDER_SIGNATURE": signature,
-        }
+        timestamp = str(int(self.clock.now()))
+        return self._builder_auth(self.builder_creds).headers(method, path, body, timestamp)
 
     def deploy_safe(self, safe_address: str) -> Dict[str, Any]:
         """
@@ -686,17 +1253,15 @@ class RelayerClient(ApiClient):
         Returns:
             Deployment transaction response
         """
-        endpoint = "/deploy"
-        body = {"safeAddress": safe_address}
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
+        return self._request(**self._deploy_safe_request(safe_address))
 
-        return self._request(
-            "POST",
-            endpoint,
-            data=body,
-            headers=headers
-        )
+    async def adeploy_safe(self, safe_address: str) -> Dict[str, Any]:
+        """Async variant of deploy_safe()."""
+        return await self._arequest(**self._deploy_safe_request(safe_address))
+
+    def _deploy_safe_request(self, safe_address: str) -> Dict[str, Any]:
+        """Build the POST /deploy request."""
+        return self._signed_request("POST", "/deploy", {"safeAddress": safe_address})
 
     def approve_usdc(
         self,
@@ -715,21 +1280,25 @@ class RelayerClient(ApiClient):
         Returns:
             Approval transaction response
         """
-        endpoint = "/approve-usdc"
+        return self._request(**self._approve_usdc_request(safe_address, spender, amount))
+
+    async def aapprove_usdc(
+        self,
+        safe_address: str,
+        spender: str,
+        amount: int
+    ) -> Dict[str, Any]:
+        """Async variant of approve_usdc()."""
+        return await self._arequest(**self._approve_usdc_request(safe_address, spender, amount))
+
+    def _approve_usdc_request(self, safe_address: str, spender: str, amount: int) -> Dict[str, Any]:
+        """Build the POST /approve-usdc request."""
         body = {
             "safeAddress": safe_address,
             "spender": spender,
             "amount": str(amount),
         }
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
-
-        return self._request(
-            "POST",
-            endpoint,
-            data=body,
-            headers=headers
-        )
+        return self._signed_request("POST", "/approve-usdc", body)
 
     def approve_token(
         self,
@@ -750,19 +1319,30 @@ class RelayerClient(ApiClient):
         Returns:
             Approval transaction response
         """
-        endpoint = "/approve-token"
+        return self._request(**self._approve_token_request(safe_address, token_id, spender, amount))
+
+    async def aapprove_token(
+        self,
+        safe_address: str,
+        token_id: str,
+        spender: str,
+        amount: int
+    ) -> Dict[str, Any]:
+        """Async variant of approve_token()."""
+        return await self._arequest(**self._approve_token_request(safe_address, token_id, spender, amount))
+
+    def _approve_token_request(
+        self,
+        safe_address: str,
+        token_id: str,
+        spender: str,
+        amount: int
+    ) -> Dict[str, Any]:
+        """Build the POST /approve-token request."""
         body = {
             "safeAddress": safe_address,
             "tokenId": token_id,
             "spender": spender,
             "amount": str(amount),
         }
-        body_json = json.dumps(body, separators=(',', ':'))
-        headers = self._build_headers("POST", endpoint, body_json)
-
-        return self._request(
-            "POST",
-            endpoint,
-            data=body,
-            headers=headers
-        )
+        return self._signed_request("POST", "/approve-token", body)
@@ -0,0 +1,246 @@
+"""
+Clock Module - Server Clock Offset Estimation
+
+Estimates the offset between the local clock and the CLOB server
+clock so auth timestamps and exchange-latency math use server time:
+- Samples GET /time with NTP-style send/receive timestamps
+- Drops high-RTT samples (asymmetric delay makes them unreliable)
+- Intersects the per-sample offset bounds, which also handles the
+  endpoint's whole-second resolution
+- Periodic re-sync to follow drift
+
+One process-wide clock is shared by all clients (see get_clock()).
+Until the first sync, now() is the local clock.
+
+Example:
+    from src.clock import get_clock
+
+    clock = get_clock()
+    await clock.async_sync()
+    print(clock.offset, clock.rtt)
+    timestamp = str(int(clock.now()))
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from typing import List, Optional, Tuple
+
+from . import codec
+from .http import AsyncSessionMixin, ThreadLocalSessionMixin
+from .rate_limit import MARKET_DATA, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# (t0 local send, server time, t1 local receive, server resolution)
+Sample = Tuple[float, float, float, float]
+
+
+def estimate_offset(samples: List[Sample], rtt_factor: float = 2.0) -> Optional[Tuple[float, float]]:
+    """
+    Estimate the server clock offset from timing samples.
+
+    Each sample bounds the offset (server - local) to
+    [server - t1, server + resolution - t0]. Samples whose RTT exceeds
+    rtt_factor times the minimum are discarded; the remaining bounds
+    are intersected and the midpoint taken. If they don't overlap
+    (clock stepped mid-sync), the median sample midpoint is used.
+
+    Args:
+        samples: (t0, server, t1, resolution) tuples
+        rtt_factor: Keep samples with RTT <= rtt_factor * min RTT
+
+    Returns:
+        (offset seconds, min RTT seconds), or None without samples
+    """
+    if not samples:
+        return None
+    min_rtt = min(t1 - t0 for t0, _, t1, _ in samples)
+    kept = [s for s in samples if s[2] - s[0] <= max(min_rtt * rtt_factor, min_rtt + 0.001)]
+
+    low = max(server - t1 for t0, server, t1, _ in kept)
+    high = min(server + resolution - t0 for t0, server, t1, resolution in kept)
+    if low <= high:
+        return (low + high) / 2, min_rtt
+
+    midpoints = [server + resolution / 2 - (t0 + t1) / 2 for t0, server, t1, resolution in kept]
+    return statistics.median(midpoints), min_rtt
+
+
+class ClockSync(AsyncSessionMixin, ThreadLocalSessionMixin):
+    """
+    Tracks the CLOB server clock offset.
+
+    offset is server minus local time in seconds; now() returns the
+    estimated server time.
+    """
+
+    def __init__(
+        self,
+        host: str = "https://clob.polymarket.com",
+        samples: int = 8,
+        sample_spacing: float = 0.13,
+        interval: float = 300.0,
+        timeout: float = 5.0,
+    ):
+        """
+        Initialize clock sync.
+
+        Args:
+            host: CLOB API host
+            samples: Requests per sync
+            sample_spacing: Seconds between requests (spreads samples
+                across the server's second boundaries)
+            interval: Seconds between periodic re-syncs
+            timeout: Request timeout in seconds
+        """
+        super().__init__()
+        self.host = host.rstrip("/")
+        self.samples = max(1, samples)
+        self.sample_spacing = sample_spacing
+        self.interval = interval
+        self.timeout = timeout
+
+        self.offset = 0.0
+        self.rtt: Optional[float] = None
+        self.last_sync: Optional[float] = None
+
+        self._task: Optional[asyncio.Task] = None
+
+    def configure(self, host: Optional[str] = None, interval: Optional[float] = None) -> None:
+        """
+        Change the sampled host or re-sync interval.
+
+        Args:
+            host: CLOB API host
+            interval: Seconds between periodic re-syncs (0 disables)
+        """
+        if host is not None:
+            self.host = host.rstrip("/")
+        if interval is not None:
+            self.interval = interval
+
+    @property
+    def synced(self) -> bool:
+        """Check if at least one sync succeeded."""
+        return self.last_sync is not None
+
+    def now(self) -> float:
+        """Estimated server time as a Unix timestamp."""
+        return time.time() + self.offset
+
+    @staticmethod
+    def _parse_time(content: bytes) -> Tuple[float, float]:
+        """Parse a /time body into (server time, resolution)."""
+        value = codec.loads(content)
+        if isinstance(value, int):
+            return float(value), 1.0
+        return float(value), 0.0
+
+    def _apply(self, samples: List[Sample]) -> bool:
+        """Update the offset from collected samples."""
+        estimate = estimate_offset(samples)
+        if estimate is None:
+            logger.warning("Clock sync failed: no samples")
+            return False
+        previous = self.offset if self.synced else None
+        self.offset, self.rtt = estimate
+        self.last_sync = time.monotonic()
+        if previous is None or abs(self.offset - previous) > 0.5:
+            logger.info(f"Server clock offset {self.offset * 1000:+.1f}ms (rtt {self.rtt * 1000:.1f}ms)")
+        return True
+
+    def sync(self) -> bool:
+        """
+        Sample the server clock and update the offset (blocking).
+
+        Returns:
+            True if the offset was updated
+        """
+        samples: List[Sample] = []
+        limiter = get_rate_limiter()
+        for i in range(self.samples):
+            if i:
+                time.sleep(self.sample_spacing)
+            limiter.acquire(MARKET_DATA)
+            try:
+                t0 = time.time()
+                response = self.session.get(f"{self.host}/time", timeout=self.timeout)
+                t1 = time.time()
+                response.raise_for_status()
+                server, resolution = self._parse_time(response.content)
+            except Exception as e:
+                logger.debug(f"Clock sample failed: {e}")
+                continue
+            samples.append((t0, server, t1, resolution))
+        return self._apply(samples)
+
+    async def async_sync(self) -> bool:
+        """Async variant of sync()."""
+        if not self.async_available:
+            return await asyncio.to_thread(self.sync)
+
+        samples: List[Sample] = []
+        limiter = get_rate_limiter()
+        session = self._get_async_session()
+        for i in range(self.samples):
+            if i:
+                await asyncio.sleep(self.sample_spacing)
+            await limiter.acquire_async(MARKET_DATA)
+            try:
+                t0 = time.time()
+                response = await session.get(f"{self.host}/time", timeout=self.timeout)
+                t1 = time.time()
+                response.raise_for_status()
+                server, resolution = self._parse_time(response.content)
+            except Exception as e:
+                logger.debug(f"Clock sample failed: {e}")
+                continue
+            samples.append((t0, server, t1, resolution))
+        return self._apply(samples)
+
+    async def run(self) -> None:
+        """Re-sync every interval until cancelled (syncs first if needed)."""
+        if not self.synced:
+            await self.async_sync()
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.async_sync()
+            except Exception as e:
+                logger.warning(f"Clock sync failed: {e}")
+
+    def start(self) -> bool:
+        """
+        Start periodic re-sync if not already running.
+
+        Several components share one clock; only the caller that gets
+        True should call stop().
+
+        Returns:
+            True if this call started the task
+        """
+        if self.interval <= 0 or (self._task is not None and not self._task.done()):
+            return False
+        self._task = asyncio.create_task(self.run())
+        return True
+
+    async def stop(self) -> None:
+        """Stop periodic re-sync and close connections."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.aclose()
+
+
+_shared_clock = ClockSync()
+
+
+def get_clock() -> ClockSync:
+    """Get the process-wide server clock."""
+    return _shared_clock
@@ -0,0 +1,115 @@
+"""
+Codec Module - JSON Encoding for Hot Paths
+
+Picks the fastest available JSON backend once at import time:
+- orjson (preferred)
+- msgspec
+- stdlib json (fallback, always available)
+
+WebSocket frames and REST responses are decoded through loads(), and
+signed request bodies are encoded through dumps() in compact form.
+
+When msgspec is installed, typed_decoder() additionally decodes JSON
+straight into msgspec Structs or dataclasses, skipping the intermediate
+dicts (used for the hot market-channel events).
+
+Example:
+    from src import codec
+
+    data = codec.loads(raw_frame)
+    body = codec.dumps({"orderID": order_id})
+
+    decode = codec.typed_decoder(List[Level])  # None without msgspec
+"""
+
+import json
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+BACKEND = "json"
+
+loads: Callable[[Union[str, bytes]], Any]
+dumps: Callable[[Any], str]
+DecodeError: Tuple[Type[Exception], ...]
+
+try:
+    import orjson
+
+    BACKEND = "orjson"
+    loads = orjson.loads
+    DecodeError = (orjson.JSONDecodeError,)
+
+    def dumps(obj: Any) -> str:
+        """Serialize to compact JSON text."""
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    if MSGSPEC_AVAILABLE:
+        BACKEND = "msgspec"
+        _decoder = msgspec.json.Decoder()
+        _encoder = msgspec.json.Encoder()
+        DecodeError = (msgspec.DecodeError,)
+
+        def loads(data: Union[str, bytes]) -> Any:
+            """Parse JSON text or bytes."""
+            return _decoder.decode(data)
+
+        def dumps(obj: Any) -> str:
+            """Serialize to compact JSON text."""
+            return _encoder.encode(obj).decode("utf-8")
+
+    else:
+        loads = json.loads
+        DecodeError = (json.JSONDecodeError,)
+
+        def dumps(obj: Any) -> str:
+            """Serialize to compact JSON text."""
+            return json.dumps(obj, separators=(",", ":"))
+
+
+def typed_decoder(type_: Any) -> Optional[Callable[[Union[str, bytes]], Any]]:
+    """
+    Build a decoder that parses JSON straight into a type.
+
+    Numbers sent as strings (prices, sizes, timestamps) are converted
+    to the annotated int/float types.
+
+    Args:
+        type_: Target type (msgspec Struct, dataclass, or unions/lists of them)
+
+    Returns:
+        decode(data) function raising TypedDecodeError when the data
+        doesn't match type_, or None if msgspec isn't installed
+    """
+    if not MSGSPEC_AVAILABLE:
+        return None
+    return msgspec.json.Decoder(type_, strict=False).decode
+
+
+# Raised by typed decoders for malformed JSON or data not matching the type
+TypedDecodeError: Tuple[Type[Exception], ...] = (msgspec.DecodeError,) if MSGSPEC_AVAILABLE else ()
+
+
+def decode_frames(message: Union[str, bytes]) -> list:
+    """
+    Decode a WebSocket frame into a list of event dicts.
+
+    The market channel sends either a single event object or an
+    array of events; both are normalized to a list.
+
+    Args:
+        message: Raw frame payload
+
+    Returns:
+        List of event dictionaries
+    """
+    data = loads(message)
+    if isinstance(data, list):
+        return data
+    return [data]
@@ -108,6 +108,10 @@ class ClobConfig:
     host: str = "https://clob.polymarket.com"
     chain_id: int = 137
     signature_type: int = 2  # Gnosis Safe
+    http2: bool = False  # HTTP/2 for async requests (needs httpx[http2])
+    warm_connections: int = 4  # Connections kept warm for order requests
+    keepalive_interval: float = 15.0  # Seconds between keep-alive probes (0 disables)
+    clock_sync_interval: float = 300.0  # Seconds between server clock re-syncs (0 disables)
 
     def is_valid(self) -> bool:
         """Validate CLOB configuration."""
@@ -211,6 +215,10 @@ class Config:
                 host=clob_data.get("host", config.clob.host),
                 chain_id=clob_data.get("chain_id", config.clob.chain_id),
                 signature_type=clob_data.get("signature_type", config.clob.signature_type),
+                http2=bool(clob_data.get("http2", config.clob.http2)),
+                warm_connections=int(clob_data.get("warm_connections", config.clob.warm_connections)),
+                keepalive_interval=float(clob_data.get("keepalive_interval", config.clob.keepalive_interval)),
+                clock_sync_interval=float(clob_data.get("clock_sync_interval", config.clob.clock_sync_interval)),
             )
 
         # Relayer config
@@ -265,6 +273,7 @@ class Config:
             BUILDER_API_PASSPHRASE: Builder Program passphrase
             CLOB_HOST: CLOB API host
             CHAIN_ID: Chain ID (default: 137)
+            CLOB_HTTP2: Use HTTP/2 for async CLOB requests
             DATA_DIR: Data directory for credentials
             LOG_LEVEL: Logging level
 
@@ -303,6 +312,10 @@ class Config:
             )
         elif chain_id != 137:
             config.clob.chain_id = chain_id
+        config.clob.http2 = get_env_bool("CLOB_HTTP2", config.clob.http2)
+        config.clob.warm_connections = get_env_int("CLOB_WARM_CONNECTIONS", config.clob.warm_connections)
+        config.clob.keepalive_interval = get_env_float("CLOB_KEEPALIVE_INTERVAL", config.clob.keepalive_interval)
+        config.clob.clock_sync_interval = get_env_float("CLOB_CLOCK_SYNC_INTERVAL", config.clob.clock_sync_interval)
 
         # Other settings
         data_dir = get_env("DATA_DIR")
@@ -10,16 +10,21 @@ Example:
     client = GammaClient()
     market = client.get_current_15m_market("ETH")
     print(market["slug"], market["clobTokenIds"])
+
+    # Or without blocking the event loop
+    market = await client.aget_current_15m_market("ETH")
 """
 
-import json
+import asyncio
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 
-from .http import ThreadLocalSessionMixin
+from . import codec
+from .http import AsyncSessionMixin, ThreadLocalSessionMixin
+from .rate_limit import GAMMA, RateLimiter, get_rate_limiter
 
 
-class GammaClient(ThreadLocalSessionMixin):
+class GammaClient(AsyncSessionMixin, ThreadLocalSessionMixin):
     """
     Client for Polymarket's Gamma API.
 
@@ -36,17 +41,24 @@ class GammaClient(ThreadLocalSessionMixin):
         "XRP": "xrp-updown-15m",
     }
 
-    def __init__(self, host: str = DEFAULT_HOST, timeout: int = 10):
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        timeout: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """
         Initialize Gamma client.
 
         Args:
             host: Gamma API host URL
             timeout: Request timeout in seconds
+            rate_limiter: Rate limiter (default: shared process-wide limiter)
         """
         super().__init__()
         self.host = host.rstrip("/")
         self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_rate_limiter()
 
     def get_market_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
         """
@@ -61,23 +73,34 @@ class GammaClient(ThreadLocalSessionMixin):
         url = f"{self.host}/markets/slug/{slug}"
 
         try:
+            self.rate_limiter.acquire(GAMMA)
             response = self.session.get(url, timeout=self.timeout)
+            self.rate_limiter.on_response(GAMMA, response.status_code, response.headers.get("Retry-After"))
             if response.status_code == 200:
-                return response.json()
+                return codec.loads(response.content)
             return None
         except Exception:
             return None
 
-    def get_current_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
-        """
-        Get the current active 15-minute market for a coin.
+    async def aget_market_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_market_by_slug()."""
+        if not self.async_available:
+            return await asyncio.to_thread(self.get_market_by_slug, slug)
 
-        Args:
-            coin: Coin symbol (BTC, ETH, SOL, XRP)
+        url = f"{self.host}/markets/slug/{slug}"
 
-        Returns:
-            Market data for the current 15-minute window, or None
-        """
+        try:
+            await self.rate_limiter.acquire_async(GAMMA)
+            response = await self._get_async_session().get(url, timeout=self.timeout)
+            self.rate_limiter.on_response(GAMMA, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code == 200:
+                return codec.loads(response.content)
+            return None
+        except Exception:
+            return None
+
+    def _current_window_slugs(self, coin: str) -> List[str]:
+        """Candidate slugs for the current market, in preference order."""
         coin = coin.upper()
         if coin not in self.COIN_SLUGS:
             raise ValueError(f"Unsupported coin: {coin}. Use: {list(self.COIN_SLUGS.keys())}")
@@ -92,41 +115,49 @@ class GammaClient(ThreadLocalSessionMixin):
         current_window = now.replace(minute=minute, second=0, microsecond=0)
         current_ts = int(current_window.timestamp())
 
-        # Try current window
-        slug = f"{prefix}-{current_ts}"
-        market = self.get_market_by_slug(slug)
+        return [
+            # Current window
+            f"{prefix}-{current_ts}",
+            # Next window (in case current just ended)
+            f"{prefix}-{current_ts + 900}",
+            # Previous window (might still be active)
+            f"{prefix}-{current_ts - 900}",
+        ]
 
-        if market and market.get("acceptingOrders"):
-            return market
-
-        # Try next window (in case current just ended)
-        next_ts = current_ts + 900  # 15 minutes
-        slug = f"{prefix}-{next_ts}"
-        market = self.get_market_by_slug(slug)
+    def get_current_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current active 15-minute market for a coin.
 
-        if market and market.get("acceptingOrders"):
-            return market
+        Args:
+            coin: Coin symbol (BTC, ETH, SOL, XRP)
 
-        # Try previous window (might still be active)
-        prev_ts = current_ts - 900
-        slug = f"{prefix}-{prev_ts}"
-        market = self.get_market_by_slug(slug)
+        Returns:
+            Market data for the current 15-minute window, or None
+        """
+        for slug in self._current_window_slugs(coin):
+            market = self.get_market_by_slug(slug)
 
-        if market and market.get("acceptingOrders"):
-            return market
+            if market and market.get("acceptingOrders"):
+                return market
 
         return None
 
-    def get_next_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
+    async def aget_current_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
         """
-        Get the next upcoming 15-minute market for a coin.
-
-        Args:
-            coin: Coin symbol (BTC, ETH, SOL, XRP)
+        Async variant of get_current_15m_market().
 
-        Returns:
-            Market data for the next 15-minute window, or None
+        Looks up all candidate windows concurrently and returns the
+        first accepting market in the same preference order.
         """
+        slugs = self._current_window_slugs(coin)
+        markets = await asyncio.gather(*(self.aget_market_by_slug(slug) for slug in slugs))
+        for market in markets:
+            if market and market.get("acceptingOrders"):
+                return market
+        return None
+
+    def _next_window_slug(self, coin: str) -> str:
+        """Slug of the next 15-minute window."""
         coin = coin.upper()
         if coin not in self.COIN_SLUGS:
             raise ValueError(f"Unsupported coin: {coin}")
@@ -134,17 +165,27 @@ class GammaClient(ThreadLocalSessionMixin):
         prefix = self.COIN_SLUGS[coin]
         now = datetime.now(timezone.utc)
 
-        # Calculate next 15-minute window
-        minute = ((now.minute // 15) + 1) * 15
-        if minute >= 60:
-            next_window = now.replace(hour=now.hour + 1, minute=0, second=0, microsecond=0)
-        else:
-            next_window = now.replace(minute=minute, second=0, microsecond=0)
+        # Calculate next 15-minute window (timestamp math handles day rollover)
+        minute = (now.minute // 15) * 15
+        current_window = now.replace(minute=minute, second=0, microsecond=0)
+        next_ts = int(current_window.timestamp()) + 900
+        return f"{prefix}-{next_ts}"
+
+    def get_next_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the next upcoming 15-minute market for a coin.
+
+        Args:
+            coin: Coin symbol (BTC, ETH, SOL, XRP)
 
-        next_ts = int(next_window.timestamp())
-        slug = f"{prefix}-{next_ts}"
+        Returns:
+            Market data for the next 15-minute window, or None
+        """
+        return self.get_market_by_slug(self._next_window_slug(coin))
 
-        return self.get_market_by_slug(slug)
+    async def aget_next_15m_market(self, coin: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_next_15m_market()."""
+        return await self.aget_market_by_slug(self._next_window_slug(coin))
 
     def parse_token_ids(self, market: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -186,7 +227,7 @@ class GammaClient(ThreadLocalSessionMixin):
     def _parse_json_field(value: Any) -> List[Any]:
         """Parse a field that may be a JSON string or a list."""
         if isinstance(value, str):
-            return json.loads(value)
+            return codec.loads(value)
         return value
 
     @staticmethod
@@ -215,7 +256,41 @@ class GammaClient(ThreadLocalSessionMixin):
         market = self.get_current_15m_market(coin)
         if not market:
             return None
+        return self._build_market_info(market)
+
+    async def aget_market_info(self, coin: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_market_info()."""
+        market = await self.aget_current_15m_market(coin)
+        if not market:
+            return None
+        return self._build_market_info(market)
+
+    def get_next_market_info(self, coin: str) -> Optional[Dict[str, Any]]:
+        """
+        Get market info for the next 15-minute market.
+
+        Used to subscribe to the upcoming window before it opens.
+
+        Args:
+            coin: Coin symbol
+
+        Returns:
+            Dictionary with market info (same shape as get_market_info)
+        """
+        market = self.get_next_15m_market(coin)
+        if not market:
+            return None
+        return self._build_market_info(market)
+
+    async def aget_next_market_info(self, coin: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_next_market_info()."""
+        market = await self.aget_next_15m_market(coin)
+        if not market:
+            return None
+        return self._build_market_info(market)
 
+    def _build_market_info(self, market: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the market info dictionary from raw market data."""
         token_ids = self.parse_token_ids(market)
         prices = self.parse_prices(market)
 
@@ -1,13 +1,52 @@
 """
 HTTP Utilities - Shared HTTP session helpers.
 
-Provides a thread-local requests.Session mixin to avoid cross-thread reuse.
+Provides a thread-local requests.Session mixin to avoid cross-thread reuse,
+and an asyncio session mixin giving each client instance its own
+httpx.AsyncClient keep-alive pool (optional HTTP/2). Both transports open sockets with
+TCP_NODELAY and SO_KEEPALIVE.
 """
 
+import asyncio
+import logging
+import socket
 import threading
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+def _load_httpx():
+    """Resolve the optional httpx module."""
+    try:
+        import httpx
+        return httpx
+    except ImportError:
+        return None
+
+
+httpx = _load_httpx()
+
+# True when native asyncio HTTP is available
+ASYNC_HTTP_AVAILABLE = httpx is not None
+
+# Applied to every new connection: no Nagle delay on small order
+# requests, and kernel keep-alive so idle pooled sockets stay open
+SOCKET_OPTIONS: List[Tuple[int, int, int]] = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter that opens connections with SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
 
 
 class ThreadLocalSessionMixin:
@@ -26,6 +65,9 @@ class ThreadLocalSessionMixin:
         session = getattr(self._session_local, "session", None)
         if session is None:
             session = requests.Session()
+            adapter = SocketOptionsAdapter()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
             self._session_local.session = session
         return session
 
@@ -33,3 +75,68 @@ class ThreadLocalSessionMixin:
     def session(self) -> requests.Session:
         """Expose the thread-local session for internal use."""
         return self._get_session()
+
+
+class AsyncSessionMixin:
+    """
+    Mixin providing one httpx.AsyncClient per client instance and event loop.
+
+    All coroutines using the same client instance on a loop share its
+    keep-alive pool, so concurrent requests reuse warm TLS connections
+    (or multiplex over one HTTP/2 connection) instead of opening one
+    pool per thread. Separate client instances keep separate pools.
+    Set http2 / max_connections before the first request.
+    """
+
+    http2: bool = False
+    max_connections: int = 100
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._async_session: Optional[Any] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        super().__init__(*args, **kwargs)
+
+    @property
+    def async_available(self) -> bool:
+        """Check if native asyncio HTTP is available (httpx installed)."""
+        return ASYNC_HTTP_AVAILABLE
+
+    def _create_async_session(self) -> Any:
+        """Create this instance's AsyncClient."""
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=60.0,
+        )
+        http2 = self.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+                http2 = False
+        try:
+            transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, socket_options=SOCKET_OPTIONS)
+        except TypeError:
+            # httpx < 0.24 has no socket_options; asyncio still sets TCP_NODELAY
+            transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        return httpx.AsyncClient(transport=transport)
+
+    def _get_async_session(self) -> Any:
+        """Get the AsyncClient for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        session = self._async_session
+        if session is None or session.is_closed or self._async_loop is not loop:
+            # Connections are bound to the loop that opened them
+            session = self._create_async_session()
+            self._async_session = session
+            self._async_loop = loop
+        return session
+
+    async def aclose(self) -> None:
+        """Close this instance's AsyncClient and its connections."""
+        session = self._async_session
+        self._async_session = None
+        self._async_loop = None
+        if session is not None and not session.is_closed:
+            await session.aclose()
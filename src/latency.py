@@ -0,0 +1,370 @@
+"""
+Latency Module - Low-overhead Latency Histograms
+
+HDR-style log-linear histograms for always-on latency tracking:
+- Constant-time record() with ~1.6% relative precision
+- Percentiles (p50/p99/p999), min, max and mean
+- Histograms keyed by stage, event type and asset
+- Periodic report logging
+
+MarketWebSocket records three stages for every message:
+- exchange_to_receive: exchange timestamp to local receive (network + clock offset)
+- receive_to_decoded: local receive to frame decoded and books updated
+- receive_to_callback: local receive to user callback completed
+
+Example:
+    from src.latency import LatencyRecorder
+    from src.websocket_client import MarketWebSocket
+
+    latency = LatencyRecorder(dump_interval=60.0)
+    ws = MarketWebSocket(latency=latency)
+    ...
+    print(latency.percentiles("receive_to_callback", "book"))
+    print(latency.format_report())
+"""
+
+import asyncio
+import logging
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Stages recorded by MarketWebSocket
+EXCHANGE_TO_RECEIVE = "exchange_to_receive"
+RECEIVE_TO_DECODED = "receive_to_decoded"
+RECEIVE_TO_CALLBACK = "receive_to_callback"
+
+DEFAULT_PERCENTILES = (50.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of non-negative integer values (microseconds).
+
+    Values below 2**sub_bucket_bits are counted exactly; above that each
+    power-of-two range is split into 2**(sub_bucket_bits - 1) linear
+    buckets, so the relative error is bounded by 2**-(sub_bucket_bits - 1).
+    Buckets are allocated lazily up to the largest value seen.
+    """
+
+    __slots__ = (
+        "sub_bucket_bits", "_sub_count", "_half", "_counts",
+        "count", "total", "min", "max", "negative",
+    )
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        """
+        Initialize histogram.
+
+        Args:
+            sub_bucket_bits: Precision bits (7 gives ~1.6% relative error)
+        """
+        if sub_bucket_bits < 2:
+            raise ValueError("sub_bucket_bits must be at least 2")
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._half = self._sub_count >> 1
+        self._counts = array("Q")
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self.negative = 0
+
+    def _index(self, value: int) -> int:
+        """Map a value to its bucket index."""
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self._sub_count + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _bucket_bounds(self, index: int) -> Tuple[int, int]:
+        """Get the (lowest, highest) value counted in a bucket."""
+        if index < self._sub_count:
+            return index, index
+        offset = index - self._sub_count
+        shift = offset // self._half + 1
+        top = offset % self._half + self._half
+        return top << shift, ((top + 1) << shift) - 1
+
+    def record(self, value: float) -> None:
+        """
+        Record a value.
+
+        Negative values (e.g. clock offset on cross-host latencies) are
+        counted in `negative` and recorded as zero.
+
+        Args:
+            value: Latency in microseconds
+        """
+        value = int(value)
+        if value < 0:
+            self.negative += 1
+            value = 0
+
+        index = self._index(value)
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        """Mean recorded value."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get the value at a percentile.
+
+        Args:
+            percentile: Percentile in [0, 100]
+
+        Returns:
+            Highest value equivalent to the percentile's bucket, capped
+            at the recorded maximum (0 when empty)
+        """
+        if not self.count:
+            return 0.0
+        target = min(max(1, math.ceil(percentile / 100.0 * self.count)), self.count)
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= target:
+                return float(min(self._bucket_bounds(index)[1], self.max))
+        return float(self.max)
+
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Get several percentiles keyed like "p50", "p99", "p99.9"."""
+        return {f"p{p:g}": self.percentile(p) for p in percentiles}
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts into this one."""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        if not other.count:
+            return
+        counts = self._counts
+        if len(other._counts) > len(counts):
+            counts.extend([0] * (len(other._counts) - len(counts)))
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                counts[index] += bucket_count
+
+        if self.count == 0 or other.min < self.min:
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+        self.negative += other.negative
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        self._counts = array("Q")
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self.negative = 0
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Get count, min, mean, percentiles and max."""
+        result: Dict[str, float] = {
+            "count": self.count,
+            "min": float(self.min),
+            "mean": self.mean,
+        }
+        result.update(self.percentiles(percentiles))
+        result["max"] = float(self.max)
+        if self.negative:
+            result["negative"] = self.negative
+        return result
+
+
+# (stage, event_type, asset_id)
+HistogramKey = Tuple[str, str, str]
+
+
+class LatencyRecorder:
+    """
+    Collection of latency histograms keyed by stage, event type and asset.
+
+    All values are in microseconds. Asset-level histograms can be
+    disabled with per_asset=False to bound memory on very wide
+    subscriptions; queries then aggregate over the "" asset key.
+    """
+
+    def __init__(
+        self,
+        per_asset: bool = True,
+        sub_bucket_bits: int = 7,
+        dump_interval: float = 0.0,
+    ):
+        """
+        Initialize latency recorder.
+
+        Args:
+            per_asset: Keep a histogram per asset (else per event type only)
+            sub_bucket_bits: Histogram precision bits
+            dump_interval: Seconds between logged reports while a client
+                is running (0 disables)
+        """
+        self.per_asset = per_asset
+        self.sub_bucket_bits = sub_bucket_bits
+        self.dump_interval = dump_interval
+        self._histograms: Dict[HistogramKey, LatencyHistogram] = {}
+        self._dump_task: Optional[asyncio.Task] = None
+
+    def record(self, stage: str, event_type: str, asset_id: str, value_us: float) -> None:
+        """
+        Record one latency sample.
+
+        Args:
+            stage: Measurement stage (e.g. EXCHANGE_TO_RECEIVE)
+            event_type: Message event type (book, price_change, ...)
+            asset_id: Asset (or market) the message relates to
+            value_us: Latency in microseconds
+        """
+        key = (stage, event_type, asset_id if self.per_asset else "")
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram(self.sub_bucket_bits)
+        histogram.record(value_us)
+
+    @property
+    def keys(self) -> List[HistogramKey]:
+        """Get all (stage, event_type, asset_id) keys recorded so far."""
+        return list(self._histograms)
+
+    def histogram(
+        self,
+        stage: str,
+        event_type: Optional[str] = None,
+        asset_id: Optional[str] = None,
+    ) -> LatencyHistogram:
+        """
+        Get a histogram, merging across event types/assets left as None.
+
+        Args:
+            stage: Measurement stage
+            event_type: Event type filter (None = all)
+            asset_id: Asset filter (None = all)
+
+        Returns:
+            A new histogram holding the matching samples
+        """
+        merged = LatencyHistogram(self.sub_bucket_bits)
+        for (key_stage, key_event, key_asset), histogram in self._histograms.items():
+            if key_stage != stage:
+                continue
+            if event_type is not None and key_event != event_type:
+                continue
+            if asset_id is not None and key_asset != asset_id:
+                continue
+            merged.merge(histogram)
+        return merged
+
+    def percentiles(
+        self,
+        stage: str,
+        event_type: Optional[str] = None,
+        asset_id: Optional[str] = None,
+        percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+    ) -> Dict[str, float]:
+        """Get p50/p99/p999 (by default) in microseconds for a selection."""
+        return self.histogram(stage, event_type, asset_id).percentiles(percentiles)
+
+    def snapshot(self, by_asset: bool = False) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Get summaries grouped by stage, then event type (or event type/asset).
+
+        Args:
+            by_asset: Report each asset separately instead of merging
+
+        Returns:
+            {stage: {label: summary}} where label is the event type, or
+            "event_type/asset_id" when by_asset is set
+        """
+        groups: Dict[Tuple[str, str], LatencyHistogram] = {}
+        for (stage, event_type, asset_id), histogram in self._histograms.items():
+            label = f"{event_type}/{asset_id}" if by_asset and asset_id else event_type
+            merged = groups.get((stage, label))
+            if merged is None:
+                merged = groups[(stage, label)] = LatencyHistogram(self.sub_bucket_bits)
+            merged.merge(histogram)
+
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (stage, label), histogram in sorted(groups.items()):
+            result.setdefault(stage, {})[label] = histogram.summary()
+        return result
+
+    def format_report(self, by_asset: bool = False) -> str:
+        """Format a snapshot as a text table (values in milliseconds)."""
+        lines = [
+            f"{'stage':<20} {'event':<18} {'count':>8} {'p50 ms':>9} {'p99 ms':>9} {'p99.9 ms':>9} {'max ms':>9}"
+        ]
+        for stage, groups in self.snapshot(by_asset).items():
+            for label, summary in groups.items():
+                lines.append(
+                    f"{stage:<20} {label[:18]:<18} {int(summary['count']):>8} "
+                    f"{summary['p50'] / 1000:>9.2f} {summary['p99'] / 1000:>9.2f} "
+                    f"{summary['p99.9'] / 1000:>9.2f} {summary['max'] / 1000:>9.2f}"
+                )
+        return "\n".join(lines)
+
+    def dump(self, by_asset: bool = False) -> None:
+        """Log the current report."""
+        if self._histograms:
+            logger.info(f"Latency report:\n{self.format_report(by_asset)}")
+
+    def reset(self) -> None:
+        """Drop all histograms."""
+        self._histograms.clear()
+
+    async def run_periodic_dump(self, interval: Optional[float] = None, reset: bool = False) -> None:
+        """
+        Log a report every interval seconds until cancelled.
+
+        Args:
+            interval: Seconds between reports (default: dump_interval)
+            reset: Clear histograms after each report
+        """
+        interval = interval or self.dump_interval
+        if interval <= 0:
+            return
+        while True:
+            await asyncio.sleep(interval)
+            self.dump()
+            if reset:
+                self.reset()
+
+    def start_periodic_dump(self) -> bool:
+        """
+        Start the periodic report task if configured and not running.
+
+        Several clients can share one recorder; only the caller that
+        gets True should call stop_periodic_dump().
+
+        Returns:
+            True if this call started the task
+        """
+        if self.dump_interval <= 0 or (self._dump_task is not None and not self._dump_task.done()):
+            return False
+        self._dump_task = asyncio.create_task(self.run_periodic_dump())
+        return True
+
+    def stop_periodic_dump(self) -> None:
+        """Stop the periodic report task."""
+        if self._dump_task is not None:
+            self._dump_task.cancel()
+            self._dump_task = None
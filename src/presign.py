@@ -0,0 +1,304 @@
+"""
+Presign Module - Pre-signed Order Ladders
+
+Signs likely orders ahead of time so a signal only has to send them:
+- For each live token, one order per side, tick and amount in a band
+  around the current price
+- Refreshed in the background when the price leaves the band, when a
+  rung is used, when the exchange nonce changes, or when invalidated
+- take() hands out a ready signed payload, or None so the caller
+  falls back to signing on the spot
+
+Each pre-signed order is used at most once.
+
+Example:
+    from src.presign import OrderLadder
+
+    ladder = OrderLadder(bot, price_source=mid_price_of, amounts=(5.0,))
+    ladder.set_tokens([up_token, down_token])
+    ladder.start()
+
+    presigned = ladder.take(up_token, "BUY", 0.47, 5.0)
+    if presigned:
+        result = await bot.place_signed_order(presigned.signed)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .allocator import get_allocator
+from .signer import Order
+
+if TYPE_CHECKING:
+    from .bot import TradingBot
+
+logger = logging.getLogger(__name__)
+
+# Current price for a token, or None if unknown
+PriceSource = Callable[[str], Optional[float]]
+
+# (side, price in ticks, amount)
+RungKey = Tuple[str, int, float]
+
+
+@dataclass
+class PresignedOrder:
+    """A signed order waiting to be sent."""
+
+    order: Order
+    signed: Dict[str, Any]
+    signed_at: float
+
+
+class OrderLadder:
+    """
+    Keeps a band of pre-signed orders around each token's price.
+
+    Amounts are share sizes, or USDC notionals converted to size at each
+    rung's price when notional=True.
+    """
+
+    def __init__(
+        self,
+        bot: "TradingBot",
+        price_source: PriceSource,
+        amounts: Sequence[float] = (5.0,),
+        notional: bool = True,
+        sides: Sequence[str] = ("BUY",),
+        band_ticks: int = 5,
+        tick_size: float = 0.01,
+        max_age: Optional[float] = None,
+        interval: float = 1.0,
+    ):
+        """
+        Initialize order ladder.
+
+        Args:
+            bot: Bot used to build and sign orders
+            price_source: Callable returning a token's current price
+                (e.g. its mid), or None if unknown
+            amounts: Amounts to pre-sign at every rung
+            notional: Treat amounts as USDC (size = amount / price)
+            sides: Order sides to pre-sign ('BUY', 'SELL')
+            band_ticks: Rungs above and below the current price
+            tick_size: Market tick size
+            max_age: Seconds a signed rung stays usable (None = no limit)
+            interval: Seconds between refreshes when nothing changed
+        """
+        self.bot = bot
+        self.price_source = price_source
+        self.amounts = tuple(round(amount, 6) for amount in amounts)
+        self.notional = notional
+        self.sides = tuple(side.upper() for side in sides)
+        self.band_ticks = band_ticks
+        self.tick_size = tick_size
+        self.max_age = max_age
+        self.interval = interval
+
+        self._ticks_per_unit = round(1 / tick_size)
+        self._rungs: Dict[str, Dict[RungKey, PresignedOrder]] = {}
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.signed = 0
+
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the refresh task is running."""
+        return self._task is not None and not self._task.done()
+
+    def to_ticks(self, price: float) -> int:
+        """Convert a price to whole ticks (nearest)."""
+        return round(price * self._ticks_per_unit)
+
+    def _price(self, ticks: int) -> float:
+        """Convert ticks back to a price."""
+        return round(ticks / self._ticks_per_unit, 10)
+
+    def _size(self, ticks: int, amount: float) -> float:
+        """Order size for an amount at a rung."""
+        return amount / self._price(ticks) if self.notional else amount
+
+    def set_tokens(self, token_ids: Iterable[str]) -> None:
+        """Set the tokens to keep ladders for, dropping others."""
+        tokens = set(token_ids)
+        for token_id in list(self._rungs):
+            if token_id not in tokens:
+                del self._rungs[token_id]
+        for token_id in tokens:
+            self._rungs.setdefault(token_id, {})
+        self.poke()
+
+    def invalidate(self, token_id: Optional[str] = None) -> None:
+        """
+        Discard pre-signed orders so they are signed again.
+
+        Call when previously signed orders must not be sent any more.
+        (Rungs signed with an outdated exchange nonce are dropped
+        automatically.)
+
+        Args:
+            token_id: Only this token (None = all)
+        """
+        for token, rungs in self._rungs.items():
+            if token_id is None or token == token_id:
+                rungs.clear()
+        self.poke()
+
+    def poke(self) -> None:
+        """Wake the refresh task (e.g. on a book update)."""
+        if self._wake is not None:
+            self._wake.set()
+
+    def take(self, token_id: str, side: str, price: float, amount: float) -> Optional[PresignedOrder]:
+        """
+        Take a pre-signed order, removing it from the ladder.
+
+        Args:
+            token_id: Market token ID
+            side: 'BUY' or 'SELL'
+            price: Limit price (must be on a tick)
+            amount: Amount as configured (size or USDC)
+
+        Returns:
+            PresignedOrder, or None if that rung isn't ready
+        """
+        rungs = self._rungs.get(token_id)
+        key = (side.upper(), self.to_ticks(price), round(amount, 6))
+        presigned = rungs.pop(key, None) if rungs is not None else None
+        if presigned is not None and not self._usable(presigned, time.monotonic(), get_allocator().nonce):
+            presigned = None
+
+        if presigned is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        self.poke()
+        return presigned
+
+    def _usable(self, presigned: PresignedOrder, now: float, nonce: int) -> bool:
+        """Check a rung carries the current nonce and isn't past max_age."""
+        if presigned.order.nonce != nonce:
+            return False
+        return self.max_age is None or now - presigned.signed_at <= self.max_age
+
+    def _band(self, token_id: str) -> Optional[List[RungKey]]:
+        """Rungs wanted for a token, or None if its price is unknown."""
+        price = self.price_source(token_id)
+        if not price or price <= 0:
+            return None
+        center = self.to_ticks(price)
+        low = max(1, center - self.band_ticks)
+        high = min(self._ticks_per_unit - 1, center + self.band_ticks)
+        return [
+            (side, ticks, amount)
+            for side in self.sides
+            for ticks in range(low, high + 1)
+            for amount in self.amounts
+        ]
+
+    async def refresh(self) -> int:
+        """
+        Bring every ladder in line with its token's current price.
+
+        Drops rungs outside the band, signed with an old nonce or past
+        max_age, and signs the missing ones in one batch.
+
+        Returns:
+            Number of orders signed
+        """
+        now = time.monotonic()
+        nonce = get_allocator().nonce
+        wanted: List[Tuple[str, RungKey]] = []
+        orders: List[Order] = []
+        for token_id, rungs in self._rungs.items():
+            band = self._band(token_id)
+            if band is None:
+                continue
+            keep = set(band)
+            for key in list(rungs):
+                if key not in keep or not self._usable(rungs[key], now, nonce):
+                    del rungs[key]
+            for key in band:
+                if key in rungs:
+                    continue
+                side, ticks, amount = key
+                try:
+                    orders.append(self.bot.build_order(token_id, self._price(ticks), self._size(ticks, amount), side))
+                except ValueError as e:
+                    logger.debug(f"Skipping rung {key} for {token_id[:16]}...: {e}")
+                    continue
+                wanted.append((token_id, key))
+
+        if not orders:
+            return 0
+
+        results = await self.bot.sign_orders(orders)
+        signed_at = time.monotonic()
+        signed = 0
+        errors: List[BaseException] = []
+        for (token_id, key), order, result in zip(wanted, orders, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                continue
+            rungs = self._rungs.get(token_id)
+            if rungs is not None:
+                rungs.setdefault(key, PresignedOrder(order, result, signed_at))
+                signed += 1
+        if errors:
+            logger.warning(f"Failed to pre-sign {len(errors)}/{len(orders)} orders: {errors[0]}")
+        self.signed += signed
+        return signed
+
+    async def run(self) -> None:
+        """Refresh now, then on every poke or interval, until cancelled."""
+        loop = asyncio.get_running_loop()
+        wake = self._wake = asyncio.Event()
+        while True:
+            wake.clear()
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Ladder refresh failed: {e}")
+            # A timer rather than wait_for, which can swallow a cancel
+            # that lands as the event fires
+            timer = loop.call_later(self.interval, wake.set)
+            try:
+                await wake.wait()
+            finally:
+                timer.cancel()
+
+    def start(self) -> None:
+        """Start the refresh task (no-op if running)."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the refresh task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._wake = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get ready rung count and hit/miss/signed counters."""
+        return {
+            "ready": sum(len(rungs) for rungs in self._rungs.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "signed": self.signed,
+        }
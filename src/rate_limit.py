@@ -0,0 +1,331 @@
+"""
+Rate Limit Module - Shared Token Buckets per Endpoint Class
+
+One process-wide limiter shared by every API client:
+- Token bucket per endpoint class (order posts, cancels, data reads,
+  market data, Gamma, relayer)
+- Reservations, so sync callers sleep and async callers await without
+  holding a lock
+- 429 / Retry-After adaptation: the bucket pauses for Retry-After and
+  halves its rate, then recovers additively on successful responses
+
+Default budgets follow the published per-10s limits, using the
+sustained rates so long sessions don't get throttled.
+
+Example:
+    from src.rate_limit import get_rate_limiter
+
+    limiter = get_rate_limiter()
+    limiter.configure("order_post", rate=20, burst=100)
+
+    await limiter.acquire_async("order_post")
+    ...
+    limiter.on_response("order_post", response.status_code, response.headers.get("Retry-After"))
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+# Endpoint classes
+ORDER_POST = "order_post"
+CANCEL = "cancel"
+DATA = "data"
+MARKET_DATA = "market_data"
+GAMMA = "gamma"
+RELAYER = "relayer"
+DEFAULT = "default"
+
+# (tokens per second, burst capacity)
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    ORDER_POST: (40.0, 240.0),     # 24000/10min sustained, 2400/10s burst
+    CANCEL: (40.0, 240.0),
+    DATA: (15.0, 150.0),           # /data/orders, /data/trades: 150/10s
+    MARKET_DATA: (150.0, 1500.0),  # /book, /price: 1500/10s
+    GAMMA: (30.0, 300.0),          # /markets: 300/10s
+    RELAYER: (5.0, 25.0),
+    DEFAULT: (50.0, 500.0),
+}
+
+# Paths that read market data rather than account data
+_MARKET_DATA_PATHS = ("/book", "/books", "/price", "/prices", "/midpoint", "/midpoints", "/spread", "/time")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if absent/invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with AIMD rate adaptation.
+
+    reserve() takes tokens immediately (the balance may go negative)
+    and returns how long the caller must wait before sending, so
+    waiting happens outside the lock.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        min_rate_fraction: float = 0.1,
+        recovery_fraction: float = 0.05,
+        default_penalty: float = 1.0,
+    ):
+        """
+        Initialize bucket.
+
+        Args:
+            rate: Sustained tokens per second
+            burst: Maximum tokens available at once
+            min_rate_fraction: Floor for the adapted rate, as a fraction of rate
+            recovery_fraction: Rate regained per success, as a fraction of rate
+            default_penalty: Pause in seconds after a 429 without Retry-After
+        """
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be positive")
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate_fraction = min_rate_fraction
+        self.recovery_fraction = recovery_fraction
+        self.default_penalty = default_penalty
+
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        # Counters
+        self.throttled = 0
+        self.waited = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (lock held)."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens and get the delay before they may be used.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds to wait (0 if available now)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._blocked_until - now)
+            if wait > 0:
+                self.waited += wait
+            return wait
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        React to a 429: pause for Retry-After and halve the rate.
+
+        Args:
+            retry_after: Seconds the server asked us to wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            pause = retry_after if retry_after is not None else self.default_penalty
+            self._blocked_until = max(self._blocked_until, now + pause)
+            self._tokens = min(self._tokens, 0.0)
+            self.rate = max(self.base_rate * self.min_rate_fraction, self.rate / 2)
+            self.throttled += 1
+
+    def reward(self) -> None:
+        """React to a successful response: recover rate additively."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = min(self.base_rate, self.rate + self.base_rate * self.recovery_fraction)
+
+    def configure(self, rate: float, burst: float) -> None:
+        """Change the configured rate and burst."""
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.base_rate = rate
+            self.rate = rate
+            self.burst = burst
+            self._tokens = min(self._tokens, burst)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Get current rate and counters."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": self.rate,
+                "base_rate": self.base_rate,
+                "burst": self.burst,
+                "tokens": self._tokens,
+                "throttled": self.throttled,
+                "waited": self.waited,
+            }
+
+
+class RateLimiter:
+    """
+    Registry of token buckets keyed by endpoint class.
+
+    Unknown classes fall back to the "default" budget.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        Initialize limiter.
+
+        Args:
+            limits: {endpoint_class: (rate, burst)} overrides of DEFAULT_LIMITS
+        """
+        self._limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self._limits.update(limits)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, endpoint_class: str) -> TokenBucket:
+        """Get (or create) the bucket for an endpoint class."""
+        bucket = self._buckets.get(endpoint_class)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(endpoint_class)
+                if bucket is None:
+                    rate, burst = self._limits.get(endpoint_class, self._limits[DEFAULT])
+                    bucket = self._buckets[endpoint_class] = TokenBucket(rate, burst)
+        return bucket
+
+    def configure(self, endpoint_class: str, rate: float, burst: float) -> None:
+        """
+        Set the budget for an endpoint class.
+
+        Args:
+            endpoint_class: Endpoint class name
+            rate: Sustained requests per second
+            burst: Maximum requests at once
+        """
+        with self._lock:
+            self._limits[endpoint_class] = (rate, burst)
+            bucket = self._buckets.get(endpoint_class)
+        if bucket is not None:
+            bucket.configure(rate, burst)
+
+    @staticmethod
+    def classify_clob(method: str, endpoint: str) -> str:
+        """
+        Map a CLOB request to its endpoint class.
+
+        Args:
+            method: HTTP method
+            endpoint: Request path
+
+        Returns:
+            Endpoint class name
+        """
+        method = method.upper()
+        path = "/" + endpoint.split("?", 1)[0].lstrip("/")
+        if method == "POST" and path in ("/order", "/orders"):
+            return ORDER_POST
+        if method == "DELETE":
+            return CANCEL
+        if path in _MARKET_DATA_PATHS:
+            return MARKET_DATA
+        if path.startswith("/data/"):
+            return DATA
+        return DEFAULT
+
+    def acquire(self, endpoint_class: str, tokens: float = 1.0) -> float:
+        """
+        Wait (blocking) until a request may be sent.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.bucket(endpoint_class).reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, endpoint_class: str, tokens: float = 1.0) -> float:
+        """
+        Wait (without blocking the event loop) until a request may be sent.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.bucket(endpoint_class).reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_response(self, endpoint_class: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """
+        Feed a response status back into the bucket.
+
+        Args:
+            endpoint_class: Endpoint class the request used
+            status_code: HTTP status code
+            retry_after: Raw Retry-After header value, if any
+        """
+        bucket = self.bucket(endpoint_class)
+        if status_code == 429:
+            bucket.penalize(parse_retry_after(retry_after))
+        elif status_code < 400:
+            bucket.reward()
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Get stats for every bucket in use."""
+        return {name: bucket.stats for name, bucket in list(self._buckets.items())}
+
+
+_shared_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide limiter shared by all clients."""
+    return _shared_limiter
+
+
+def set_rate_limiter(limiter: RateLimiter) -> None:
+    """Replace the process-wide limiter (affects clients created afterwards)."""
+    global _shared_limiter
+    _shared_limiter = limiter
@@ -0,0 +1,280 @@
+"""
+Recorder Module - Raw Market Data Capture
+
+Tees raw WebSocket frames into rotating, compressed, append-only
+capture files for replay, backtesting and latency analysis:
+- Receive timestamps (monotonic and wall clock, as taken by the
+  receive loop) and connection ID
+- zstd compression when zstandard is installed, gzip otherwise
+- Rotation by size and age
+- Background writer thread so the receive loop never touches disk
+
+Each record is one JSON line:
+    {"mono": 1234.5678, "wall": 1766671200.123, "conn": "1:1", "raw": "<frame>"}
+
+Example:
+    from src.recorder import MarketDataRecorder
+    from src.websocket_client import MarketWebSocket
+
+    recorder = MarketDataRecorder("captures")
+    recorder.start()
+    ws = MarketWebSocket(recorder=recorder)
+    ...
+    recorder.stop()
+
+    for record in iter_capture("captures/market-20250101-000000-0001.jsonl.gz"):
+        print(record["wall"], record["raw"][:80])
+"""
+
+import gzip
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Union
+
+from . import codec
+
+logger = logging.getLogger(__name__)
+
+
+def _load_zstd():
+    """Resolve the optional zstandard module."""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+# Queue sentinel telling the writer thread to finish
+_STOP = object()
+
+
+class MarketDataRecorder:
+    """
+    Append-only recorder for raw WebSocket frames.
+
+    record() only enqueues; a daemon thread serializes, compresses and
+    writes. If the writer falls behind and the queue fills up, frames
+    are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        prefix: str = "market",
+        compression: str = "auto",
+        rotate_bytes: int = 256 * 1024 * 1024,
+        rotate_seconds: float = 3600.0,
+        flush_interval: float = 1.0,
+        max_queue: int = 100000,
+    ):
+        """
+        Initialize recorder.
+
+        Args:
+            directory: Directory for capture files
+            prefix: Capture file name prefix
+            compression: "zstd", "gzip" or "auto" (zstd if installed)
+            rotate_bytes: Start a new file after this many uncompressed bytes
+            rotate_seconds: Start a new file after this many seconds
+            flush_interval: Seconds between flushes to disk
+            max_queue: Frames buffered before new frames are dropped
+        """
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.flush_interval = flush_interval
+
+        self._zstd = _load_zstd()
+        if compression == "auto":
+            compression = "zstd" if self._zstd else "gzip"
+        if compression == "zstd" and not self._zstd:
+            raise RuntimeError("zstd compression requires the zstandard package")
+        if compression not in ("zstd", "gzip"):
+            raise ValueError(f"Unsupported compression: {compression}")
+        self.compression = compression
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+
+        # Current file state (writer thread only)
+        self._raw_file: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+        self._file_seq = 0
+        self._file_bytes = 0
+        self._file_opened = 0.0
+
+        # Counters
+        self.recorded = 0
+        self.dropped = 0
+        self.current_path: Optional[Path] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the writer thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def record(
+        self,
+        raw: Union[str, bytes],
+        connection_id: str = "",
+        received_mono: Optional[float] = None,
+        received_at: Optional[float] = None,
+    ) -> None:
+        """
+        Queue a raw frame for writing (never blocks).
+
+        Args:
+            raw: Frame payload exactly as received
+            connection_id: ID of the connection that received it
+            received_mono: perf_counter() receive time taken by the caller
+                (default: now)
+            received_at: Wall-clock receive time taken by the caller
+                (default: now)
+        """
+        if received_mono is None:
+            received_mono = time.perf_counter()
+        if received_at is None:
+            received_at = time.time()
+        try:
+            self._queue.put_nowait((received_mono, received_at, connection_id, raw))
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        if self.is_running:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._writer_loop,
+            name="market-data-recorder",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Recording market data to {self.directory} ({self.compression})")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush queued frames, close the current file and stop the writer."""
+        if not self._thread:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info(f"Recorder stopped ({self.recorded} recorded, {self.dropped} dropped)")
+
+    # Writer thread
+
+    def _open_file(self) -> None:
+        """Open the next capture file."""
+        self._close_file()
+        self._file_seq += 1
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        suffix = ".jsonl.zst" if self.compression == "zstd" else ".jsonl.gz"
+        path = self.directory / f"{self.prefix}-{stamp}-{self._file_seq:04d}{suffix}"
+
+        if self.compression == "zstd":
+            self._raw_file = open(path, "ab")
+            self._stream = self._zstd.ZstdCompressor(level=3).stream_writer(self._raw_file)
+        else:
+            self._stream = gzip.open(path, "ab", compresslevel=6)
+
+        self.current_path = path
+        self._file_bytes = 0
+        self._file_opened = time.monotonic()
+        logger.info(f"Opened capture file {path}")
+
+    def _close_file(self) -> None:
+        """Close the current capture file, if any."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._raw_file is not None:
+            self._raw_file.close()
+            self._raw_file = None
+
+    def _flush(self) -> None:
+        """Push buffered data to disk."""
+        if self._stream is None:
+            return
+        if self.compression == "zstd":
+            self._stream.flush(self._zstd.FLUSH_BLOCK)
+            self._raw_file.flush()
+        else:
+            self._stream.flush()
+
+    def _write(self, item: Tuple[float, float, str, Union[str, bytes]]) -> None:
+        """Serialize and write one record, rotating first if needed."""
+        mono, wall, connection_id, raw = item
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", errors="replace")
+
+        if (
+            self._stream is None
+            or self._file_bytes >= self.rotate_bytes
+            or time.monotonic() - self._file_opened >= self.rotate_seconds
+        ):
+            self._open_file()
+
+        line = (codec.dumps({"mono": mono, "wall": wall, "conn": connection_id, "raw": raw}) + "\n").encode("utf-8")
+        self._stream.write(line)
+        self._file_bytes += len(line)
+        self.recorded += 1
+
+    def _writer_loop(self) -> None:
+        """Drain the queue to disk until stopped."""
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    break
+                if item is not None:
+                    try:
+                        self._write(item)
+                    except Exception as e:
+                        logger.error(f"Failed to write capture record: {e}")
+
+                now = time.monotonic()
+                if now - last_flush >= self.flush_interval:
+                    self._flush()
+                    last_flush = now
+        finally:
+            self._close_file()
+
+
+def iter_capture(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Read records back from a capture file.
+
+    Args:
+        path: Path to a .jsonl.zst or .jsonl.gz capture file
+
+    Yields:
+        Record dicts with mono, wall, conn and raw keys
+    """
+    path = Path(path)
+    if path.suffix == ".zst":
+        zstd = _load_zstd()
+        if not zstd:
+            raise RuntimeError("Reading zstd captures requires the zstandard package")
+        import io
+        with open(path, "rb") as f:
+            reader = io.TextIOWrapper(zstd.ZstdDecompressor().stream_reader(f), encoding="utf-8")
+            for line in reader:
+                if line.strip():
+                    yield codec.loads(line)
+    else:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield codec.loads(line)
@@ -0,0 +1,332 @@
+"""
+Retry Module - Retry Policy and Circuit Breaker
+
+Decides when a failed API request may be sent again:
+- Error classification: connection failures and 5xx are retried,
+  4xx never is
+- Per-endpoint idempotency: non-idempotent calls (POST /order) are
+  only retried when the request provably never reached the server
+- Full-jitter exponential backoff bounded by an overall deadline
+  (by default long enough for every attempt to use its full timeout)
+- Circuit breaker per host, so calls fail fast while the API is down
+  instead of queueing behind timeouts
+
+Example:
+    from src.retry import RetryPolicy
+    from src.client import ClobClient
+
+    policy = RetryPolicy(max_attempts=4, deadline=5.0)
+    client = ClobClient(retry_policy=policy)
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from .http import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# Statuses worth retrying on idempotent requests
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+
+# (method, path) -> idempotent, overriding the per-method default
+DEFAULT_ENDPOINT_RULES: Dict[Tuple[str, str], bool] = {
+    ("POST", "/order"): False,
+    ("POST", "/orders"): False,
+    ("POST", "/auth/api-key"): False,
+}
+
+
+def _normalize_path(endpoint: str) -> str:
+    """Strip the query string and ensure a leading slash."""
+    return "/" + endpoint.split("?", 1)[0].lstrip("/")
+
+
+def is_connect_error(error: BaseException) -> bool:
+    """
+    Check if an error happened before the request was sent.
+
+    Connection refused, DNS failures and connect timeouts mean the
+    server never saw the request, so even non-idempotent calls are
+    safe to retry.
+
+    Args:
+        error: Exception raised by requests or httpx
+
+    Returns:
+        True if the request never left the client
+    """
+    if httpx is not None and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and not isinstance(
+        error, requests.exceptions.SSLError
+    ):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+def is_transport_error(error: BaseException) -> bool:
+    """Check if an error is a network/transport failure (vs. a usage error)."""
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(
+        error,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    )
+
+
+class RetryPolicy:
+    """
+    Retry rules shared by the sync and async request loops.
+
+    Attempts stop at max_attempts or when the next backoff would run
+    past the deadline, whichever comes first. Each attempt's timeout is
+    capped by the time left before the deadline.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        deadline: Optional[float] = None,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+        idempotent_methods: Iterable[str] = ("GET", "DELETE"),
+        endpoint_rules: Optional[Dict[Tuple[str, str], bool]] = None,
+        min_attempt_timeout: float = 0.5,
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts: Maximum attempts including the first
+            base_delay: Backoff cap for the first retry in seconds
+            max_delay: Upper bound for any single backoff
+            deadline: Overall budget in seconds across all attempts
+                (default: enough for max_attempts full timeouts plus
+                the maximum backoffs, see start())
+            retry_statuses: HTTP statuses retried on idempotent requests
+            idempotent_methods: Methods treated as idempotent by default
+            endpoint_rules: {(method, path): idempotent} overrides,
+                merged over DEFAULT_ENDPOINT_RULES
+            min_attempt_timeout: Don't send an attempt with less time than
+                this left before the deadline
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.min_attempt_timeout = min_attempt_timeout
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.idempotent_methods: FrozenSet[str] = frozenset(m.upper() for m in idempotent_methods)
+        self.endpoint_rules = dict(DEFAULT_ENDPOINT_RULES)
+        if endpoint_rules:
+            self.endpoint_rules.update(
+                {(method.upper(), _normalize_path(path)): value for (method, path), value in endpoint_rules.items()}
+            )
+
+    def is_idempotent(self, method: str, endpoint: str) -> bool:
+        """Check if a request may be repeated without side effects."""
+        method = method.upper()
+        rule = self.endpoint_rules.get((method, _normalize_path(endpoint)))
+        if rule is not None:
+            return rule
+        return method in self.idempotent_methods
+
+    def budget(self, timeout: float) -> float:
+        """
+        Get the overall time budget for a request.
+
+        Args:
+            timeout: The client's per-attempt timeout
+
+        Returns:
+            The configured deadline, or max_attempts full timeouts plus
+            the maximum backoff between them when none is set
+        """
+        if self.deadline is not None:
+            return self.deadline
+        return self.max_attempts * timeout + (self.max_attempts - 1) * self.max_delay
+
+    def start(self, timeout: float) -> float:
+        """Get the monotonic deadline for a request starting now."""
+        return time.monotonic() + self.budget(timeout)
+
+    def attempt_timeout(self, timeout: float, deadline: float) -> Optional[float]:
+        """
+        Cap a per-attempt timeout by the time left before the deadline.
+
+        Call right before sending (after any rate-limit wait).
+
+        Returns:
+            Timeout in seconds, or None if less than min_attempt_timeout is
+            left: the attempt must not be sent, since a near-zero timeout
+            would report a request the server may still process as failed
+        """
+        remaining = deadline - time.monotonic()
+        if remaining < min(self.min_attempt_timeout, timeout):
+            return None
+        return min(timeout, remaining)
+
+    def should_retry_error(self, error: BaseException, idempotent: bool) -> bool:
+        """Check if a transport error may be retried."""
+        if is_connect_error(error):
+            return True
+        return idempotent and is_transport_error(error)
+
+    def should_retry_status(self, status_code: int, idempotent: bool) -> bool:
+        """Check if an HTTP error status may be retried (never 4xx except 429)."""
+        if status_code == 429:
+            # Rejected before processing; the rate limiter paces the retry
+            return True
+        return idempotent and status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number attempt + 1."""
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def can_retry(self, attempt: int, delay: float, deadline: float) -> bool:
+        """Check if another attempt fits in max_attempts and the deadline."""
+        return attempt + 1 < self.max_attempts and time.monotonic() + delay < deadline
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: requests flow. After failure_threshold consecutive
+    failures (transport errors or 5xx) it opens and rejects requests
+    for recovery_timeout seconds, then lets a single probe through
+    (half-open). The probe's outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 10.0, name: str = ""):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before probing
+            name: Label used in log messages
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.name = name
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Get the current state."""
+        return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        if self._state == self.CLOSED:
+            return 0.0
+        started = self._opened_at if self._state == self.OPEN else self._probe_started
+        return max(started + self.recovery_timeout - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """
+        Check if a request may be sent now.
+
+        Returns:
+            False while open, or while a half-open probe is in flight
+        """
+        if self._state == self.CLOSED:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.OPEN:
+                if now - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_started = now
+                logger.info(f"Circuit {self.name} half-open, probing")
+                return True
+            if self._state == self.HALF_OPEN:
+                # Allow a new probe if the previous one never reported back
+                if now - self._probe_started >= self.recovery_timeout:
+                    self._probe_started = now
+                    return True
+                return False
+            return True
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy server."""
+        if self._state == self.CLOSED and self._failures == 0:
+            return
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a transport failure or 5xx response."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    f"Circuit {self.name} open after {self._failures} failures; "
+                    f"failing fast for {self.recovery_timeout:g}s"
+                )
+
+    def reset(self) -> None:
+        """Force the circuit closed."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker for a host.
+
+    Args:
+        host: Base URL the breaker guards
+
+    Returns:
+        Breaker shared by all clients of that host
+    """
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(host)
+            if breaker is None:
+                breaker = _breakers[host] = CircuitBreaker(name=host)
+    return breaker
@@ -0,0 +1,95 @@
+"""
+Secp256k1 Module - Pluggable ECDSA Signing Backends
+
+Signs 32-byte digests (e.g. EIP-712 order hashes) and returns the
+65-byte r || s || v Ethereum signature:
+- coincurve: libsecp256k1 bindings, used automatically when installed
+- eth_account: the account's own hash signing (always available)
+
+Both use RFC 6979 deterministic nonces and low-s normalization, so
+they produce identical signatures (see scripts/validate_signing_backends.py).
+
+Example:
+    from eth_account import Account
+    from src.secp256k1 import create_backend
+
+    backend = create_backend(Account.from_key(private_key))
+    signature = backend.sign_hash(digest)  # 65 bytes, v = 27 or 28
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    coincurve = None
+    COINCURVE_AVAILABLE = False
+
+BACKENDS = ("auto", "coincurve", "eth_account")
+
+
+class EthAccountBackend:
+    """Signs through eth_account's hash signing."""
+
+    name = "eth_account"
+
+    def __init__(self, account: Any):
+        """
+        Initialize backend.
+
+        Args:
+            account: eth_account LocalAccount
+        """
+        # eth-account >= 0.13 renamed signHash
+        self._sign = getattr(account, "unsafe_sign_hash", None) or account.signHash
+
+    def sign_hash(self, digest: bytes) -> bytes:
+        """Sign a 32-byte digest; return r || s || v (v = 27/28)."""
+        return bytes(self._sign(digest).signature)
+
+
+class CoincurveBackend:
+    """Signs with libsecp256k1 through coincurve."""
+
+    name = "coincurve"
+
+    def __init__(self, account: Any):
+        """
+        Initialize backend.
+
+        Args:
+            account: eth_account LocalAccount (its key is loaded once)
+        """
+        self._key = coincurve.PrivateKey(bytes(account.key))
+
+    def sign_hash(self, digest: bytes) -> bytes:
+        """Sign a 32-byte digest; return r || s || v (v = 27/28)."""
+        signature = self._key.sign_recoverable(digest, hasher=None)
+        return signature[:64] + bytes((signature[64] + 27,))
+
+
+def create_backend(account: Any, backend: str = "auto") -> Any:
+    """
+    Create a signing backend for an account.
+
+    Args:
+        account: eth_account LocalAccount
+        backend: 'auto' (coincurve if installed), 'coincurve' or 'eth_account'
+
+    Returns:
+        Backend with sign_hash(digest) -> 65-byte signature
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown signing backend: {backend} (expected one of {', '.join(BACKENDS)})")
+    if backend == "coincurve" and not COINCURVE_AVAILABLE:
+        raise ValueError("coincurve signing backend requested but coincurve is not installed")
+    if backend == "eth_account" or not COINCURVE_AVAILABLE:
+        return EthAccountBackend(account)
+    return CoincurveBackend(account)
@@ -21,17 +21,74 @@ Example:
     )
 """
 
-import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from eth_account import Account
 from eth_account.messages import encode_typed_data
-from eth_utils import to_checksum_address
+from eth_utils import keccak, to_checksum_address
+
+from .allocator import get_allocator
+from .clock import get_clock
+from .secp256k1 import create_backend
 
 
 # USDC has 6 decimal places
 USDC_DECIMALS = 6
 
+# EIP-712 domain field types, in canonical order
+EIP712_DOMAIN_FIELDS = {
+    "name": "string",
+    "version": "string",
+    "chainId": "uint256",
+    "verifyingContract": "address",
+    "salt": "bytes32",
+}
+
+ZERO_WORD = bytes(32)
+
+
+def _uint_word(value: int, bits: int = 256) -> bytes:
+    """ABI-encode an unsigned integer as one 32-byte word."""
+    if not 0 <= value < 1 << bits:
+        raise ValueError(f"Value out of range for uint{bits}: {value}")
+    return value.to_bytes(32, "big")
+
+
+def _address_word(address: str) -> bytes:
+    """ABI-encode an address as one 32-byte word (validates it)."""
+    return bytes(12) + bytes.fromhex(to_checksum_address(address)[2:])
+
+
+def _type_hash(name: str, fields: List[Dict[str, str]]) -> bytes:
+    """keccak256 of an EIP-712 type string like 'Order(uint256 salt,...)'."""
+    members = ",".join(f"{field['type']} {field['name']}" for field in fields)
+    return keccak(text=f"{name}({members})")
+
+
+def domain_separator(domain: Dict[str, Any]) -> bytes:
+    """
+    Compute the EIP-712 domain separator hash.
+
+    Args:
+        domain: Domain values, keyed by EIP712Domain field name
+
+    Returns:
+        32-byte domain separator
+    """
+    fields = [{"name": name, "type": kind} for name, kind in EIP712_DOMAIN_FIELDS.items() if name in domain]
+    encoded = [_type_hash("EIP712Domain", fields)]
+    for field in fields:
+        value = domain[field["name"]]
+        if field["type"] == "string":
+            encoded.append(keccak(text=value))
+        elif field["type"] == "address":
+            encoded.append(_address_word(value))
+        elif field["type"] == "bytes32":
+            encoded.append(bytes(value).ljust(32, b"\0"))
+        else:
+            encoded.append(_uint_word(int(value)))
+    return keccak(b"".join(encoded))
+
 
 @dataclass
 class Order:
@@ -44,9 +101,10 @@ class Order:
         size: Number of shares
         side: Order side ('BUY' or 'SELL')
         maker: The maker's wallet address (Safe/Proxy)
-        nonce: Unique order nonce (usually timestamp)
+        nonce: Exchange nonce (defaults to the allocator's current nonce)
         fee_rate_bps: Fee rate in basis points (usually 0)
         signature_type: Signature type (2 = Gnosis Safe)
+        salt: Unique order salt (allocated if not given)
     """
     token_id: str
     price: float
@@ -56,6 +114,7 @@ class Order:
     nonce: Optional[int] = None
     fee_rate_bps: int = 0
     signature_type: int = 2
+    salt: Optional[int] = None
 
     def __post_init__(self):
         """Validate and normalize order parameters."""
@@ -70,7 +129,9 @@ class Order:
             raise ValueError(f"Invalid size: {self.size}")
 
         if self.nonce is None:
-            self.nonce = int(time.time())
+            self.nonce = get_allocator().nonce
+        if self.salt is None:
+            self.salt = get_allocator().next_salt()
 
         # Convert to integers for blockchain
         self.maker_amount = str(int(self.size * self.price * 10**USDC_DECIMALS))
@@ -91,10 +152,17 @@ class OrderSigner:
     - Authentication messages (L1)
     - Order messages (for CLOB submission)
 
+    Orders are hashed directly: the domain separator, Order type hash
+    and address words are computed once, so each order only encodes
+    its own fields before one keccak and one ECDSA signature (native
+    libsecp256k1 when coincurve is installed, see src/secp256k1.py).
+    The result is identical to encode_typed_data + sign_message.
+
     Attributes:
         wallet: The Ethereum wallet instance
         address: The signer's address
         domain: EIP-712 domain separator
+        backend: ECDSA backend used for orders
     """
 
     # Polymarket CLOB EIP-712 domain
@@ -122,15 +190,17 @@ class OrderSigner:
         ]
     }
 
-    def __init__(self, private_key: str):
+    def __init__(self, private_key: str, backend: str = "auto"):
         """
         Initialize signer with a private key.
 
         Args:
             private_key: Private key (with or without 0x prefix)
+            backend: Order signing backend: 'auto' (coincurve if
+                installed), 'coincurve' or 'eth_account'
 
         Raises:
-            ValueError: If private key is invalid
+            ValueError: If private key or backend is invalid
         """
         if private_key.startswith("0x"):
             private_key = private_key[2:]
@@ -142,6 +212,13 @@ class OrderSigner:
 
         self.address = self.wallet.address
 
+        # Precomputed EIP-712 hashing state for sign_order
+        self._domain_separator = domain_separator(self.DOMAIN)
+        self._order_type_hash = _type_hash("Order", self.ORDER_TYPES["Order"])
+        self._signer_word = _address_word(self.address)
+        self._address_words: Dict[str, bytes] = {}
+        self.backend = create_backend(self.wallet, backend)
+
     @classmethod
     def from_encrypted(
         cls,
@@ -178,14 +255,14 @@ class OrderSigner:
         This signature is used to create or derive API credentials.
 
         Args:
-            timestamp: Message timestamp (defaults to current time)
+            timestamp: Message timestamp (defaults to current server time)
             nonce: Message nonce (usually 0)
 
         Returns:
             Hex-encoded signature
         """
         if timestamp is None:
-            timestamp = str(int(time.time()))
+            timestamp = str(int(get_clock().now()))
 
         # Auth message types
         auth_types = {
@@ -227,33 +304,11 @@ class OrderSigner:
             SignerError: If signing fails
         """
         try:
-            # Build order message for EIP-712
-            order_message = {
-                "salt": 0,
-                "maker": to_checksum_address(order.maker),
-                "signer": self.address,
-                "taker": "0x0000000000000000000000000000000000000000",
-                "tokenId": int(order.token_id),
-                "makerAmount": int(order.maker_amount),
-                "takerAmount": int(order.taker_amount),
-                "expiration": 0,
-                "nonce": order.nonce,
-                "feeRateBps": order.fee_rate_bps,
-                "side": order.side_value,
-                "signatureType": order.signature_type,
-            }
-
-            # Sign the order using new API format
-            signable = encode_typed_data(
-                domain_data=self.DOMAIN,
-                message_types=self.ORDER_TYPES,
-                message_data=order_message
-            )
-
-            signed = self.wallet.sign_message(signable)
+            signature = self.backend.sign_hash(self.order_digest(order))
 
             return {
                 "order": {
+                    "salt": order.salt,
                     "tokenId": order.token_id,
                     "price": order.price,
                     "size": order.size,
@@ -263,13 +318,44 @@ class OrderSigner:
                     "feeRateBps": order.fee_rate_bps,
                     "signatureType": order.signature_type,
                 },
-                "signature": "0x" + signed.signature.hex(),
+                "signature": "0x" + signature.hex(),
                 "signer": self.address,
             }
 
         except Exception as e:
             raise SignerError(f"Failed to sign order: {e}")
 
+    def order_digest(self, order: Order) -> bytes:
+        """
+        Compute the EIP-712 digest signed for an order.
+
+        Args:
+            order: Order instance
+
+        Returns:
+            32-byte keccak256 of 0x1901 || domain separator || struct hash
+        """
+        maker_word = self._address_words.get(order.maker)
+        if maker_word is None:
+            maker_word = self._address_words[order.maker] = _address_word(order.maker)
+
+        struct_hash = keccak(b"".join((
+            self._order_type_hash,
+            _uint_word(order.salt),
+            maker_word,
+            self._signer_word,
+            ZERO_WORD,  # taker
+            _uint_word(int(order.token_id)),
+            _uint_word(int(order.maker_amount)),
+            _uint_word(int(order.taker_amount)),
+            ZERO_WORD,  # expiration
+            _uint_word(order.nonce),
+            _uint_word(order.fee_rate_bps),
+            _uint_word(order.side_value, 8),
+            _uint_word(order.signature_type, 8),
+        )))
+        return keccak(b"\x19\x01" + self._domain_separator + struct_hash)
+
     def sign_order_dict(
         self,
         token_id: str,
@@ -289,7 +375,7 @@ class OrderSigner:
             size: Number of shares
             side: 'BUY' or 'SELL'
             maker: Maker's wallet address
-            nonce: Order nonce (defaults to timestamp)
+            nonce: Exchange nonce (defaults to the allocator's current nonce)
             fee_rate_bps: Fee rate in basis points
 
         Returns:
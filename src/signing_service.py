@@ -0,0 +1,174 @@
+"""
+Signing Service Module - Order Signing in Worker Processes
+
+Moves CPU-bound ECDSA order signing off the event loop and spreads
+it across cores:
+- Worker processes load the private key once, at start-up
+- Orders travel to the workers and signatures come back over the
+  process pool's pipes; the key never crosses again
+- Batches are split into one chunk per worker and signed in parallel
+- Every call returns futures (concurrent or awaitable)
+
+Workers are started with the "spawn" method, so they never inherit
+the parent's threads or event loop.
+
+Example:
+    from src.signing_service import SigningService
+
+    service = SigningService(private_key, workers=4)
+    await service.warm()
+
+    signed = await service.asign(order)
+    results = await service.asign_batch(orders)  # dicts or exceptions
+
+    service.shutdown()
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
+
+from .signer import Order, OrderSigner
+
+logger = logging.getLogger(__name__)
+
+# Signer of the current worker process
+_worker_signer: Optional[OrderSigner] = None
+
+
+def _init_worker(private_key: str, backend: str) -> None:
+    """Load the key into this worker process."""
+    global _worker_signer
+    _worker_signer = OrderSigner(private_key, backend)
+
+
+def _worker_address() -> str:
+    """Return the worker's signer address (forces start-up)."""
+    return _worker_signer.address
+
+
+def _sign_chunk(orders: List[Order]) -> List[Union[Dict[str, Any], Exception]]:
+    """Sign orders in a worker; failures are returned in place."""
+    results: List[Union[Dict[str, Any], Exception]] = []
+    for order in orders:
+        try:
+            results.append(_worker_signer.sign_order(order))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _fan_out(futures: List[Future], chunk: Future) -> None:
+    """Resolve per-order futures from a finished chunk."""
+    if chunk.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+    error = chunk.exception()
+    if error is not None:
+        for future in futures:
+            future.set_exception(error)
+        return
+    for future, result in zip(futures, chunk.result()):
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+class SigningService:
+    """
+    Signs orders in a pool of worker processes.
+
+    Results are the same dicts OrderSigner.sign_order returns.
+    """
+
+    def __init__(self, private_key: str, workers: Optional[int] = None, backend: str = "auto"):
+        """
+        Initialize signing service.
+
+        Args:
+            private_key: Private key (with or without 0x prefix)
+            workers: Worker processes (default: CPU count)
+            backend: Signing backend for the workers ('auto', 'coincurve'
+                or 'eth_account'), as for OrderSigner
+
+        Raises:
+            ValueError: If private key or backend is invalid
+        """
+        # Validate in the parent, so a bad key fails here rather than in every worker
+        signer = OrderSigner(private_key, backend)
+        self.address = signer.address
+        # Resolve 'auto' once, so every worker uses the parent's choice
+        self.backend = signer.backend.name
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(private_key, self.backend),
+        )
+
+    @classmethod
+    def from_signer(cls, signer: OrderSigner, workers: Optional[int] = None) -> "SigningService":
+        """Create a service for an existing signer's key and backend."""
+        return cls(signer.wallet.key.hex(), workers, signer.backend.name)
+
+    async def warm(self) -> int:
+        """
+        Start all worker processes and load the key in each.
+
+        Returns:
+            Number of workers that answered
+        """
+        futures = [asyncio.wrap_future(self._pool.submit(_worker_address)) for _ in range(self.workers)]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        ready = sum(1 for result in results if result == self.address)
+        logger.info(f"Signing service ready: {ready}/{self.workers} workers")
+        return ready
+
+    def sign(self, order: Order) -> Future:
+        """
+        Sign one order in a worker.
+
+        Returns:
+            Future resolving to the signed order dict
+        """
+        return self.sign_batch([order])[0]
+
+    def sign_batch(self, orders: List[Order]) -> List[Future]:
+        """
+        Sign orders in parallel, one chunk per worker.
+
+        Returns:
+            One future per order, in input order
+        """
+        futures: List[Future] = [Future() for _ in orders]
+        size = -(-len(orders) // self.workers)
+        for start in range(0, len(orders), size or 1):
+            chunk = self._pool.submit(_sign_chunk, orders[start:start + size])
+            chunk.add_done_callback(partial(_fan_out, futures[start:start + size]))
+        return futures
+
+    async def asign(self, order: Order) -> Dict[str, Any]:
+        """Sign one order and await the result."""
+        return await asyncio.wrap_future(self.sign(order))
+
+    async def asign_batch(self, orders: List[Order]) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Sign orders in parallel and await them.
+
+        Returns:
+            Signed order dicts, or the exception for orders that failed,
+            in input order
+        """
+        futures = [asyncio.wrap_future(future) for future in self.sign_batch(orders)]
+        return list(await asyncio.gather(*futures, return_exceptions=True))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,513 @@
+"""
+Tick Orderbook Module - Array-backed L2 Book
+
+Polymarket prices live on a fixed tick grid between 0 and 1 (0.01, 0.001
+or 0.0001 depending on the market), so a book can be stored as two
+preallocated size arrays indexed by tick instead of sorted lists of
+level objects:
+- Level updates are O(1); a bitmap of populated ticks per side finds
+  the best level and walks levels without scanning empty ticks
+- The grid is sized from the market's tick and refined when the market
+  moves to a finer tick (tick_size_change)
+- Depth queries are vectorized with numpy when it is installed
+- Levels that are off every tick grid are logged and skipped
+
+TickOrderbook exposes the same best_bid/best_ask/mid_price/bids/asks API
+as OrderbookSnapshot and can be used as a drop-in replacement.
+
+Example:
+    from src.websocket_client import MarketWebSocket
+    from src.tick_orderbook import TickOrderbook
+
+    ws = MarketWebSocket(book_type=TickOrderbook)
+
+    book = ws.get_orderbook(token_id)
+    print(book.mid_price, book.cumulative_size("BUY", 0.45))
+"""
+
+import logging
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .websocket_client import OrderbookLevel, _ask_sort_key, _bid_sort_key
+
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    numpy = None
+    NUMPY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .websocket_client import PriceChange
+
+logger = logging.getLogger(__name__)
+
+
+# Tick sizes Polymarket markets trade at, coarsest first
+TICK_SIZES = (0.01, 0.001, 0.0001)
+DEFAULT_TICK_SIZE = TICK_SIZES[0]
+_SCALES = tuple(int(round(1 / tick)) for tick in TICK_SIZES)
+
+
+def grid_for(prices: Iterable[float]) -> float:
+    """
+    Find the coarsest listed tick size the prices lie on.
+
+    Prices off every listed grid are ignored.
+
+    Args:
+        prices: Level prices
+
+    Returns:
+        Tick size (the coarsest one if no price needs a finer grid)
+    """
+    level = 0
+    for price in prices:
+        for i in range(level, len(TICK_SIZES)):
+            scaled = price * _SCALES[i]
+            if abs(scaled - round(scaled)) <= 1e-6:
+                level = i
+                break
+        if level == len(TICK_SIZES) - 1:
+            break
+    return TICK_SIZES[level]
+
+
+@lru_cache(maxsize=None)
+def _price_table(scale: int) -> List[float]:
+    """Get the price of every tick index on a grid."""
+    return [round(i / scale, 6) for i in range(scale + 1)]
+
+
+def _iter_desc(bits: int) -> Iterator[int]:
+    """Yield set bit indexes, highest first."""
+    while bits:
+        idx = bits.bit_length() - 1
+        yield idx
+        bits ^= 1 << idx
+
+
+def _iter_asc(bits: int) -> Iterator[int]:
+    """Yield set bit indexes, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class TickOrderbook:
+    """
+    Orderbook backed by per-tick size arrays.
+
+    Attributes:
+        asset_id: Token ID
+        market: Condition ID
+        timestamp: Exchange timestamp of the last update (ms)
+        hash: Exchange hash of the last update
+        tick_size: Price grid resolution
+    """
+
+    def __init__(
+        self,
+        asset_id: str = "",
+        market: str = "",
+        timestamp: int = 0,
+        hash: str = "",
+        tick_size: float = DEFAULT_TICK_SIZE,
+    ):
+        """
+        Initialize an empty book.
+
+        Args:
+            asset_id: Token ID
+            market: Condition ID
+            timestamp: Exchange timestamp (ms)
+            hash: Exchange book hash
+            tick_size: Price grid resolution
+        """
+        self.asset_id = asset_id
+        self.market = market
+        self.timestamp = timestamp
+        self.hash = hash
+        self._reset(tick_size)
+
+    def _reset(self, tick_size: float) -> None:
+        """Allocate empty arrays for a tick grid."""
+        self.tick_size = tick_size
+        self._scale = int(round(1 / tick_size))
+        self._prices = _price_table(self._scale)
+        slots = self._scale + 1
+        self._bid_sizes = array("d", bytes(8 * slots))
+        self._ask_sizes = array("d", bytes(8 * slots))
+
+        # Bit i is set while tick i has resting size
+        self._bid_bits = 0
+        self._ask_bits = 0
+
+        # Level lists materialized lazily for the list-based API, then
+        # kept in sync in place like OrderbookSnapshot's lists
+        self._bids_cache: Optional[List[OrderbookLevel]] = None
+        self._asks_cache: Optional[List[OrderbookLevel]] = None
+
+    def _locate(self, price: float) -> Optional[int]:
+        """Convert a price to its tick index, or None if it is off the grid."""
+        scaled = price * self._scale
+        idx = int(round(scaled))
+        if not 0 <= idx <= self._scale or abs(idx - scaled) > 1e-6:
+            return None
+        return idx
+
+    def _index(self, price: float) -> int:
+        """Convert a query price to its tick index."""
+        idx = self._locate(price)
+        if idx is None:
+            raise ValueError(f"Price {price} is not on the {self.tick_size} tick grid")
+        return idx
+
+    def _price(self, idx: int) -> float:
+        """Convert a tick index back to a price."""
+        return self._prices[idx]
+
+    def _skip(self, side: str, price: float) -> None:
+        """Log a level that cannot be placed on the grid."""
+        logger.warning(
+            f"Skipping {side} level at {price} for {self.asset_id[:20]}...: "
+            f"not on the {self.tick_size} tick grid"
+        )
+
+    # Level updates
+
+    def set_level(self, side: str, price: float, size: float) -> None:
+        """
+        Set the resting size at a price level.
+
+        A price on a finer listed tick refines the grid first; a price
+        off every grid is logged and skipped.
+
+        Args:
+            side: "BUY" for bids, "SELL" for asks
+            price: Level price
+            size: New size (0 removes the level)
+        """
+        if side != "BUY" and side != "SELL":
+            return
+
+        idx = self._locate(price)
+        if idx is None:
+            tick = grid_for((price,))
+            if tick < self.tick_size:
+                self.set_tick_size(tick)
+                idx = self._locate(price)
+            if idx is None:
+                self._skip(side, price)
+                return
+
+        bit = 1 << idx
+        if side == "BUY":
+            if size > 0:
+                self._bid_sizes[idx] = size
+                self._bid_bits |= bit
+            else:
+                self._bid_sizes[idx] = 0.0
+                self._bid_bits &= ~bit
+            levels = self._bids_cache
+            key = -self._price(idx)
+            sort_key = _bid_sort_key
+        else:
+            if size > 0:
+                self._ask_sizes[idx] = size
+                self._ask_bits |= bit
+            else:
+                self._ask_sizes[idx] = 0.0
+                self._ask_bits &= ~bit
+            levels = self._asks_cache
+            key = self._price(idx)
+            sort_key = _ask_sort_key
+
+        if levels is not None:
+            i = bisect_left(levels, key, key=sort_key)
+            found = i < len(levels) and sort_key(levels[i]) == key
+            if size > 0:
+                if found:
+                    levels[i].size = size
+                else:
+                    levels.insert(i, OrderbookLevel(price=self._price(idx), size=size))
+            elif found:
+                del levels[i]
+
+    def set_tick_size(self, tick_size: float) -> None:
+        """
+        Move the book to a finer tick grid.
+
+        Coarser ticks already fit on the current grid, and levels resting
+        at finer prices may outlive a change to a coarser tick, so only
+        refinements resize.
+
+        Args:
+            tick_size: The market's new tick size
+        """
+        if tick_size >= self.tick_size:
+            return
+        bids = [(self._price(i), self._bid_sizes[i]) for i in _iter_desc(self._bid_bits)]
+        asks = [(self._price(i), self._ask_sizes[i]) for i in _iter_asc(self._ask_bits)]
+        self._reset(tick_size)
+        for side, price in self._load(bids, asks):
+            self._skip(side, price)
+
+    def _load(
+        self,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+    ) -> List[Tuple[str, float]]:
+        """Fill an empty book from (price, size) pairs, returning the off-grid levels."""
+        off_grid: List[Tuple[str, float]] = []
+        self._bid_bits = self._fill("BUY", self._bid_sizes, bids, off_grid)
+        self._ask_bits = self._fill("SELL", self._ask_sizes, asks, off_grid)
+        return off_grid
+
+    def _fill(
+        self,
+        side: str,
+        sizes: array,
+        levels: Iterable[Tuple[float, float]],
+        off_grid: List[Tuple[str, float]],
+    ) -> int:
+        """Write levels into a size array, returning the populated bitmap."""
+        scale = self._scale
+        bits = 0
+        for price, size in levels:
+            scaled = price * scale
+            idx = int(round(scaled))
+            if not 0 <= idx <= scale or abs(idx - scaled) > 1e-6:
+                off_grid.append((side, price))
+            elif size > 0:
+                sizes[idx] = size
+                bits |= 1 << idx
+        return bits
+
+    def clear(self) -> None:
+        """Remove all levels."""
+        self._reset(self.tick_size)
+
+    def apply_price_change(self, change: "PriceChange", timestamp: int = 0) -> None:
+        """
+        Apply a price_change delta to the book in place.
+
+        Args:
+            change: Price change for this book's asset
+            timestamp: Exchange timestamp of the price_change message
+        """
+        self.set_level(change.side, change.price, change.size)
+
+        # Reconcile with the exchange's top of book
+        if change.best_bid > 0:
+            limit = self._locate(change.best_bid)
+            crossed = self._bid_bits >> (limit + 1) if limit is not None else 0
+            if crossed:
+                for idx in _iter_asc(crossed << (limit + 1)):
+                    self._bid_sizes[idx] = 0.0
+                self._bid_bits &= (1 << (limit + 1)) - 1
+                self._bids_cache = None
+        if 0 < change.best_ask < 1:
+            limit = self._locate(change.best_ask)
+            crossed = self._ask_bits & ((1 << limit) - 1) if limit is not None else 0
+            if crossed:
+                for idx in _iter_asc(crossed):
+                    self._ask_sizes[idx] = 0.0
+                self._ask_bits ^= crossed
+                self._asks_cache = None
+
+        if change.hash:
+            self.hash = change.hash
+        if timestamp:
+            self.timestamp = timestamp
+
+    # OrderbookSnapshot-compatible API
+
+    @property
+    def best_bid(self) -> float:
+        """Get best bid price."""
+        if not self._bid_bits:
+            return 0.0
+        return self._price(self._bid_bits.bit_length() - 1)
+
+    @property
+    def best_ask(self) -> float:
+        """Get best ask price."""
+        bits = self._ask_bits
+        if not bits:
+            return 1.0
+        return self._price((bits & -bits).bit_length() - 1)
+
+    @property
+    def mid_price(self) -> float:
+        """Get mid price."""
+        best_bid = self.best_bid
+        best_ask = self.best_ask
+        if best_bid > 0 and best_ask < 1:
+            return (best_bid + best_ask) / 2
+        elif best_bid > 0:
+            return best_bid
+        elif best_ask < 1:
+            return best_ask
+        return 0.5
+
+    @property
+    def bids(self) -> List[OrderbookLevel]:
+        """Get bid levels, best first."""
+        if self._bids_cache is None:
+            prices = self._prices
+            sizes = self._bid_sizes
+            self._bids_cache = [OrderbookLevel(prices[i], sizes[i]) for i in _iter_desc(self._bid_bits)]
+        return self._bids_cache
+
+    @property
+    def asks(self) -> List[OrderbookLevel]:
+        """Get ask levels, best first."""
+        if self._asks_cache is None:
+            prices = self._prices
+            sizes = self._ask_sizes
+            self._asks_cache = [OrderbookLevel(prices[i], sizes[i]) for i in _iter_asc(self._ask_bits)]
+        return self._asks_cache
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the REST /book response shape.
+
+        Levels are ordered like the exchange sends them: bids
+        ascending and asks descending, best price last.
+        """
+        return {
+            "market": self.market,
+            "asset_id": self.asset_id,
+            "timestamp": str(self.timestamp),
+            "hash": self.hash,
+            "tick_size": str(self.tick_size),
+            "bids": [{"price": str(level.price), "size": str(level.size)} for level in reversed(self.bids)],
+            "asks": [{"price": str(level.price), "size": str(level.size)} for level in reversed(self.asks)],
+        }
+
+    # Depth queries
+
+    def size_at(self, side: str, price: float) -> float:
+        """Get resting size at a single price level."""
+        sizes = self._bid_sizes if side == "BUY" else self._ask_sizes
+        return sizes[self._index(price)]
+
+    def _reachable(self, side: str, price: float) -> Tuple[array, int, int]:
+        """Get the size array and [start, stop) tick range a limit price reaches."""
+        idx = self._index(price)
+        if side == "BUY":
+            return self._bid_sizes, idx, self._bid_bits.bit_length()
+        bits = self._ask_bits
+        return self._ask_sizes, (bits & -bits).bit_length() - 1 if bits else idx + 1, idx + 1
+
+    def cumulative_size(self, side: str, price: float) -> float:
+        """
+        Get total size resting between the top of book and a price.
+
+        For bids this is the size at prices >= price, for asks the
+        size at prices <= price, i.e. what a marketable order limited
+        at that price could reach.
+
+        Args:
+            side: "BUY" for bids, "SELL" for asks
+            price: Limit price (inclusive)
+
+        Returns:
+            Cumulative size in shares
+        """
+        sizes, start, stop = self._reachable(side, price)
+        if start >= stop:
+            return 0.0
+        if NUMPY_AVAILABLE:
+            return float(numpy.frombuffer(sizes)[start:stop].sum())
+        bits = (self._bid_bits if side == "BUY" else self._ask_bits) >> start << start
+        bits &= (1 << stop) - 1
+        return sum(sizes[i] for i in _iter_asc(bits))
+
+    def cumulative_notional(self, side: str, price: float) -> float:
+        """
+        Get total USDC notional between the top of book and a price.
+
+        Args:
+            side: "BUY" for bids, "SELL" for asks
+            price: Limit price (inclusive)
+
+        Returns:
+            Sum of price * size over the reachable levels
+        """
+        sizes, start, stop = self._reachable(side, price)
+        if start >= stop:
+            return 0.0
+        if NUMPY_AVAILABLE:
+            ticks = numpy.arange(start, stop, dtype=numpy.float64)
+            return float(numpy.dot(numpy.frombuffer(sizes)[start:stop], ticks)) / self._scale
+        bits = (self._bid_bits if side == "BUY" else self._ask_bits) >> start << start
+        bits &= (1 << stop) - 1
+        return sum(sizes[i] * i for i in _iter_asc(bits)) / self._scale
+
+    @classmethod
+    def _from_levels(
+        cls,
+        bids: List[Tuple[float, float]],
+        asks: List[Tuple[float, float]],
+        tick_size: Optional[float],
+        **fields: Any,
+    ) -> "TickOrderbook":
+        """Build a book, inferring the tick grid from the levels if not given."""
+        book = cls(tick_size=tick_size or DEFAULT_TICK_SIZE, **fields)
+        off_grid = book._load(bids, asks)
+        if off_grid and tick_size is None:
+            # Most books fit the coarsest grid; only refine when they don't
+            tick = grid_for(price for _, price in off_grid)
+            if tick < book.tick_size:
+                book._reset(tick)
+                off_grid = book._load(bids, asks)
+        for side, price in off_grid:
+            book._skip(side, price)
+        return book
+
+    @classmethod
+    def from_message(
+        cls,
+        msg: Dict[str, Any],
+        tick_size: Optional[float] = None,
+    ) -> "TickOrderbook":
+        """
+        Create from WebSocket book message (or REST /book response).
+
+        The grid uses tick_size, else the message's own tick_size (REST
+        responses carry one), else the coarsest tick all levels fit on.
+        """
+        if tick_size is None and msg.get("tick_size"):
+            tick_size = float(msg["tick_size"])
+        return cls._from_levels(
+            [(float(b["price"]), float(b["size"])) for b in msg.get("bids", ())],
+            [(float(a["price"]), float(a["size"])) for a in msg.get("asks", ())],
+            tick_size,
+            asset_id=msg.get("asset_id", ""),
+            market=msg.get("market", ""),
+            timestamp=int(msg.get("timestamp", 0)),
+            hash=msg.get("hash", ""),
+        )
+
+    @classmethod
+    def from_event(
+        cls,
+        event: Any,
+        tick_size: Optional[float] = None,
+    ) -> "TickOrderbook":
+        """Create from a typed book event (levels already decoded)."""
+        return cls._from_levels(
+            [(level.price, level.size) for level in event.bids],
+            [(level.price, level.size) for level in event.asks],
+            tick_size,
+            asset_id=event.asset_id,
+            market=event.market,
+            timestamp=event.timestamp,
+            hash=event.hash,
+        )
@@ -0,0 +1,396 @@
+"""
+User WebSocket Module - Real-time Orders and Fills
+
+Provides an authenticated client for the Polymarket CLOB user channel:
+- Order placements, updates and cancellations
+- Trade fills and their settlement status
+- An always-current open-order cache
+
+Example:
+    from src.user_websocket import UserWebSocket
+
+    ws = UserWebSocket(api_creds)
+
+    @ws.on_trade
+    def handle_fill(trade):
+        print(f"Filled {trade.size} @ {trade.price} ({trade.status})")
+
+    await ws.run()
+"""
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+
+from . import codec
+from .websocket_client import WSS_USER_URL, _load_websockets
+
+if TYPE_CHECKING:
+    from websockets.client import WebSocketClientProtocol
+    from .client import ApiCredentials
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OrderEvent:
+    """Order placement, update or cancellation."""
+    id: str
+    asset_id: str
+    market: str
+    side: str
+    price: float
+    original_size: float
+    size_matched: float
+    type: str  # PLACEMENT, UPDATE or CANCELLATION
+    outcome: str = ""
+    owner: str = ""
+    timestamp: int = 0
+    associate_trades: List[str] = field(default_factory=list)
+
+    @property
+    def remaining_size(self) -> float:
+        """Size still resting on the book."""
+        return max(self.original_size - self.size_matched, 0.0)
+
+    @classmethod
+    def from_message(cls, msg: Dict[str, Any]) -> "OrderEvent":
+        """Create from user channel order message."""
+        return cls(
+            id=msg.get("id", ""),
+            asset_id=msg.get("asset_id", ""),
+            market=msg.get("market", ""),
+            side=msg.get("side", ""),
+            price=float(msg.get("price", 0)),
+            original_size=float(msg.get("original_size", 0)),
+            size_matched=float(msg.get("size_matched", 0)),
+            type=msg.get("type", ""),
+            outcome=msg.get("outcome", ""),
+            owner=msg.get("owner", ""),
+            timestamp=int(msg.get("timestamp", 0) or 0),
+            associate_trades=msg.get("associate_trades") or [],
+        )
+
+
+@dataclass
+class TradeEvent:
+    """Trade fill involving one of our orders."""
+    id: str
+    asset_id: str
+    market: str
+    side: str
+    price: float
+    size: float
+    status: str  # MATCHED, MINED, CONFIRMED, RETRYING or FAILED
+    outcome: str = ""
+    owner: str = ""
+    taker_order_id: str = ""
+    maker_orders: List[Dict[str, Any]] = field(default_factory=list)
+    timestamp: int = 0
+
+    @property
+    def order_ids(self) -> List[str]:
+        """All order IDs matched in this trade."""
+        ids = [m.get("order_id", "") for m in self.maker_orders]
+        if self.taker_order_id:
+            ids.append(self.taker_order_id)
+        return ids
+
+    @classmethod
+    def from_message(cls, msg: Dict[str, Any]) -> "TradeEvent":
+        """Create from user channel trade message."""
+        return cls(
+            id=msg.get("id", ""),
+            asset_id=msg.get("asset_id", ""),
+            market=msg.get("market", ""),
+            side=msg.get("side", ""),
+            price=float(msg.get("price", 0)),
+            size=float(msg.get("size", 0)),
+            status=msg.get("status", ""),
+            outcome=msg.get("outcome", ""),
+            owner=msg.get("owner", ""),
+            taker_order_id=msg.get("taker_order_id", ""),
+            maker_orders=msg.get("maker_orders") or [],
+            timestamp=int(msg.get("timestamp", 0) or 0),
+        )
+
+
+# Type aliases for callbacks
+OrderCallback = Callable[[OrderEvent], Union[None, Awaitable[None]]]
+UserTradeCallback = Callable[[TradeEvent], Union[None, Awaitable[None]]]
+OrdersFetcher = Callable[[], Union[List[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]]
+
+
+class UserWebSocket:
+    """
+    WebSocket client for the authenticated CLOB user channel.
+
+    Keeps a cache of open orders in the same shape as the REST
+    /data/orders response, so it can replace periodic polling. When
+    an orders_fetcher is given, the cache is reseeded from REST after
+    every (re)connect to cover events missed while disconnected.
+    """
+
+    def __init__(
+        self,
+        api_creds: "ApiCredentials",
+        markets: Optional[List[str]] = None,
+        url: str = WSS_USER_URL,
+        orders_fetcher: Optional[OrdersFetcher] = None,
+        reconnect_interval: float = 1.0,
+        max_reconnect_interval: float = 30.0,
+        ping_interval: float = 20.0,
+        ping_timeout: float = 10.0,
+    ):
+        """
+        Initialize user WebSocket client.
+
+        Args:
+            api_creds: L2 API credentials
+            markets: Condition IDs to filter on (default: all markets)
+            url: WebSocket endpoint URL
+            orders_fetcher: Callable returning REST open orders, used to
+                seed the cache after each connect; must raise on failure
+            reconnect_interval: Initial reconnect delay (backs off)
+            max_reconnect_interval: Upper bound on the reconnect delay
+            ping_interval: Seconds between ping messages
+            ping_timeout: Seconds to wait for pong response
+        """
+        self.api_creds = api_creds
+        self.markets = list(markets or [])
+        self.url = url
+        self.orders_fetcher = orders_fetcher
+        self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+
+        self._ws_connect, self._connection_closed = _load_websockets()
+
+        # Connection state
+        self._ws: Optional["WebSocketClientProtocol"] = None
+        self._running = False
+        self._connected = False
+        self._reconnect_attempts = 0
+
+        # Open orders by order ID; only trusted once seeded on this connection
+        self._open_orders: Dict[str, Dict[str, Any]] = {}
+        self._seeded = False
+
+        # Callbacks
+        self._on_order: Optional[OrderCallback] = None
+        self._on_trade: Optional[UserTradeCallback] = None
+        self._on_error: Optional[Callable[[Exception], None]] = None
+        self._on_connect: Optional[Callable[[], None]] = None
+        self._on_disconnect: Optional[Callable[[], None]] = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if connected and authenticated."""
+        return self._connected
+
+    @property
+    def orders_synced(self) -> bool:
+        """Check if connected with an open-order cache that can be trusted."""
+        return self._connected and (self._seeded or self.orders_fetcher is None)
+
+    @property
+    def open_orders(self) -> List[Dict[str, Any]]:
+        """Get open orders (REST /data/orders shape)."""
+        return list(self._open_orders.values())
+
+    def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Get a cached open order."""
+        return self._open_orders.get(order_id)
+
+    def seed_open_orders(self, orders: List[Dict[str, Any]]) -> None:
+        """Replace the open-order cache with a REST snapshot."""
+        self._open_orders = {o.get("id", ""): dict(o) for o in orders if o.get("id")}
+
+    # Callback decorators
+    def on_order(self, callback: OrderCallback) -> OrderCallback:
+        """Decorator to set order event callback."""
+        self._on_order = callback
+        return callback
+
+    def on_trade(self, callback: UserTradeCallback) -> UserTradeCallback:
+        """Decorator to set trade event callback."""
+        self._on_trade = callback
+        return callback
+
+    def on_error(self, callback: Callable[[Exception], None]) -> Callable[[Exception], None]:
+        """Decorator to set error callback."""
+        self._on_error = callback
+        return callback
+
+    def on_connect(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Decorator to set connect callback."""
+        self._on_connect = callback
+        return callback
+
+    def on_disconnect(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Decorator to set disconnect callback."""
+        self._on_disconnect = callback
+        return callback
+
+    async def connect(self) -> bool:
+        """
+        Connect and authenticate.
+
+        Returns:
+            True if connected successfully
+        """
+        try:
+            if self._ws_connect is None:
+                raise RuntimeError("websockets is not installed")
+
+            self._ws = await self._ws_connect(
+                self.url,
+                ping_interval=self.ping_interval,
+                ping_timeout=self.ping_timeout,
+            )
+            await self._ws.send(codec.dumps({
+                "auth": {
+                    "apiKey": self.api_creds.api_key,
+                    "secret": self.api_creds.secret,
+                    "passphrase": self.api_creds.passphrase,
+                },
+                "markets": self.markets,
+                "type": "user",
+            }))
+            logger.info(f"User WebSocket connected to {self.url}")
+            self._connected = True
+
+            await self._seed_from_rest()
+            if self._on_connect:
+                self._on_connect()
+            return True
+        except Exception as e:
+            logger.error(f"User WebSocket connection failed: {e}")
+            if self._on_error:
+                self._on_error(e)
+            return False
+
+    async def _seed_from_rest(self) -> None:
+        """
+        Reseed the open-order cache from REST, if configured.
+
+        On failure the previous cache is kept but marked unseeded, so
+        orders_synced stays False until a later connect seeds it.
+        """
+        self._seeded = False
+        if not self.orders_fetcher:
+            return
+        try:
+            result = self.orders_fetcher()
+            if asyncio.iscoroutine(result):
+                result = await result
+            self.seed_open_orders(result)
+            self._seeded = True
+        except Exception as e:
+            logger.warning(f"Failed to seed open orders, cache not trusted: {e}")
+
+    async def disconnect(self) -> None:
+        """Disconnect from WebSocket."""
+        self._running = False
+        self._connected = False
+        if self._ws:
+            await self._ws.close()
+            self._ws = None
+            logger.info("User WebSocket disconnected")
+            if self._on_disconnect:
+                self._on_disconnect()
+
+    async def _handle_message(self, data: Dict[str, Any]) -> None:
+        """Handle incoming user channel message."""
+        event_type = data.get("event_type", "")
+
+        if event_type == "order":
+            event = OrderEvent.from_message(data)
+            self._apply_order_event(event, data)
+            await self._run_callback(self._on_order, event, label="order")
+
+        elif event_type == "trade":
+            event = TradeEvent.from_message(data)
+            await self._run_callback(self._on_trade, event, label="trade")
+
+        else:
+            logger.debug(f"Unknown user event type: {event_type}")
+
+    def _apply_order_event(self, event: OrderEvent, data: Dict[str, Any]) -> None:
+        """Update the open-order cache from an order event."""
+        if event.type == "CANCELLATION" or (
+            event.original_size > 0 and event.size_matched >= event.original_size
+        ):
+            self._open_orders.pop(event.id, None)
+            return
+
+        order = self._open_orders.setdefault(event.id, {})
+        order.update({k: v for k, v in data.items() if k not in ("event_type", "type")})
+        order["status"] = "LIVE"
+
+    async def _run_callback(self, callback: Optional[Callable[..., Any]], *args: Any, label: str) -> None:
+        """Run a callback that may be sync or async, logging failures."""
+        if not callback:
+            return
+        try:
+            result = callback(*args)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error in user {label} callback: {e}")
+
+    async def _run_loop(self) -> None:
+        """Main message processing loop."""
+        while self._running and self._ws is not None:
+            try:
+                message = await self._ws.recv()
+                items = codec.decode_frames(message)
+                # Back off until the server actually delivers data
+                self._reconnect_attempts = 0
+                for item in items:
+                    if isinstance(item, dict):
+                        await self._handle_message(item)
+            except self._connection_closed as e:
+                logger.warning(f"User WebSocket connection closed: {e}")
+                break
+            except codec.DecodeError as e:
+                logger.error(f"Failed to parse user message: {e}")
+            except Exception as e:
+                logger.error(f"Error processing user message: {e}")
+                if self._on_error:
+                    self._on_error(e)
+
+    async def run(self, auto_reconnect: bool = True) -> None:
+        """
+        Run the user WebSocket client.
+
+        Args:
+            auto_reconnect: Whether to automatically reconnect on disconnect
+        """
+        self._running = True
+
+        while self._running:
+            if await self.connect():
+                await self._run_loop()
+                self._connected = False
+                if self._on_disconnect:
+                    self._on_disconnect()
+
+            if not (self._running and auto_reconnect):
+                break
+
+            ceiling = min(
+                self.max_reconnect_interval,
+                self.reconnect_interval * (2 ** min(self._reconnect_attempts, 16)),
+            )
+            self._reconnect_attempts += 1
+            delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+            logger.info(f"User WebSocket reconnecting in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+    def stop(self) -> None:
+        """Stop the client."""
+        self._running = False
@@ -0,0 +1,209 @@
+"""
+Warmer Module - Connection Pre-warming and Keep-alive
+
+Keeps connections to the CLOB host open so the first order after
+startup or an idle period skips DNS, TCP and TLS setup:
+- Opens N connections up front, on the shared async pool (httpx) or
+  one per order executor thread (requests fallback)
+- Sends cheap concurrent keep-alive requests every interval, so all
+  N pooled connections stay warm, not just one
+- Records time-to-first-byte of every probe
+
+Connections are opened with TCP_NODELAY (see src/http.py).
+
+Example:
+    from src.client import ClobClient
+    from src.warmer import ConnectionWarmer
+
+    client = ClobClient()
+    warmer = ConnectionWarmer(client, connections=4, interval=15.0)
+    await warmer.warm()
+    warmer.start()
+    ...
+    print(warmer.stats)
+    await warmer.stop()
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+from .client import ApiClient
+from .http import httpx
+from .latency import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionWarmer:
+    """
+    Pre-warms and keeps alive a client's pooled connections.
+
+    When the client has native async HTTP, probes go through its shared
+    AsyncClient; otherwise each probe runs on a distinct executor
+    thread so every thread-local session holds a warm connection.
+    """
+
+    def __init__(
+        self,
+        client: ApiClient,
+        connections: int = 4,
+        interval: float = 15.0,
+        path: str = "/",
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize connection warmer.
+
+        Args:
+            client: Client whose connections to warm
+            connections: Connections to open and keep alive
+            interval: Seconds between keep-alive rounds (keep below the
+                pool's 60s keep-alive expiry)
+            path: Cheap endpoint to probe
+            executor: Threads running sync requests (default: client.executor);
+                needs at least `connections` workers
+        """
+        self.client = client
+        self.connections = max(1, connections)
+        self.interval = interval
+        self.path = path
+        self.executor = executor or client.executor
+
+        # TTFB in microseconds
+        self.ttfb = LatencyHistogram()
+        self.last_ttfb_ms: Optional[float] = None
+        self.warm_connections = 0
+        self.rounds = 0
+        self.failures = 0
+
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def url(self) -> str:
+        """Probe URL."""
+        return f"{self.client.base_url}/{self.path.lstrip('/')}"
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the keep-alive task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def _probe_async(self) -> Optional[float]:
+        """Send one probe on the shared async pool; return TTFB in seconds."""
+        session = self.client._get_async_session()
+        await self.client.rate_limiter.acquire_async(self.client._rate_limit_class("GET", self.path))
+        start = time.perf_counter()
+        try:
+            async with session.stream("GET", self.url, timeout=self.client.timeout) as response:
+                ttfb = time.perf_counter() - start
+                # Read the body so the connection returns to the pool
+                await response.aread()
+            return ttfb
+        except httpx.HTTPError as e:
+            logger.debug(f"Keep-alive probe failed: {e}")
+            return None
+
+    def _probe_sync(self, barrier: threading.Barrier) -> Optional[float]:
+        """Send one probe on this thread's session; return TTFB in seconds."""
+        try:
+            # Hold the thread until all probes have one, so each lands on a different thread
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        self.client.rate_limiter.acquire(self.client._rate_limit_class("GET", self.path))
+        try:
+            response = self.client.session.get(self.url, timeout=self.client.timeout)
+            # elapsed runs from send until the response headers are parsed
+            return response.elapsed.total_seconds()
+        except Exception as e:
+            logger.debug(f"Keep-alive probe failed: {e}")
+            return None
+
+    async def ping(self) -> int:
+        """
+        Run one round of concurrent probes.
+
+        Returns:
+            Number of connections that answered
+        """
+        if self.client.async_available:
+            results: List[Optional[float]] = list(
+                await asyncio.gather(*(self._probe_async() for _ in range(self.connections)))
+            )
+        else:
+            loop = asyncio.get_running_loop()
+            barrier = threading.Barrier(self.connections, timeout=2.0)
+            results = list(
+                await asyncio.gather(*(
+                    loop.run_in_executor(self.executor, self._probe_sync, barrier)
+                    for _ in range(self.connections)
+                ))
+            )
+
+        answered = [ttfb for ttfb in results if ttfb is not None]
+        for ttfb in answered:
+            self.ttfb.record(ttfb * 1e6)
+        if answered:
+            self.last_ttfb_ms = answered[-1] * 1000
+        self.warm_connections = len(answered)
+        self.failures += len(results) - len(answered)
+        self.rounds += 1
+        return len(answered)
+
+    async def warm(self) -> int:
+        """
+        Open the connections now.
+
+        Returns:
+            Number of warm connections
+        """
+        warmed = await self.ping()
+        summary = self.ttfb.percentiles((50.0,))
+        logger.info(
+            f"Warmed {warmed}/{self.connections} connections to {self.client.base_url} "
+            f"(TTFB p50 {summary['p50'] / 1000:.1f}ms)"
+        )
+        return warmed
+
+    async def run(self) -> None:
+        """Send keep-alive rounds every interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                warmed = await self.ping()
+                if warmed < self.connections:
+                    logger.warning(f"Keep-alive: {warmed}/{self.connections} connections answered")
+            except Exception as e:
+                logger.warning(f"Keep-alive round failed: {e}")
+
+    def start(self) -> None:
+        """Start the keep-alive task (no-op if running or interval <= 0)."""
+        if self.interval <= 0 or self.is_running:
+            return
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the keep-alive task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get warm connection count and TTFB percentiles (ms)."""
+        return {
+            "warm_connections": self.warm_connections,
+            "rounds": self.rounds,
+            "failures": self.failures,
+            "last_ttfb_ms": self.last_ttfb_ms,
+            "ttfb_ms": {key: value / 1000 for key, value in self.ttfb.percentiles().items()},
+        }
@@ -18,18 +18,36 @@ Example:
     await ws.run()
 """
 
-import json
 import asyncio
+import itertools
 import logging
-from typing import Optional, Dict, Any, List, Callable, Set, Union, Awaitable, TYPE_CHECKING
+import random
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import partial
+from typing import Optional, Dict, Any, List, Callable, Hashable, Set, Tuple, Type, Union, Awaitable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from . import codec
+from .clock import ClockSync, get_clock
+from .latency import (
+    EXCHANGE_TO_RECEIVE,
+    RECEIVE_TO_CALLBACK,
+    RECEIVE_TO_DECODED,
+    LatencyRecorder,
+)
+
 if TYPE_CHECKING:
     from websockets.client import WebSocketClientProtocol
+    from .recorder import MarketDataRecorder
 
 logger = logging.getLogger(__name__)
 
 
+# Per-process client IDs, used to label recorded connections
+_client_ids = itertools.count(1)
+
 # WebSocket endpoints
 WSS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 WSS_USER_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
@@ -56,6 +74,16 @@ class OrderbookLevel:
     size: float
 
 
+def _bid_sort_key(level: OrderbookLevel) -> float:
+    """Sort key keeping bids in descending price order."""
+    return -level.price
+
+
+def _ask_sort_key(level: OrderbookLevel) -> float:
+    """Sort key keeping asks in ascending price order."""
+    return level.price
+
+
 @dataclass
 class OrderbookSnapshot:
     """Complete orderbook snapshot."""
@@ -90,14 +118,9 @@ class OrderbookSnapshot:
     @classmethod
     def from_message(cls, msg: Dict[str, Any]) -> "OrderbookSnapshot":
         """Create from WebSocket book message."""
-        bids = [
-            OrderbookLevel(price=float(b["price"]), size=float(b["size"]))
-            for b in msg.get("bids", [])
-        ]
-        asks = [
-            OrderbookLevel(price=float(a["price"]), size=float(a["size"]))
-            for a in msg.get("asks", [])
-        ]
+        level = OrderbookLevel
+        bids = [level(float(b["price"]), float(b["size"])) for b in msg.get("bids", ())]
+        asks = [level(float(a["price"]), float(a["size"])) for a in msg.get("asks", ())]
         # Sort bids descending, asks ascending
         bids.sort(key=lambda x: x.price, reverse=True)
         asks.sort(key=lambda x: x.price)
@@ -111,6 +134,84 @@ class OrderbookSnapshot:
             hash=msg.get("hash", ""),
         )
 
+    @classmethod
+    def from_event(cls, event: Any) -> "OrderbookSnapshot":
+        """Create from a typed book event (levels already decoded)."""
+        bids = event.bids
+        asks = event.asks
+        bids.sort(key=_bid_sort_key)
+        asks.sort(key=_ask_sort_key)
+
+        return cls(
+            asset_id=event.asset_id,
+            market=event.market,
+            timestamp=event.timestamp,
+            bids=bids,
+            asks=asks,
+            hash=event.hash,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the REST /book response shape.
+
+        Levels are ordered like the exchange sends them: bids
+        ascending and asks descending, best price last.
+        """
+        return {
+            "market": self.market,
+            "asset_id": self.asset_id,
+            "timestamp": str(self.timestamp),
+            "hash": self.hash,
+            "bids": [{"price": str(level.price), "size": str(level.size)} for level in reversed(self.bids)],
+            "asks": [{"price": str(level.price), "size": str(level.size)} for level in reversed(self.asks)],
+        }
+
+    def apply_price_change(self, change: "PriceChange", timestamp: int = 0) -> None:
+        """
+        Apply a price_change delta to the book in place.
+
+        Only the touched level is inserted, resized or removed (size 0),
+        so both sides stay sorted without rebuilding the level lists.
+        Levels that cross the top of book reported by the exchange are
+        dropped afterwards.
+
+        Args:
+            change: Price change for this book's asset
+            timestamp: Exchange timestamp of the price_change message
+        """
+        price = change.price
+        if change.side == "BUY":
+            levels = self.bids
+            i = bisect_left(levels, -price, key=_bid_sort_key)
+        elif change.side == "SELL":
+            levels = self.asks
+            i = bisect_left(levels, price, key=_ask_sort_key)
+        else:
+            return
+
+        found = i < len(levels) and levels[i].price == price
+        if change.size > 0:
+            if found:
+                levels[i].size = change.size
+            else:
+                levels.insert(i, OrderbookLevel(price=price, size=change.size))
+        elif found:
+            del levels[i]
+
+        # Reconcile with the exchange's top of book
+        if change.best_bid > 0:
+            while self.bids and self.bids[0].price > change.best_bid:
+                del self.bids[0]
+        if 0 < change.best_ask < 1:
+            while self.asks and self.asks[0].price < change.best_ask:
+                del self.asks[0]
+
+        if change.hash:
+            self.hash = change.hash
+        if timestamp:
+            self.timestamp = timestamp
+
 
 @dataclass
 class PriceChange:
@@ -162,7 +263,125 @@ class LastTradePrice:
         )
 
 
+if codec.MSGSPEC_AVAILABLE:
+    import msgspec
+
+    class _BookEvent(msgspec.Struct, tag_field="event_type", tag="book"):
+        """book message, decoded straight into levels."""
+        asset_id: str = ""
+        market: str = ""
+        timestamp: int = 0
+        hash: str = ""
+        bids: List[OrderbookLevel] = []
+        asks: List[OrderbookLevel] = []
+
+    class _PriceChangeEvent(msgspec.Struct, tag_field="event_type", tag="price_change"):
+        """price_change message, decoded straight into PriceChanges."""
+        market: str = ""
+        timestamp: int = 0
+        price_changes: List[PriceChange] = []
+
+    class _TradeEvent(msgspec.Struct, tag_field="event_type", tag="last_trade_price"):
+        """last_trade_price message."""
+        asset_id: str = ""
+        market: str = ""
+        price: float = 0.0
+        size: float = 0.0
+        side: str = ""
+        timestamp: int = 0
+        fee_rate_bps: int = 0
+
+    _MarketEvent = Union[_BookEvent, _PriceChangeEvent, _TradeEvent]
+
+    # Frames are one event or an array of events; anything else (other
+    # event types, unexpected shapes) falls back to dict decoding
+    _decode_typed_frame = codec.typed_decoder(Union[List[_MarketEvent], _MarketEvent])
+else:
+    _decode_typed_frame = None
+
+
+def _event_type(event: Any) -> str:
+    """Get the event_type of a decoded event (dict or typed)."""
+    if isinstance(event, dict):
+        return event.get("event_type", "")
+    config = getattr(event, "__struct_config__", None)
+    return config.tag if config is not None else ""
+
+
+class ConflatingQueue:
+    """
+    Bounded event queue with per-key conflation.
+
+    Putting an item under a key that is already pending replaces the
+    pending item and moves it to the back of the queue, so a slow
+    consumer only ever sees the latest value per key, and never before
+    items queued ahead of that value. When the queue is full the oldest
+    pending item is dropped. Both kinds of drop are counted, overflow
+    drops per item kind.
+    """
+
+    def __init__(self, maxsize: int = 10000, on_overflow: Optional[Callable[[str, Any], None]] = None):
+        """
+        Initialize queue.
+
+        Args:
+            maxsize: Maximum number of pending items
+            on_overflow: Called with (kind, item) for every item dropped
+                because the queue was full
+        """
+        self.maxsize = maxsize
+        self.on_overflow = on_overflow
+        self._items: "OrderedDict[Hashable, Tuple[str, Any]]" = OrderedDict()
+        # Created on first get() so it binds to the consumer's loop
+        self._ready: Optional[asyncio.Event] = None
+        self.conflated = 0
+        self.overflowed = 0
+        self.dropped: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, key: Hashable, item: Any, kind: str = "") -> None:
+        """
+        Add an item, replacing any pending item with the same key.
+
+        Args:
+            key: Conflation key
+            item: Item to queue
+            kind: Item kind, used to count overflow drops
+        """
+        items = self._items
+        if key in items:
+            items[key] = (kind, item)
+            items.move_to_end(key)
+            self.conflated += 1
+        else:
+            if len(items) >= self.maxsize:
+                dropped_kind, dropped = items.popitem(last=False)[1]
+                self.overflowed += 1
+                self.dropped[dropped_kind] = self.dropped.get(dropped_kind, 0) + 1
+                if self.on_overflow is not None:
+                    self.on_overflow(dropped_kind, dropped)
+            items[key] = (kind, item)
+        if self._ready is not None:
+            self._ready.set()
+
+    async def get(self) -> Any:
+        """Wait for and remove the oldest pending item."""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popitem(last=False)[1][1]
+
+    def clear(self) -> None:
+        """Drop all pending items."""
+        self._items.clear()
+
+
 # Type aliases for callbacks
+BookFetcher = Callable[[str], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
 BookCallback = Callable[[OrderbookSnapshot], Union[None, Awaitable[None]]]
 PriceChangeCallback = Callable[[str, List[PriceChange]], Union[None, Awaitable[None]]]
 TradeCallback = Callable[[LastTradePrice], Union[None, Awaitable[None]]]
@@ -195,31 +414,91 @@ class MarketWebSocket:
         reconnect_interval: float = 5.0,
         ping_interval: float = 20.0,
         ping_timeout: float = 10.0,
+        book_type: Type[Any] = OrderbookSnapshot,
+        subscribe_chunk_size: int = 100,
+        max_pending_events: int = 10000,
+        max_reconnect_interval: float = 30.0,
+        book_fetcher: Optional[BookFetcher] = None,
+        max_concurrent_resyncs: int = 8,
+        recorder: Optional["MarketDataRecorder"] = None,
+        latency: Optional[LatencyRecorder] = None,
+        clock: Optional[ClockSync] = None,
+        manage_clock: bool = True,
     ):
         """
         Initialize WebSocket client.
 
         Args:
             url: WebSocket endpoint URL
-            reconnect_interval: Seconds between reconnection attempts
+            reconnect_interval: Initial reconnect delay; doubles (with
+                jitter) on each reconnect until a message is received
             ping_interval: Seconds between ping messages
             ping_timeout: Seconds to wait for pong response
+            book_type: Orderbook class used for the cache; must provide
+                from_message(), apply_price_change() and to_dict() (e.g. TickOrderbook),
+                and from_event() to take typed events when msgspec is installed
+            subscribe_chunk_size: Maximum asset IDs per subscription message
+            max_pending_events: Bound on events waiting for callbacks; book
+                events conflate per asset, and the oldest event is dropped when
+                full (counted per type, dropped trades are logged)
+            max_reconnect_interval: Upper bound on the reconnect delay
+            book_fetcher: Callable returning a REST /book response for an
+                asset ID, used to resync stale books (defaults to ClobClient)
+            max_concurrent_resyncs: Maximum REST resyncs in flight
+            recorder: Optional MarketDataRecorder that receives every raw
+                frame with its receive time and connection ID
+            latency: LatencyRecorder for exchange-to-receive, decode and
+                callback latencies (one is created if not given)
+            clock: Server clock used for exchange-to-receive latency
+                (default: shared clock)
+            manage_clock: Start the clock's periodic sync while running (if
+                nobody else has); False when an owner such as a pool does it
         """
         self.url = url
         self.reconnect_interval = reconnect_interval
+        self.max_reconnect_interval = max_reconnect_interval
         self.ping_interval = ping_interval
         self.ping_timeout = ping_timeout
+        self.book_type = book_type
+        self.subscribe_chunk_size = subscribe_chunk_size
 
         self._ws_connect, self._connection_closed = _load_websockets()
 
+        # Hot events skip the dict stage when msgspec is available
+        self._decode_typed = _decode_typed_frame if hasattr(book_type, "from_event") else None
+
         # Connection state
         self._ws: Optional["WebSocketClientProtocol"] = None
         self._running = False
         self._subscribed_assets: Set[str] = set()
+        self._client_id = next(_client_ids)
+        self._connection_count = 0
+
+        # Raw frame capture and latency histograms
+        self.recorder = recorder
+        self.latency = latency if latency is not None else LatencyRecorder()
+        self.clock = clock or get_clock()
+        self.manage_clock = manage_clock
 
         # Orderbook cache
         self._orderbooks: Dict[str, OrderbookSnapshot] = {}
 
+        # Book health: last good update (wall clock) and stale assets
+        self._last_good_update: Dict[str, float] = {}
+        self._stale_assets: Set[str] = set()
+        self._reconnect_attempts = 0
+
+        # REST resync of stale or inconsistent books
+        self._book_fetcher = book_fetcher
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self.max_concurrent_resyncs = max_concurrent_resyncs
+        self._resync_limit: Optional[asyncio.Semaphore] = None
+
+        # Events waiting for callbacks, drained by the dispatch task
+        self._events = ConflatingQueue(maxsize=max_pending_events, on_overflow=self._on_event_dropped)
+        self._event_seq = itertools.count()
+        self._dispatch_task: Optional[asyncio.Task] = None
+
         # Callbacks
         self._on_book: Optional[BookCallback] = None
         self._on_price_change: Optional[PriceChangeCallback] = None
@@ -245,6 +524,11 @@ class MarketWebSocket:
             except AttributeError:
                 return False
 
+    @property
+    def connection_id(self) -> str:
+        """Get ID of the current connection ("<client>:<connection>")."""
+        return f"{self._client_id}:{self._connection_count}"
+
     @property
     def orderbooks(self) -> Dict[str, OrderbookSnapshot]:
         """Get cached orderbooks."""
@@ -254,6 +538,62 @@ class MarketWebSocket:
         """Get cached orderbook for asset."""
         return self._orderbooks.get(asset_id)
 
+    def is_stale(self, asset_id: str) -> bool:
+        """Check if an asset's cached book can't be trusted right now."""
+        return asset_id in self._stale_assets or asset_id not in self._orderbooks
+
+    def last_good_update(self, asset_id: str) -> float:
+        """Get wall-clock time of the last verified update (0 if none)."""
+        return self._last_good_update.get(asset_id, 0.0)
+
+    @property
+    def last_good_updates(self) -> Dict[str, float]:
+        """Get last verified update times for all assets."""
+        return dict(self._last_good_update)
+
+    def live_book(self, asset_id: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the live book in REST /book shape, if it can be trusted.
+
+        Usable as ClobClient's book_source.
+
+        Args:
+            asset_id: Asset ID
+            max_age: Also require a verified update within this many seconds
+
+        Returns:
+            Book dict, or None if disconnected, stale or too old
+        """
+        if not self.is_connected or self.is_stale(asset_id):
+            return None
+        if max_age is not None and time.time() - self.last_good_update(asset_id) > max_age:
+            return None
+        return self._orderbooks[asset_id].to_dict()
+
+    def _on_event_dropped(self, label: str, event: Any) -> None:
+        """Report an event the callback queue had to drop."""
+        count = self._events.dropped[label]
+        if label == "trade":
+            trade = event[1][0]
+            logger.warning(
+                f"Callback queue full, dropped trade {trade.asset_id[:20]}... "
+                f"{trade.side} {trade.size}@{trade.price} ({count} trades dropped)"
+            )
+        elif count == 1 or count % 1000 == 0:
+            logger.warning(f"Callback queue full, dropped {count} {label} events so far")
+
+    @property
+    def dispatch_stats(self) -> Dict[str, int]:
+        """Get callback queue depth and drop counters."""
+        stats = {
+            "pending": len(self._events),
+            "conflated": self._events.conflated,
+            "overflowed": self._events.overflowed,
+        }
+        for label, count in self._events.dropped.items():
+            stats[f"dropped_{label}"] = count
+        return stats
+
     def get_mid_price(self, asset_id: str) -> float:
         """Get mid price for asset."""
         ob = self._orderbooks.get(asset_id)
@@ -306,7 +646,8 @@ class MarketWebSocket:
                 ping_interval=self.ping_interval,
                 ping_timeout=self.ping_timeout,
             )
-            logger.info(f"WebSocket connected to {self.url}")
+            self._connection_count += 1
+            logger.info(f"WebSocket connected to {self.url} (connection {self.connection_id})")
             if self._on_connect:
                 self._on_connect()
             return True
@@ -344,6 +685,8 @@ class MarketWebSocket:
             # Clear old subscriptions and cached data
             self._subscribed_assets.clear()
             self._orderbooks.clear()
+            self._last_good_update.clear()
+            self._stale_assets.clear()
 
         self._subscribed_assets.update(asset_ids)
         logger.info(f"subscribe() called with {len(asset_ids)} assets, is_connected={self.is_connected}, ws={self._ws is not None}")
@@ -353,15 +696,16 @@ class MarketWebSocket:
             logger.info("Not connected yet, will subscribe after connect")
             return True
 
-        subscribe_msg = {
-            "assets_ids": asset_ids,
-            "type": "MARKET",
-        }
-
         try:
-            msg_json = json.dumps(subscribe_msg)
-            logger.info(f"Sending subscribe message: {msg_json[:200]}")
-            await self._ws.send(msg_json)
+            for i, chunk in enumerate(self._chunk_assets(asset_ids)):
+                # First chunk opens the MARKET subscription, the rest extend it
+                if i == 0:
+                    subscribe_msg = {"assets_ids": chunk, "type": "MARKET"}
+                else:
+                    subscribe_msg = {"assets_ids": chunk, "operation": "subscribe"}
+                msg_json = codec.dumps(subscribe_msg)
+                logger.info(f"Sending subscribe message: {msg_json[:200]}")
+                await self._ws.send(msg_json)
             logger.info(f"Subscribed to {len(asset_ids)} assets successfully")
             return True
         except Exception as e:
@@ -388,13 +732,8 @@ class MarketWebSocket:
         if not self.is_connected:
             return True
 
-        subscribe_msg = {
-            "assets_ids": asset_ids,
-            "operation": "subscribe",
-        }
-
         try:
-            await self._ws.send(json.dumps(subscribe_msg))
+            await self._send_operation(asset_ids, "subscribe")
             logger.info(f"Subscribed to {len(asset_ids)} additional assets")
             return True
         except Exception as e:
@@ -411,59 +750,288 @@ class MarketWebSocket:
         Returns:
             True if unsubscription sent successfully
         """
-        if not self.is_connected or not asset_ids:
+        if not asset_ids:
             return False
 
         self._subscribed_assets.difference_update(asset_ids)
 
-        unsubscribe_msg = {
-            "assets_ids": asset_ids,
-            "operation": "unsubscribe",
-        }
+        if not self.is_connected:
+            # Dropped from the set, so it won't be resubscribed on connect
+            return True
 
         try:
-            await self._ws.send(json.dumps(unsubscribe_msg))
+            await self._send_operation(asset_ids, "unsubscribe")
             logger.info(f"Unsubscribed from {len(asset_ids)} assets")
             return True
         except Exception as e:
             logger.error(f"Failed to unsubscribe: {e}")
             return False
 
-    async def _handle_message(self, data: Dict[str, Any]) -> None:
-        """Handle incoming WebSocket message."""
+    async def set_subscriptions(self, asset_ids: List[str]) -> bool:
+        """
+        Change the subscription set by sending only the differences.
+
+        Assets that stay subscribed keep their cached books; removed
+        assets are unsubscribed and evicted.
+
+        Args:
+            asset_ids: Complete set of token IDs to be subscribed to
+
+        Returns:
+            True if all subscription messages were sent successfully
+        """
+        target = set(asset_ids)
+        added = [a for a in dict.fromkeys(asset_ids) if a not in self._subscribed_assets]
+        removed = [a for a in self._subscribed_assets if a not in target]
+
+        ok = True
+        # Add before removing so the connection never sits unsubscribed
+        if added:
+            if self._subscribed_assets:
+                ok = await self.subscribe_more(added)
+            else:
+                ok = await self.subscribe(added)
+        if removed:
+            ok = await self.unsubscribe(removed) and ok
+            self.evict(removed)
+
+        if added or removed:
+            logger.info(f"Subscriptions updated: +{len(added)} -{len(removed)} ({len(self._subscribed_assets)} total)")
+        return ok
+
+    def evict(self, asset_ids: List[str]) -> None:
+        """
+        Drop cached books and health state for assets.
+
+        Args:
+            asset_ids: Token IDs to evict
+        """
+        for asset_id in asset_ids:
+            self._orderbooks.pop(asset_id, None)
+            self._last_good_update.pop(asset_id, None)
+            self._stale_assets.discard(asset_id)
+            task = self._resync_tasks.pop(asset_id, None)
+            if task is not None:
+                task.cancel()
+
+    def _chunk_assets(self, asset_ids: List[str]) -> List[List[str]]:
+        """Split asset IDs into subscription-sized chunks."""
+        size = max(1, self.subscribe_chunk_size)
+        return [asset_ids[i:i + size] for i in range(0, len(asset_ids), size)]
+
+    async def _send_operation(self, asset_ids: List[str], operation: str) -> None:
+        """Send a subscribe/unsubscribe operation in chunks."""
+        for chunk in self._chunk_assets(asset_ids):
+            await self._ws.send(codec.dumps({"assets_ids": chunk, "operation": operation}))
+
+    def _decode(self, message: Union[str, bytes]) -> List[Any]:
+        """Decode a frame into typed events, or event dicts as a fallback."""
+        if self._decode_typed is not None:
+            try:
+                events = self._decode_typed(message)
+                return events if isinstance(events, list) else [events]
+            except codec.TypedDecodeError:
+                pass
+        return codec.decode_frames(message)
+
+    def _handle_message(self, data: Any, received_at: float = 0.0, received_mono: float = 0.0) -> None:
+        """
+        Handle incoming WebSocket message.
+
+        Updates the orderbook cache immediately and queues the event for
+        the dispatch task, so callbacks never hold up the receive loop.
+
+        Args:
+            data: Decoded event (dict, or typed event from _decode())
+            received_at: Receive time of the frame on the server clock (0 = unknown)
+            received_mono: perf_counter() receive time of the frame
+        """
+        if not isinstance(data, dict):
+            if self._decode_typed is not None:
+                self._handle_typed_event(data, received_at, received_mono)
+            return
+
         event_type = data.get("event_type", "")
-        logger.debug(f"Received event: {event_type}, keys: {list(data.keys())}")
 
         if event_type == "book":
-            snapshot = OrderbookSnapshot.from_message(data)
-            self._orderbooks[snapshot.asset_id] = snapshot
-            logger.debug(f"Book update for {snapshot.asset_id[:20]}...: mid={snapshot.mid_price:.4f}")
-            await self._run_callback(self._on_book, snapshot, label="book")
+            self._handle_book(self.book_type.from_message(data), received_at, received_mono)
 
         elif event_type == "price_change":
-            market = data.get("market", "")
             changes = [
                 PriceChange.from_dict(pc)
                 for pc in data.get("price_changes", [])
             ]
-            await self._run_callback(
-                self._on_price_change,
-                market,
-                changes,
-                label="price_change",
+            self._handle_price_changes(
+                data.get("market", ""), int(data.get("timestamp", 0) or 0), changes, received_at, received_mono
             )
 
         elif event_type == "last_trade_price":
-            trade = LastTradePrice.from_message(data)
-            await self._run_callback(self._on_trade, trade, label="trade")
+            self._handle_trade(LastTradePrice.from_message(data), received_at, received_mono)
 
         elif event_type == "tick_size_change":
-            # Log but don't handle specially
             logger.debug(f"Tick size change: {data}")
+            book = self._orderbooks.get(data.get("asset_id", ""))
+            if book is not None and hasattr(book, "set_tick_size") and data.get("new_tick_size"):
+                book.set_tick_size(float(data["new_tick_size"]))
 
         else:
             logger.debug(f"Unknown event type: {event_type}")
 
+    def _handle_typed_event(self, event: Any, received_at: float, received_mono: float) -> None:
+        """Handle an event decoded straight into a typed struct."""
+        if isinstance(event, _BookEvent):
+            self._handle_book(self.book_type.from_event(event), received_at, received_mono)
+        elif isinstance(event, _PriceChangeEvent):
+            self._handle_price_changes(event.market, event.timestamp, event.price_changes, received_at, received_mono)
+        elif isinstance(event, _TradeEvent):
+            trade = LastTradePrice(
+                asset_id=event.asset_id,
+                market=event.market,
+                price=event.price,
+                size=event.size,
+                side=event.side,
+                timestamp=event.timestamp,
+                fee_rate_bps=event.fee_rate_bps,
+            )
+            self._handle_trade(trade, received_at, received_mono)
+
+    def _handle_book(self, snapshot: Any, received_at: float, received_mono: float) -> None:
+        """Cache a book snapshot and queue it for callbacks."""
+        self._orderbooks[snapshot.asset_id] = snapshot
+        self._mark_good(snapshot.asset_id)
+        self._record_exchange_latency("book", snapshot.asset_id, snapshot.timestamp, received_at)
+        # Only the latest book per asset is worth delivering
+        self._events.put(
+            ("book", snapshot.asset_id),
+            ("book", (snapshot,), "book", snapshot.asset_id, received_mono),
+            "book",
+        )
+
+    def _handle_price_changes(
+        self,
+        market: str,
+        timestamp: int,
+        changes: List[PriceChange],
+        received_at: float,
+        received_mono: float,
+    ) -> None:
+        """Apply price changes to the cache and queue them for callbacks."""
+        self._apply_price_changes(changes, timestamp)
+        for change in changes:
+            self._record_exchange_latency("price_change", change.asset_id, timestamp, received_at)
+        self._events.put(
+            next(self._event_seq),
+            ("price_change", (market, changes), "price_change", market, received_mono),
+            "price_change",
+        )
+
+    def _handle_trade(self, trade: LastTradePrice, received_at: float, received_mono: float) -> None:
+        """Queue a trade for callbacks."""
+        self._record_exchange_latency("last_trade_price", trade.asset_id, trade.timestamp, received_at)
+        self._events.put(
+            next(self._event_seq),
+            ("trade", (trade,), "last_trade_price", trade.asset_id, received_mono),
+            "trade",
+        )
+
+    def _record_exchange_latency(self, event_type: str, asset_id: str, timestamp: int, received_at: float) -> None:
+        """Record exchange timestamp (ms) to local receive latency."""
+        if timestamp and received_at:
+            self.latency.record(EXCHANGE_TO_RECEIVE, event_type, asset_id, (received_at * 1000.0 - timestamp) * 1000.0)
+
+    def _apply_price_changes(self, changes: List[PriceChange], timestamp: int) -> None:
+        """Apply price_change deltas to the cached orderbooks."""
+        for change in changes:
+            book = self._orderbooks.get(change.asset_id)
+            # Deltas are meaningless until the first full snapshot arrives
+            if book is None:
+                continue
+            # Older than the cached book (e.g. a fresher REST resync)
+            if timestamp and timestamp < book.timestamp:
+                continue
+            # Book already carries this update
+            if change.hash and change.hash == book.hash:
+                continue
+
+            book.apply_price_change(change, timestamp)
+
+            if self._top_of_book_matches(book, change):
+                if change.asset_id not in self._stale_assets:
+                    self._last_good_update[change.asset_id] = time.time()
+            else:
+                # A level we never saw is at the top: an update was missed
+                logger.warning(
+                    f"Book gap detected for {change.asset_id[:20]}...: "
+                    f"local {book.best_bid}/{book.best_ask}, "
+                    f"exchange {change.best_bid}/{change.best_ask}"
+                )
+                self._stale_assets.add(change.asset_id)
+                self._schedule_resync(change.asset_id)
+
+    @staticmethod
+    def _top_of_book_matches(book: Any, change: PriceChange) -> bool:
+        """Check the local top of book against the exchange's."""
+        if change.best_bid > 0 and abs(book.best_bid - change.best_bid) > 1e-9:
+            return False
+        if 0 < change.best_ask < 1 and abs(book.best_ask - change.best_ask) > 1e-9:
+            return False
+        return True
+
+    def _mark_good(self, asset_id: str) -> None:
+        """Record a verified full update for an asset."""
+        self._stale_assets.discard(asset_id)
+        self._last_good_update[asset_id] = time.time()
+
+    def _schedule_resync(self, asset_id: str) -> None:
+        """Start a REST resync for an asset unless one is in flight."""
+        task = self._resync_tasks.get(asset_id)
+        if task is None or task.done():
+            self._resync_tasks[asset_id] = asyncio.create_task(self._resync(asset_id))
+
+    async def _fetch_book(self, asset_id: str) -> Dict[str, Any]:
+        """Fetch a REST /book snapshot for an asset."""
+        if self._book_fetcher is None:
+            from .client import ClobClient
+            # Resyncs need a snapshot taken now, never a cached one
+            self._book_fetcher = partial(ClobClient().aget_order_book, fresh=True)
+
+        fetcher = self._book_fetcher
+        if asyncio.iscoroutinefunction(fetcher):
+            return await fetcher(asset_id)
+        # Plain callables are blocking HTTP calls
+        result = await asyncio.to_thread(fetcher, asset_id)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    async def _resync(self, asset_id: str) -> None:
+        """Replace a stale book with a REST snapshot."""
+        if self._resync_limit is None:
+            self._resync_limit = asyncio.Semaphore(self.max_concurrent_resyncs)
+
+        try:
+            async with self._resync_limit:
+                data = await self._fetch_book(asset_id)
+        except Exception as e:
+            logger.error(f"Book resync failed for {asset_id[:20]}...: {e}")
+            return
+        finally:
+            self._resync_tasks.pop(asset_id, None)
+
+        if asset_id not in self._subscribed_assets or not data:
+            return
+
+        snapshot = self.book_type.from_message(data)
+        current = self._orderbooks.get(asset_id)
+        # A WebSocket snapshot may have landed while the request was in flight
+        if current is not None and asset_id not in self._stale_assets and current.timestamp > snapshot.timestamp:
+            return
+
+        self._orderbooks[asset_id] = snapshot
+        self._mark_good(asset_id)
+        self._events.put(("book", asset_id), ("book", (snapshot,), "book", asset_id, 0.0), "book")
+        logger.info(f"Resynced book for {asset_id[:20]}... from REST")
+
     async def _run_callback(self, callback: Optional[Callable[..., Any]], *args: Any, label: str) -> None:
         """Run a callback that may be sync or async, logging failures."""
         if not callback:
@@ -475,36 +1043,57 @@ class MarketWebSocket:
         except Exception as e:
             logger.error(f"Error in {label} callback: {e}")
 
+    async def _dispatch_loop(self) -> None:
+        """Deliver queued events to callbacks."""
+        while True:
+            label, args, event_type, key, received_mono = await self._events.get()
+            if label == "book":
+                callback = self._on_book
+            elif label == "price_change":
+                callback = self._on_price_change
+            else:
+                callback = self._on_trade
+            await self._run_callback(callback, *args, label=label)
+            # REST resyncs carry no receive time
+            if received_mono:
+                self.latency.record(
+                    RECEIVE_TO_CALLBACK, event_type, key,
+                    (time.perf_counter() - received_mono) * 1e6,
+                )
+
     async def _run_loop(self) -> None:
-        """Main message processing loop."""
+        """Main message receive loop."""
         msg_count = 0
         while self._running and self.is_connected:
             try:
-                message = await asyncio.wait_for(
-                    self._ws.recv(),
-                    timeout=self.ping_interval + 5
-                )
+                # Liveness is covered by the protocol-level ping/pong
+                message = await self._ws.recv()
+                received_mono = time.perf_counter()
+                received_at = self.clock.now()
+                if self.recorder is not None:
+                    self.recorder.record(message, self.connection_id, received_mono, received_at)
                 msg_count += 1
 
                 # Log first 5 messages, then every 1000
                 if msg_count <= 5 or msg_count % 1000 == 0:
                     logger.info(f"WS message #{msg_count}: {message[:200] if len(message) > 200 else message}")
 
-                data = json.loads(message)
-
-                # Handle array of messages
-                if isinstance(data, list):
-                    for item in data:
-                        await self._handle_message(item)
-                else:
-                    await self._handle_message(data)
+                items = self._decode(message)
+                # Back off until the server actually delivers data, so one
+                # that accepts and drops connections isn't hammered
+                self._reconnect_attempts = 0
+                for item in items:
+                    self._handle_message(item, received_at, received_mono)
+                if items and _event_type(items[0]):
+                    self.latency.record(
+                        RECEIVE_TO_DECODED, _event_type(items[0]), "",
+                        (time.perf_counter() - received_mono) * 1e6,
+                    )
 
-            except asyncio.TimeoutError:
-                logger.warning("WebSocket receive timeout")
             except self._connection_closed as e:
                 logger.warning(f"WebSocket connection closed: {e}")
                 break
-            except json.JSONDecodeError as e:
+            except codec.DecodeError as e:
                 logger.error(f"Failed to parse message: {e}")
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
@@ -519,13 +1108,38 @@ class MarketWebSocket:
             auto_reconnect: Whether to automatically reconnect on disconnect
         """
         self._running = True
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        owns_latency_dump = self.latency.start_periodic_dump()
+        owns_clock_sync = self.manage_clock and self.clock.start()
 
+        try:
+            await self._connection_loop(auto_reconnect)
+        finally:
+            for task in list(self._resync_tasks.values()):
+                task.cancel()
+            self._resync_tasks.clear()
+
+            if self._dispatch_task is not None:
+                self._dispatch_task.cancel()
+                try:
+                    await self._dispatch_task
+                except asyncio.CancelledError:
+                    pass
+                self._dispatch_task = None
+
+            if owns_latency_dump:
+                self.latency.stop_periodic_dump()
+            if owns_clock_sync:
+                await self.clock.stop()
+
+    async def _connection_loop(self, auto_reconnect: bool) -> None:
+        """Connect, subscribe and receive until stopped."""
         while self._running:
             # Connect
             if not await self.connect():
                 if auto_reconnect:
-                    logger.info(f"Reconnecting in {self.reconnect_interval}s...")
-                    await asyncio.sleep(self.reconnect_interval)
+                    await self._reconnect_delay()
                     continue
                 else:
                     break
@@ -535,9 +1149,18 @@ class MarketWebSocket:
                 logger.info(f"Sending subscription for {len(self._subscribed_assets)} assets after connect")
                 await self.subscribe(list(self._subscribed_assets))
 
+                # Don't wait for the WebSocket snapshots to replace books
+                # that went stale while we were away
+                for asset_id in self._stale_assets & self._subscribed_assets:
+                    if asset_id in self._orderbooks:
+                        self._schedule_resync(asset_id)
+
             # Run message loop
             await self._run_loop()
 
+            # Nothing cached can be trusted until it is refreshed
+            self._stale_assets.update(self._subscribed_assets)
+
             # Handle disconnect
             if self._on_disconnect:
                 self._on_disconnect()
@@ -546,11 +1169,22 @@ class MarketWebSocket:
                 break
 
             if auto_reconnect:
-                logger.info(f"Reconnecting in {self.reconnect_interval}s...")
-                await asyncio.sleep(self.reconnect_interval)
+                await self._reconnect_delay()
             else:
                 break
 
+    async def _reconnect_delay(self) -> None:
+        """Sleep before reconnecting, with exponential backoff and jitter."""
+        ceiling = min(
+            self.max_reconnect_interval,
+            self.reconnect_interval * (2 ** min(self._reconnect_attempts, 16)),
+        )
+        self._reconnect_attempts += 1
+        # Equal jitter: at least half the backoff, spread over the rest
+        delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+        logger.info(f"Reconnecting in {delay:.1f}s (attempt {self._reconnect_attempts})...")
+        await asyncio.sleep(delay)
+
     async def run_until_cancelled(self) -> None:
         """Run until cancelled or stopped."""
         try:
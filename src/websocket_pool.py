@@ -0,0 +1,490 @@
+"""
+WebSocket Pool Module - Sharded Market Data Connections
+
+Spreads market-channel subscriptions across several MarketWebSocket
+connections so hundreds of assets can be watched without one socket
+becoming the bottleneck:
+- Configurable per-connection asset cap
+- Chunked subscribe/unsubscribe messages
+- Rebalancing on subscribe and unsubscribe
+- One merged event stream and one shared orderbook cache
+
+MarketWebSocketPool exposes the same subscription, callback and cache
+API as MarketWebSocket.
+
+Example:
+    from src.websocket_pool import MarketWebSocketPool
+
+    pool = MarketWebSocketPool(max_assets_per_connection=50)
+
+    @pool.on_book
+    async def handle_book(snapshot):
+        print(snapshot.asset_id, snapshot.mid_price)
+
+    await pool.subscribe(all_token_ids)
+    await pool.run()
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Type, TYPE_CHECKING
+
+from .clock import ClockSync, get_clock
+from .latency import LatencyRecorder
+from .websocket_client import (
+    WSS_MARKET_URL,
+    BookCallback,
+    ErrorCallback,
+    MarketWebSocket,
+    OrderbookSnapshot,
+    PriceChangeCallback,
+    TradeCallback,
+)
+
+if TYPE_CHECKING:
+    from .recorder import MarketDataRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class MarketWebSocketPool:
+    """
+    Pool of MarketWebSocket shards behind a single client interface.
+
+    Each asset is owned by exactly one shard. New assets go to the
+    least-loaded shard with spare capacity, and new shards are opened
+    when every shard is full. After unsubscribes, under-used shards
+    are drained into the others and closed.
+    """
+
+    def __init__(
+        self,
+        max_assets_per_connection: int = 100,
+        url: str = WSS_MARKET_URL,
+        reconnect_interval: float = 5.0,
+        ping_interval: float = 20.0,
+        ping_timeout: float = 10.0,
+        book_type: Type[Any] = OrderbookSnapshot,
+        subscribe_chunk_size: int = 100,
+        recorder: Optional["MarketDataRecorder"] = None,
+        latency: Optional[LatencyRecorder] = None,
+        clock: Optional[ClockSync] = None,
+    ):
+        """
+        Initialize WebSocket pool.
+
+        Args:
+            max_assets_per_connection: Asset cap per shard connection
+            url: WebSocket endpoint URL
+            reconnect_interval: Initial shard reconnect delay (backs off)
+            ping_interval: Seconds between ping messages
+            ping_timeout: Seconds to wait for pong response
+            book_type: Orderbook class used for the shared cache
+            subscribe_chunk_size: Maximum asset IDs per subscription message
+            recorder: Optional MarketDataRecorder shared by every shard
+            latency: LatencyRecorder shared by every shard (created if not given)
+            clock: Server clock shared by every shard (default: shared clock);
+                its periodic sync is run by the pool, never by a shard
+        """
+        if max_assets_per_connection < 1:
+            raise ValueError("max_assets_per_connection must be at least 1")
+
+        self.max_assets_per_connection = max_assets_per_connection
+        self.url = url
+        self.reconnect_interval = reconnect_interval
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.book_type = book_type
+        self.subscribe_chunk_size = subscribe_chunk_size
+        self.recorder = recorder
+        self.latency = latency if latency is not None else LatencyRecorder()
+        self.clock = clock or get_clock()
+
+        # Shards and asset ownership
+        self._shards: List[MarketWebSocket] = []
+        self._owner: Dict[str, MarketWebSocket] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._running = False
+        self._auto_reconnect = True
+        self._stopped: Optional[asyncio.Event] = None
+
+        # Orderbook cache shared by every shard
+        self._orderbooks: Dict[str, Any] = {}
+
+        # Callbacks
+        self._on_book: Optional[BookCallback] = None
+        self._on_price_change: Optional[PriceChangeCallback] = None
+        self._on_trade: Optional[TradeCallback] = None
+        self._on_error: Optional[ErrorCallback] = None
+        self._on_connect: Optional[Callable[[], None]] = None
+        self._on_disconnect: Optional[Callable[[], None]] = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if any shard is connected."""
+        return any(shard.is_connected for shard in self._shards)
+
+    @property
+    def all_connected(self) -> bool:
+        """Check if every shard is connected."""
+        return bool(self._shards) and all(shard.is_connected for shard in self._shards)
+
+    @property
+    def shard_count(self) -> int:
+        """Number of open shards."""
+        return len(self._shards)
+
+    @property
+    def shard_loads(self) -> List[int]:
+        """Number of assets owned by each shard."""
+        return [len(shard._subscribed_assets) for shard in self._shards]
+
+    @property
+    def subscribed_assets(self) -> Set[str]:
+        """All subscribed asset IDs."""
+        return set(self._owner)
+
+    @property
+    def orderbooks(self) -> Dict[str, Any]:
+        """Get cached orderbooks."""
+        return self._orderbooks
+
+    def get_orderbook(self, asset_id: str) -> Optional[Any]:
+        """Get cached orderbook for asset."""
+        return self._orderbooks.get(asset_id)
+
+    def get_mid_price(self, asset_id: str) -> float:
+        """Get mid price for asset."""
+        ob = self._orderbooks.get(asset_id)
+        return ob.mid_price if ob else 0.0
+
+    def is_stale(self, asset_id: str) -> bool:
+        """Check if an asset's cached book can't be trusted right now."""
+        shard = self._owner.get(asset_id)
+        return shard.is_stale(asset_id) if shard else True
+
+    def last_good_update(self, asset_id: str) -> float:
+        """Get wall-clock time of the last verified update (0 if none)."""
+        shard = self._owner.get(asset_id)
+        return shard.last_good_update(asset_id) if shard else 0.0
+
+    def live_book(self, asset_id: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Get the live book in REST /book shape, if it can be trusted."""
+        shard = self._owner.get(asset_id)
+        return shard.live_book(asset_id, max_age) if shard else None
+
+    @property
+    def last_good_updates(self) -> Dict[str, float]:
+        """Get last verified update times for all assets."""
+        updates: Dict[str, float] = {}
+        for shard in self._shards:
+            updates.update(shard.last_good_updates)
+        return updates
+
+    # Callback decorators
+    def on_book(self, callback: BookCallback) -> BookCallback:
+        """Decorator to set book update callback."""
+        self._on_book = callback
+        return callback
+
+    def on_price_change(self, callback: PriceChangeCallback) -> PriceChangeCallback:
+        """Decorator to set price change callback."""
+        self._on_price_change = callback
+        return callback
+
+    def on_trade(self, callback: TradeCallback) -> TradeCallback:
+        """Decorator to set trade callback."""
+        self._on_trade = callback
+        return callback
+
+    def on_error(self, callback: ErrorCallback) -> ErrorCallback:
+        """Decorator to set error callback."""
+        self._on_error = callback
+        return callback
+
+    def on_connect(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Decorator to set connect callback (fired per shard)."""
+        self._on_connect = callback
+        return callback
+
+    def on_disconnect(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Decorator to set disconnect callback (fired per shard)."""
+        self._on_disconnect = callback
+        return callback
+
+    # Shard management
+
+    def _create_shard(self) -> MarketWebSocket:
+        """Open a new shard wired into the pool's cache and callbacks."""
+        shard = MarketWebSocket(
+            url=self.url,
+            reconnect_interval=self.reconnect_interval,
+            ping_interval=self.ping_interval,
+            ping_timeout=self.ping_timeout,
+            book_type=self.book_type,
+            subscribe_chunk_size=self.subscribe_chunk_size,
+            recorder=self.recorder,
+            latency=self.latency,
+            clock=self.clock,
+            # Shards come and go with rebalancing; the pool owns the sync
+            manage_clock=False,
+        )
+        shard._orderbooks = self._orderbooks
+
+        # Forward through the pool so callbacks can be set at any time
+        shard.on_book(lambda snapshot: self._forward(self._on_book, snapshot))
+        shard.on_price_change(lambda market, changes: self._forward(self._on_price_change, market, changes))
+        shard.on_trade(lambda trade: self._forward(self._on_trade, trade))
+        shard.on_error(lambda e: self._on_error(e) if self._on_error else None)
+        shard.on_connect(lambda: self._on_connect() if self._on_connect else None)
+        shard.on_disconnect(lambda: self._on_disconnect() if self._on_disconnect else None)
+
+        self._shards.append(shard)
+        if self._running:
+            self._start_shard(shard)
+        logger.info(f"Opened WebSocket shard #{len(self._shards)}")
+        return shard
+
+    async def _forward(self, callback: Optional[Callable[..., Any]], *args: Any) -> None:
+        """Invoke a pool callback that may be sync or async."""
+        if not callback:
+            return
+        result = callback(*args)
+        if asyncio.iscoroutine(result):
+            await result
+
+    def _start_shard(self, shard: MarketWebSocket) -> None:
+        """Run a shard in the background."""
+        self._tasks[id(shard)] = asyncio.create_task(
+            shard.run(auto_reconnect=self._auto_reconnect)
+        )
+
+    async def _close_shard(self, shard: MarketWebSocket) -> None:
+        """Stop and remove an empty shard."""
+        self._shards.remove(shard)
+        task = self._tasks.pop(id(shard), None)
+        # Draining a shard is not a loss of connectivity for the pool
+        shard._on_disconnect = None
+        shard.stop()
+        await shard.disconnect()
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.info(f"Closed WebSocket shard ({len(self._shards)} remaining)")
+
+    def _spare(self, shard: MarketWebSocket) -> int:
+        """Remaining asset capacity of a shard."""
+        return self.max_assets_per_connection - len(shard._subscribed_assets)
+
+    def _assign(self, asset_ids: List[str]) -> Dict[int, List[str]]:
+        """Assign new assets to shards, opening shards as needed."""
+        groups: Dict[int, List[str]] = {}
+        for asset_id in asset_ids:
+            candidates = [s for s in self._shards if self._spare(s) - len(groups.get(id(s), [])) > 0]
+            if candidates:
+                shard = min(candidates, key=lambda s: len(s._subscribed_assets) + len(groups.get(id(s), [])))
+            else:
+                shard = self._create_shard()
+            groups.setdefault(id(shard), []).append(asset_id)
+            self._owner[asset_id] = shard
+        return groups
+
+    def _shard_by_id(self, shard_id: int) -> MarketWebSocket:
+        """Look up a shard by its id()."""
+        return next(s for s in self._shards if id(s) == shard_id)
+
+    async def _rebalance(self) -> None:
+        """Drain under-used shards into the rest and close empty ones."""
+        for shard in [s for s in self._shards if not s._subscribed_assets]:
+            await self._close_shard(shard)
+
+        while len(self._shards) > 1:
+            total = sum(len(s._subscribed_assets) for s in self._shards)
+            needed = -(-total // self.max_assets_per_connection)
+            if len(self._shards) <= needed:
+                break
+
+            # Move the lightest shard's assets into the others
+            source = min(self._shards, key=lambda s: len(s._subscribed_assets))
+            moving = list(source._subscribed_assets)
+            targets = [s for s in self._shards if s is not source]
+            if sum(self._spare(s) for s in targets) < len(moving):
+                break
+
+            for target in sorted(targets, key=self._spare, reverse=True):
+                take = moving[:self._spare(target)]
+                moving = moving[len(take):]
+                if take:
+                    # Subscribe on the target before dropping the source
+                    # so the shared book never misses an update
+                    await target.subscribe_more(take)
+                    for asset_id in take:
+                        self._owner[asset_id] = target
+                if not moving:
+                    break
+
+            await self._close_shard(source)
+
+    # Subscription API
+
+    async def subscribe(self, asset_ids: List[str], replace: bool = False) -> bool:
+        """
+        Subscribe to market data for assets.
+
+        Args:
+            asset_ids: List of token IDs to subscribe to
+            replace: If True, replace existing subscriptions (clears old data)
+
+        Returns:
+            True if every shard accepted its subscription
+        """
+        if not asset_ids:
+            return False
+
+        ok = True
+        if replace:
+            keep = set(asset_ids)
+            removed = [a for a in self._owner if a not in keep]
+            if removed:
+                ok = await self.unsubscribe(removed)
+            self._orderbooks.clear()
+
+        return await self.subscribe_more(asset_ids) and ok
+
+    async def subscribe_more(self, asset_ids: List[str]) -> bool:
+        """
+        Subscribe to additional assets.
+
+        Args:
+            asset_ids: Additional token IDs to subscribe to
+
+        Returns:
+            True if every shard accepted its subscription
+        """
+        new_assets = [a for a in dict.fromkeys(asset_ids) if a not in self._owner]
+        if not new_assets:
+            return bool(asset_ids)
+
+        ok = True
+        for shard_id, group in self._assign(new_assets).items():
+            shard = self._shard_by_id(shard_id)
+            if not await shard.subscribe_more(group):
+                ok = False
+        logger.info(
+            f"Pool subscribed to {len(new_assets)} assets "
+            f"({len(self._owner)} across {len(self._shards)} shards)"
+        )
+        return ok
+
+    async def unsubscribe(self, asset_ids: List[str]) -> bool:
+        """
+        Unsubscribe from assets and evict their cached books.
+
+        Args:
+            asset_ids: Token IDs to unsubscribe from
+
+        Returns:
+            True if every shard accepted its unsubscription
+        """
+        groups: Dict[int, List[str]] = {}
+        for asset_id in asset_ids:
+            shard = self._owner.pop(asset_id, None)
+            if shard is not None:
+                groups.setdefault(id(shard), []).append(asset_id)
+            self._orderbooks.pop(asset_id, None)
+
+        if not groups:
+            return False
+
+        ok = True
+        for shard_id, group in groups.items():
+            shard = self._shard_by_id(shard_id)
+            if not await shard.unsubscribe(group):
+                ok = False
+            shard.evict(group)
+
+        await self._rebalance()
+        return ok
+
+    async def set_subscriptions(self, asset_ids: List[str]) -> bool:
+        """
+        Change the subscription set by sending only the differences.
+
+        Args:
+            asset_ids: Complete set of token IDs to be subscribed to
+
+        Returns:
+            True if every shard accepted its changes
+        """
+        target = set(asset_ids)
+        removed = [a for a in self._owner if a not in target]
+        added = [a for a in dict.fromkeys(asset_ids) if a not in self._owner]
+
+        ok = True
+        # Subscribe first so rebalancing after the removal can use new shards
+        if added:
+            ok = await self.subscribe_more(added)
+        if removed:
+            ok = await self.unsubscribe(removed) and ok
+        return ok
+
+    # Lifecycle
+
+    async def run(self, auto_reconnect: bool = True) -> None:
+        """
+        Run all shards until stopped.
+
+        Args:
+            auto_reconnect: Whether shards reconnect on disconnect
+        """
+        self._running = True
+        self._auto_reconnect = auto_reconnect
+        self._stopped = asyncio.Event()
+        # Claim the shared report task before any shard can
+        owns_latency_dump = self.latency.start_periodic_dump()
+        owns_clock_sync = self.clock.start()
+
+        for shard in self._shards:
+            if id(shard) not in self._tasks:
+                self._start_shard(shard)
+
+        try:
+            await self._stopped.wait()
+        finally:
+            await self.disconnect()
+            if owns_latency_dump:
+                self.latency.stop_periodic_dump()
+            if owns_clock_sync:
+                await self.clock.stop()
+
+    async def run_until_cancelled(self) -> None:
+        """Run until cancelled or stopped."""
+        try:
+            await self.run(auto_reconnect=True)
+        except asyncio.CancelledError:
+            await self.disconnect()
+
+    async def disconnect(self) -> None:
+        """Disconnect every shard."""
+        self._running = False
+        for shard in self._shards:
+            shard.stop()
+            await shard.disconnect()
+
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        """Stop the pool."""
+        self._running = False
+        for shard in self._shards:
+            shard.stop()
+        if self._stopped is not None:
+            self._stopped.set()
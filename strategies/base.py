@@ -21,6 +21,7 @@ Usage:
 """
 
 import asyncio
+import math
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -29,8 +30,10 @@ from typing import Optional, Dict, List
 from lib.console import LogBuffer, log
 from lib.market_manager import MarketManager, MarketInfo
 from lib.price_tracker import PriceTracker
-from lib.position_manager import PositionManager
+from lib.position_manager import Position, PositionManager
 from src.bot import TradingBot
+from src.presign import OrderLadder
+from src.user_websocket import UserWebSocket
 from src.websocket_client import OrderbookSnapshot
 
 
@@ -54,7 +57,15 @@ class StrategyConfig:
 
     # Display settings
     update_interval: float = 0.1
-    order_refresh_interval: float = 30.0  # Seconds between order refreshes
+    order_refresh_interval: float = 30.0  # Seconds between REST order refreshes (fallback)
+    use_user_websocket: bool = False  # Stream order/fill updates instead of polling
+
+    # Order pricing and pre-signing
+    tick_size: float = 0.01
+    presign_band_ticks: int = 0  # Pre-signed buy rungs above/below the mid (0 disables)
+
+    # Connection warm-up
+    warm_up: bool = False  # Warm order connections and keep them alive while running
 
 
 class BaseStrategy(ABC):
@@ -109,6 +120,13 @@ class BaseStrategy(ABC):
         self._last_order_refresh: float = 0
         self._order_refresh_task: Optional[asyncio.Task] = None
 
+        # User channel stream (replaces polling while connected)
+        self.user_ws: Optional[UserWebSocket] = None
+        self._user_ws_task: Optional[asyncio.Task] = None
+
+        # Pre-signed buys, so a signal skips signing
+        self.ladder: Optional[OrderLadder] = None
+
     @property
     def is_connected(self) -> bool:
         """Check if WebSocket is connected."""
@@ -127,33 +145,43 @@ class BaseStrategy(ABC):
     @property
     def open_orders(self) -> List[dict]:
         """Get cached open orders."""
+        if self.user_ws and self.user_ws.orders_synced:
+            return self.user_ws.open_orders
         return self._cached_orders
 
-    def _refresh_orders_sync(self) -> List[dict]:
-        """Refresh open orders synchronously (called via to_thread)."""
-        try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.bot.get_open_orders())
-            finally:
-                loop.close()
-        except Exception:
-            return []
-
     async def _do_order_refresh(self) -> None:
         """Background task to refresh orders without blocking."""
         try:
-            orders = await asyncio.to_thread(self._refresh_orders_sync)
-            self._cached_orders = orders
+            # get_open_orders already runs the HTTP call off the event loop
+            self._cached_orders = await self.bot.get_open_orders()
         except Exception:
             pass
         finally:
             self._order_refresh_task = None
 
+    def _start_user_stream(self) -> None:
+        """Stream order and fill updates over the user channel."""
+        creds = self.bot.api_creds
+        if not self.config.use_user_websocket or not creds or not creds.is_valid():
+            return
+
+        # Seed through the client, which raises on failure (the bot's
+        # get_open_orders would report an empty book instead)
+        self.user_ws = UserWebSocket(creds, orders_fetcher=self.bot.clob_client.aget_open_orders)
+
+        @self.user_ws.on_trade
+        def handle_fill(trade):  # pyright: ignore[reportUnusedFunction]
+            if trade.status == "MATCHED":
+                self.log(f"Fill: {trade.side} {trade.size:.2f} @ {trade.price:.4f}", "trade")
+
+        self._user_ws_task = asyncio.create_task(self.user_ws.run())
+
     def _maybe_refresh_orders(self) -> None:
         """Schedule order refresh if interval has passed (fire-and-forget)."""
+        # Streaming updates keep the cache current; polling is the fallback
+        if self.user_ws and self.user_ws.orders_synced:
+            return
+
         now = time.time()
         if now - self._last_order_refresh > self.config.order_refresh_interval:
             # Don't start new refresh if one is already running
@@ -192,6 +220,8 @@ class BaseStrategy(ABC):
             for side, token_id in self.token_ids.items():
                 if token_id == snapshot.asset_id:
                     self.prices.record(side, snapshot.mid_price)
+                    if self.ladder:
+                        self.ladder.poke()
                     break
 
             # Delegate to subclass
@@ -201,6 +231,8 @@ class BaseStrategy(ABC):
         def handle_market_change(old_slug: str, new_slug: str):  # pyright: ignore[reportUnusedFunction]
             self.log(f"Market changed: {old_slug} -> {new_slug}", "warning")
             self.prices.clear()
+            if self.ladder:
+                self.ladder.set_tokens(self.token_ids.values())
             self.on_market_change(old_slug, new_slug)
 
         @self.market.on_connect
@@ -222,6 +254,27 @@ class BaseStrategy(ABC):
         if not await self.market.wait_for_data(timeout=5.0):
             self.log("Timeout waiting for market data", "warning")
 
+        self._start_user_stream()
+
+        # Serve book reads from the live WebSocket books while fresh
+        self.bot.set_book_source(self.market.live_book)
+
+        # Open order connections before the first signal fires
+        if self.config.warm_up:
+            await self.bot.warm_up()
+
+        # Pre-sign buys around the live prices
+        if self.bot.signer and self.config.presign_band_ticks > 0:
+            self.ladder = OrderLadder(
+                self.bot,
+                price_source=self._token_price,
+                amounts=(self.config.size,),
+                band_ticks=self.config.presign_band_ticks,
+                tick_size=self.config.tick_size,
+            )
+            self.ladder.set_tokens(self.token_ids.values())
+            self.ladder.start()
+
         return True
 
     async def stop(self) -> None:
@@ -237,7 +290,26 @@ class BaseStrategy(ABC):
                 pass
             self._order_refresh_task = None
 
+        if self.user_ws is not None:
+            self.user_ws.stop()
+            await self.user_ws.disconnect()
+        if self._user_ws_task is not None:
+            self._user_ws_task.cancel()
+            try:
+                await self._user_ws_task
+            except asyncio.CancelledError:
+                pass
+            self._user_ws_task = None
+
+        if self.ladder is not None:
+            await self.ladder.stop()
+            self.ladder = None
+
+        self.bot.set_book_source(None)
         await self.market.stop()
+        # Undo start()'s warm-up only; closing the bot is up to its creator
+        if self.config.warm_up:
+            await self.bot.cool_down()
 
     async def run(self) -> None:
         """Main strategy loop."""
@@ -276,11 +348,23 @@ class BaseStrategy(ABC):
         """Get current prices from market manager."""
         prices = {}
         for side in ["up", "down"]:
+            # Never act on a book that may have missed updates
+            if self.market.is_stale(side):
+                continue
             price = self.market.get_mid_price(side)
             if price > 0:
                 prices[side] = price
         return prices
 
+    def _token_price(self, token_id: str) -> Optional[float]:
+        """Get a token's mid price, or None if unknown or stale."""
+        for side, side_token_id in self.token_ids.items():
+            if side_token_id == token_id:
+                if self.market.is_stale(side):
+                    return None
+                return self.market.get_mid_price(side) or None
+        return None
+
     async def _check_exits(self, prices: Dict[str, float]) -> None:
         """Check and execute exits for all positions."""
         exits = self.positions.check_all_exits(prices)
@@ -316,17 +400,31 @@ class BaseStrategy(ABC):
             self.log(f"No token ID for {side}", "error")
             return False
 
-        size = self.config.size / current_price
-        buy_price = min(current_price + 0.02, 0.99)
+        if self.ladder:
+            # Pre-signed rungs sit on ticks and are sized by USDC at their
+            # limit price, so round the limit up to a tick and size at it.
+            # Versus mid sizing this buys ~2c/price fewer shares (9.6 vs 10
+            # for $5 at a 0.50 mid) but a fill never costs more than size
+            tick = self.config.tick_size
+            buy_ticks = min(math.ceil(round((current_price + 0.02) / tick, 6)), round(1 / tick) - 1)
+            buy_price = round(buy_ticks * tick, 10)
+            size = self.config.size / buy_price
+        else:
+            buy_price = min(current_price + 0.02, 0.99)
+            size = self.config.size / current_price
 
         self.log(f"BUY {side.upper()} @ {current_price:.4f} size={size:.2f}", "trade")
 
-        result = await self.bot.place_order(
-            token_id=token_id,
-            price=buy_price,
-            size=size,
-            side="BUY"
-        )
+        presigned = self.ladder.take(token_id, "BUY", buy_price, self.config.size) if self.ladder else None
+        if presigned:
+            result = await self.bot.place_signed_order(presigned.signed)
+        else:
+            result = await self.bot.place_order(
+                token_id=token_id,
+                price=buy_price,
+                size=size,
+                side="BUY"
+            )
 
         if result.success:
             self.log(f"Order placed: {result.order_id}", "success")
@@ -18,6 +18,7 @@ Usage:
 
     strategy = FlashCrashStrategy(bot, config)
     await strategy.run()
+    await bot.close()
 """
 
 from dataclasses import dataclass
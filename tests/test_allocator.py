@@ -0,0 +1,106 @@
+"""Tests for order salt allocation and the persisted exchange nonce."""
+
+import json
+import threading
+
+import pytest
+
+from src.allocator import MAX_SALT, OrderIdAllocator
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "order_ids.json")
+
+
+def test_salts_are_unique_across_instances_sharing_a_file(state_path):
+    first = OrderIdAllocator(state_path, block_size=8)
+    second = OrderIdAllocator(state_path, block_size=8)
+    salts = []
+    for _ in range(50):
+        salts.append(first.next_salt())
+        salts.append(second.next_salt())
+    assert len(set(salts)) == len(salts)
+
+
+def test_salts_are_unique_across_threads(state_path):
+    allocators = [OrderIdAllocator(state_path, block_size=4) for _ in range(2)]
+    salts = []
+    lock = threading.Lock()
+
+    def allocate(allocator):
+        mine = [allocator.next_salt() for _ in range(200)]
+        with lock:
+            salts.extend(mine)
+
+    threads = [threading.Thread(target=allocate, args=(allocators[i % 2],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(salts)) == 800
+
+
+def test_restart_resumes_past_the_reserved_block(state_path):
+    before = OrderIdAllocator(state_path, block_size=100)
+    used = [before.next_salt() for _ in range(3)]
+
+    # A restart never hands out salts from the old, partly used block
+    after = OrderIdAllocator(state_path, block_size=100)
+    salt = after.next_salt()
+    assert salt >= used[0] + 100
+    with open(state_path) as f:
+        assert json.load(f)["next_salt"] == salt + 100
+
+
+def test_new_block_is_reserved_when_current_one_runs_out(state_path):
+    allocator = OrderIdAllocator(state_path, block_size=2)
+    salts = [allocator.next_salt() for _ in range(5)]
+    assert salts == sorted(set(salts))
+    with open(state_path) as f:
+        assert json.load(f)["next_salt"] == salts[0] + 6
+
+
+def test_in_memory_salts_are_unique_and_bounded():
+    allocator = OrderIdAllocator()
+    salts = [allocator.next_salt() for _ in range(1000)]
+    assert len(set(salts)) == 1000
+    assert all(0 < salt < MAX_SALT for salt in salts)
+
+
+def test_nonce_round_trips_through_the_state_file(state_path):
+    allocator = OrderIdAllocator(state_path)
+    assert allocator.nonce == 0
+    allocator.set_nonce(3)
+    assert allocator.bump_nonce() == 4
+    assert OrderIdAllocator(state_path).nonce == 4
+
+
+def test_nonce_change_keeps_reserved_salts(state_path):
+    allocator = OrderIdAllocator(state_path, block_size=10)
+    allocator.next_salt()
+    allocator.set_nonce(2)
+    with open(state_path) as f:
+        assert json.load(f) == {"next_salt": 11, "nonce": 2}
+
+
+def test_salt_reservation_picks_up_nonce_from_other_instances(state_path):
+    first = OrderIdAllocator(state_path, block_size=1)
+    OrderIdAllocator(state_path).set_nonce(7)
+    first.next_salt()
+    assert first.nonce == 7
+
+
+def test_negative_nonce_is_rejected(state_path):
+    with pytest.raises(ValueError):
+        OrderIdAllocator(state_path).set_nonce(-1)
+
+
+def test_configure_switches_state_file(tmp_path):
+    allocator = OrderIdAllocator()
+    allocator.next_salt()
+    path = tmp_path / "ids.json"
+    path.write_text(json.dumps({"next_salt": 500, "nonce": 5}))
+    allocator.configure(path=str(path), block_size=10)
+    assert allocator.nonce == 5
+    assert allocator.next_salt() == 500
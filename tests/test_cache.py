@@ -0,0 +1,196 @@
+"""Tests for the TTL read cache and its single-flight fetches."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src import cache
+from src.cache import ReadCache
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic()."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "monotonic", fake)
+    return fake
+
+
+# TTL and eviction
+
+def test_value_is_served_until_ttl_expires(clock):
+    read_cache = ReadCache({"/book": 1.0})
+    calls = []
+    fetch = lambda: calls.append(1) or len(calls)
+
+    assert read_cache.get_or_fetch("/book", "a", fetch) == 1
+    clock.now += 0.9
+    assert read_cache.get_or_fetch("/book", "a", fetch) == 1
+    clock.now += 0.1
+    assert read_cache.get_or_fetch("/book", "a", fetch) == 2
+    assert read_cache.stats == {"entries": 1, "hits": 1, "misses": 2, "coalesced": 0}
+
+
+def test_zero_ttl_endpoints_are_not_stored(clock):
+    read_cache = ReadCache({"/price": 0})
+    read_cache.set("/price", "a", 1)
+    assert read_cache.get("/price", "a") is None
+    assert read_cache.get("/unknown", "a") is None
+
+
+def test_keys_and_endpoints_are_separate(clock):
+    read_cache = ReadCache({"/book": 1.0, "/price": 1.0})
+    read_cache.set("/book", "a", "book-a")
+    read_cache.set("/book", "b", "book-b")
+    read_cache.set("/price", "a", "price-a")
+    assert read_cache.get("/book", "a") == "book-a"
+    assert read_cache.get("/book", "b") == "book-b"
+    assert read_cache.get("/price", "a") == "price-a"
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    read_cache = ReadCache({"/book": 1.0}, max_entries=2)
+    read_cache.set("/book", "a", 1)
+    read_cache.set("/book", "b", 2)
+    read_cache.get("/book", "a")
+    read_cache.set("/book", "c", 3)
+    assert read_cache.get("/book", "b") is None
+    assert read_cache.get("/book", "a") == 1
+    assert read_cache.get("/book", "c") == 3
+
+
+def test_invalidate(clock):
+    read_cache = ReadCache({"/book": 1.0, "/price": 1.0})
+    for endpoint in ("/book", "/price"):
+        for key in ("a", "b"):
+            read_cache.set(endpoint, key, key)
+    read_cache.invalidate("/book", "a")
+    assert read_cache.get("/book", "a") is None and read_cache.get("/book", "b") == "b"
+    read_cache.invalidate("/book")
+    assert read_cache.get("/book", "b") is None and read_cache.get("/price", "a") == "a"
+    read_cache.invalidate()
+    assert read_cache.stats["entries"] == 0
+
+
+# Single-flight (threads)
+
+def test_concurrent_threads_share_one_fetch():
+    read_cache = ReadCache({"/book": 0})
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "book"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(read_cache.get_or_fetch("/book", "a", fetch)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while read_cache.stats["coalesced"] < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ["book"] * 8
+
+
+def test_fetch_error_reaches_every_waiting_thread():
+    read_cache = ReadCache()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        raise RuntimeError("down")
+
+    errors = []
+
+    def read():
+        try:
+            read_cache.get_or_fetch("/book", "a", fetch)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while read_cache.stats["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 4
+    assert read_cache.stats["entries"] == 0
+
+
+# Single-flight (coroutines)
+
+def test_concurrent_coroutines_share_one_fetch():
+    read_cache = ReadCache({"/book": 0})
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "book"
+
+    async def main():
+        return await asyncio.gather(*(read_cache.aget_or_fetch("/book", "a", fetch) for _ in range(8)))
+
+    assert asyncio.run(main()) == ["book"] * 8
+    assert calls == [1]
+    assert read_cache.stats["coalesced"] == 7
+
+
+def test_cancelled_caller_does_not_cancel_shared_fetch():
+    read_cache = ReadCache({"/book": 1.0})
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "book"
+
+    async def main():
+        first = asyncio.ensure_future(read_cache.aget_or_fetch("/book", "a", fetch))
+        second = asyncio.ensure_future(read_cache.aget_or_fetch("/book", "a", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "book"
+    assert read_cache.get("/book", "a") == "book"
+
+
+def test_async_fetch_error_is_not_cached():
+    read_cache = ReadCache({"/book": 1.0})
+    attempts = []
+
+    async def fetch():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("down")
+        return "book"
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await read_cache.aget_or_fetch("/book", "a", fetch)
+        return await read_cache.aget_or_fetch("/book", "a", fetch)
+
+    assert asyncio.run(main()) == "book"
@@ -0,0 +1,67 @@
+"""Tests for the latency histograms."""
+
+import pytest
+
+from src.latency import LatencyHistogram
+
+
+@pytest.mark.parametrize("bits", [2, 4, 7])
+def test_every_value_falls_inside_its_bucket_bounds(bits):
+    hist = LatencyHistogram(sub_bucket_bits=bits)
+    for value in range(0, 1 << (bits + 8)):
+        low, high = hist._bucket_bounds(hist._index(value))
+        assert low <= value <= high
+
+
+@pytest.mark.parametrize("bits", [2, 4, 7])
+def test_buckets_are_contiguous(bits):
+    hist = LatencyHistogram(sub_bucket_bits=bits)
+    previous_high = -1
+    for index in range(hist._index(1 << (bits + 8))):
+        low, high = hist._bucket_bounds(index)
+        assert low == previous_high + 1
+        assert high >= low
+        previous_high = high
+
+
+def test_small_values_are_exact():
+    hist = LatencyHistogram(sub_bucket_bits=7)
+    for value in range(128):
+        assert hist._bucket_bounds(hist._index(value)) == (value, value)
+
+
+def test_relative_error_is_bounded():
+    hist = LatencyHistogram(sub_bucket_bits=7)
+    for value in (128, 1000, 54321, 10**6, 10**9):
+        low, high = hist._bucket_bounds(hist._index(value))
+        assert (high - low) / low <= 2 ** -6
+
+
+def test_percentiles_cap_at_max():
+    hist = LatencyHistogram()
+    for value in range(1, 1001):
+        hist.record(value)
+    assert hist.percentile(50) == pytest.approx(500, rel=2 ** -6)
+    assert hist.percentile(100) == 1000
+    assert hist.min == 1 and hist.max == 1000
+
+
+def test_negative_values_are_counted_as_zero():
+    hist = LatencyHistogram()
+    hist.record(-5)
+    assert hist.negative == 1
+    assert hist.min == 0 and hist.percentile(50) == 0
+
+
+def test_merge_matches_recording_into_one():
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(0, 5000, 7):
+        (a if value % 2 else b).record(value)
+        both.record(value)
+    a.merge(b)
+    assert a.summary() == both.summary()
+
+
+def test_merge_rejects_other_precision():
+    with pytest.raises(ValueError):
+        LatencyHistogram(7).merge(LatencyHistogram(5))
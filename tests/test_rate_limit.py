@@ -0,0 +1,122 @@
+"""Tests for the token buckets and 429 adaptation."""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src import rate_limit
+from src.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic()."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake)
+    return fake
+
+
+def test_burst_is_free_then_waits_at_rate(clock):
+    bucket = TokenBucket(rate=10, burst=5)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+
+def test_refill_is_capped_at_burst(clock):
+    bucket = TokenBucket(rate=10, burst=5)
+    for _ in range(5):
+        bucket.reserve()
+    clock.now += 60
+    assert bucket.stats["tokens"] == pytest.approx(5)
+
+
+def test_penalize_pauses_for_retry_after_and_halves_rate(clock):
+    bucket = TokenBucket(rate=10, burst=5)
+    bucket.penalize(retry_after=3.0)
+    assert bucket.rate == 5
+    assert bucket.throttled == 1
+    assert bucket.reserve() == pytest.approx(3.0)
+
+
+def test_penalize_without_retry_after_uses_default_penalty(clock):
+    bucket = TokenBucket(rate=10, burst=5, default_penalty=2.0)
+    bucket.penalize()
+    assert bucket.reserve() == pytest.approx(2.0)
+
+
+def test_rate_never_drops_below_floor(clock):
+    bucket = TokenBucket(rate=10, burst=5, min_rate_fraction=0.1)
+    for _ in range(10):
+        bucket.penalize(0)
+    assert bucket.rate == pytest.approx(1.0)
+
+
+def test_reward_recovers_additively_up_to_base_rate(clock):
+    bucket = TokenBucket(rate=10, burst=5, recovery_fraction=0.05)
+    bucket.penalize(0)
+    bucket.reward()
+    assert bucket.rate == pytest.approx(5.5)
+    for _ in range(100):
+        bucket.reward()
+    assert bucket.rate == 10
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (1, 0), (-1, 1)])
+def test_rejects_non_positive_budget(rate, burst):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, burst)
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+
+def test_parse_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(when, usegmt=True)) == pytest.approx(30, abs=2)
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_on_response_feeds_429_and_success_back(clock):
+    limiter = RateLimiter({"test": (10.0, 5.0)})
+    limiter.on_response("test", 429, "1")
+    bucket = limiter.bucket("test")
+    assert bucket.rate == 5
+    assert bucket.reserve() == pytest.approx(1.0)
+    limiter.on_response("test", 200)
+    assert bucket.rate == pytest.approx(5.5)
+    limiter.on_response("test", 500)
+    assert bucket.rate == pytest.approx(5.5)
+
+
+def test_unknown_class_uses_default_budget():
+    limiter = RateLimiter()
+    assert limiter.bucket("nope").base_rate == rate_limit.DEFAULT_LIMITS[rate_limit.DEFAULT][0]
+
+
+@pytest.mark.parametrize("method, endpoint, expected", [
+    ("POST", "/order", rate_limit.ORDER_POST),
+    ("post", "orders", rate_limit.ORDER_POST),
+    ("DELETE", "/order", rate_limit.CANCEL),
+    ("GET", "/book?token_id=1", rate_limit.MARKET_DATA),
+    ("GET", "/data/orders", rate_limit.DATA),
+    ("GET", "/auth/api-keys", rate_limit.DEFAULT),
+])
+def test_classify_clob(method, endpoint, expected):
+    assert RateLimiter.classify_clob(method, endpoint) == expected
@@ -0,0 +1,205 @@
+"""Tests for retry classification, idempotency rules and the circuit breaker."""
+
+import httpx
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from src import retry
+from src.retry import CircuitBreaker, RetryPolicy, is_connect_error, is_transport_error
+
+
+def _requests_connection_error(reason: Exception) -> requests.exceptions.ConnectionError:
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/order", reason=reason))
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic()."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(retry.time, "monotonic", fake)
+    return fake
+
+
+# Error classification
+
+@pytest.mark.parametrize("error", [
+    httpx.ConnectError("refused"),
+    httpx.ConnectTimeout("timed out"),
+    httpx.PoolTimeout("pool exhausted"),
+    requests.exceptions.ConnectTimeout("timed out"),
+    _requests_connection_error(NewConnectionError(None, "refused")),
+])
+def test_connect_errors_never_reached_the_server(error):
+    assert is_connect_error(error)
+    assert is_transport_error(error)
+
+
+@pytest.mark.parametrize("error", [
+    httpx.ReadTimeout("read timed out"),
+    httpx.RemoteProtocolError("peer closed"),
+    requests.exceptions.ReadTimeout("read timed out"),
+    requests.exceptions.ConnectionError(ProtocolError("connection aborted")),
+    requests.exceptions.SSLError("handshake failed"),
+])
+def test_errors_after_sending_are_transport_but_not_connect(error):
+    assert not is_connect_error(error)
+    assert is_transport_error(error)
+
+
+@pytest.mark.parametrize("error", [ValueError("bad"), KeyError("x")])
+def test_usage_errors_are_not_transport_errors(error):
+    assert not is_connect_error(error)
+    assert not is_transport_error(error)
+
+
+def test_only_connect_errors_retry_non_idempotent_calls():
+    policy = RetryPolicy()
+    assert policy.should_retry_error(httpx.ConnectError("refused"), idempotent=False)
+    assert not policy.should_retry_error(httpx.ReadTimeout("timeout"), idempotent=False)
+    assert policy.should_retry_error(httpx.ReadTimeout("timeout"), idempotent=True)
+    assert not policy.should_retry_error(ValueError("bad"), idempotent=True)
+
+
+@pytest.mark.parametrize("status, idempotent, expected", [
+    (429, False, True),
+    (503, True, True),
+    (503, False, False),
+    (500, True, True),
+    (501, True, False),
+    (400, True, False),
+    (404, True, False),
+])
+def test_should_retry_status(status, idempotent, expected):
+    assert RetryPolicy().should_retry_status(status, idempotent) is expected
+
+
+# Idempotency rules
+
+@pytest.mark.parametrize("method, endpoint, expected", [
+    ("GET", "/book", True),
+    ("delete", "/order", True),
+    ("POST", "/order", False),
+    ("POST", "orders?x=1", False),
+    ("POST", "/auth/api-key", False),
+    ("POST", "/submit", False),
+    ("GET", "/auth/derive-api-key", True),
+])
+def test_default_idempotency(method, endpoint, expected):
+    assert RetryPolicy().is_idempotent(method, endpoint) is expected
+
+
+def test_endpoint_rules_override_method_default():
+    policy = RetryPolicy(endpoint_rules={("post", "cancel-all"): True, ("GET", "/nonce"): False})
+    assert policy.is_idempotent("POST", "/cancel-all")
+    assert not policy.is_idempotent("GET", "/nonce")
+    assert not policy.is_idempotent("POST", "/order")
+
+
+# Deadline and attempts
+
+def test_default_budget_fits_every_attempt_at_full_timeout():
+    policy = RetryPolicy(max_attempts=3, max_delay=2.0)
+    assert policy.budget(60) == 3 * 60 + 2 * 2.0
+    assert RetryPolicy(deadline=5.0).budget(60) == 5.0
+
+
+def test_attempt_timeout_is_capped_by_deadline(clock):
+    policy = RetryPolicy(deadline=10.0, min_attempt_timeout=0.5)
+    deadline = policy.start(timeout=30)
+    assert policy.attempt_timeout(30, deadline) == 10.0
+    clock.now += 9.8
+    assert policy.attempt_timeout(30, deadline) is None
+
+
+def test_default_deadline_does_not_cap_long_timeouts(clock):
+    policy = RetryPolicy()
+    deadline = policy.start(timeout=60)
+    assert policy.attempt_timeout(60, deadline) == 60
+
+
+def test_can_retry_respects_attempts_and_deadline(clock):
+    policy = RetryPolicy(max_attempts=3, deadline=10.0)
+    deadline = policy.start(timeout=5)
+    assert policy.can_retry(0, 1.0, deadline)
+    assert not policy.can_retry(2, 0.0, deadline)
+    assert not policy.can_retry(0, 11.0, deadline)
+
+
+def test_backoff_stays_within_cap():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+    assert all(0 <= policy.backoff(attempt) <= 0.5 for attempt in range(10) for _ in range(20))
+
+
+# Circuit breaker
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10.0)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_in == 10.0
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_one_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+
+def test_probe_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 10.0
+    breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_probe_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=10.0)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now += 10.0
+    breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_lost_probe_is_replaced_after_recovery_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 10.0
+    assert breaker.allow_request()
+    clock.now += 10.0
+    assert breaker.allow_request()
+
+
+def test_get_circuit_breaker_is_shared_per_host():
+    assert retry.get_circuit_breaker("https://a.test") is retry.get_circuit_breaker("https://a.test")
+    assert retry.get_circuit_breaker("https://a.test") is not retry.get_circuit_breaker("https://b.test")
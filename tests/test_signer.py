@@ -0,0 +1,90 @@
+"""Tests that every order signing backend matches eth_account's EIP-712 path."""
+
+import random
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+
+from src import secp256k1
+from src.signer import Order, OrderSigner
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+BACKENDS = [
+    "eth_account",
+    pytest.param(
+        "coincurve",
+        marks=pytest.mark.skipif(not secp256k1.COINCURVE_AVAILABLE, reason="coincurve not installed"),
+    ),
+    "auto",
+]
+
+
+def _random_orders(count: int):
+    rng = random.Random(7)
+    orders = []
+    for i in range(count):
+        orders.append(Order(
+            token_id=str(rng.getrandbits(256)),
+            price=rng.choice((0.01, 0.5, 0.123, 0.99, 1.0)),
+            size=rng.choice((1.0, 5.5, 123.456, 10_000.0)),
+            side=rng.choice(("BUY", "SELL")),
+            maker=Account.create().address,
+            nonce=rng.choice((0, 1, rng.getrandbits(64))),
+            fee_rate_bps=rng.choice((0, 100)),
+            signature_type=i % 3,
+            salt=rng.randrange(1, 1 << 53),
+        ))
+    return orders
+
+
+def _reference_signature(signer: OrderSigner, order: Order) -> str:
+    """Sign through encode_typed_data + sign_message."""
+    signable = encode_typed_data(
+        domain_data=signer.DOMAIN,
+        message_types=signer.ORDER_TYPES,
+        message_data={
+            "salt": order.salt,
+            "maker": order.maker,
+            "signer": signer.address,
+            "taker": ZERO_ADDRESS,
+            "tokenId": int(order.token_id),
+            "makerAmount": int(order.maker_amount),
+            "takerAmount": int(order.taker_amount),
+            "expiration": 0,
+            "nonce": order.nonce,
+            "feeRateBps": order.fee_rate_bps,
+            "side": order.side_value,
+            "signatureType": order.signature_type,
+        },
+    )
+    return "0x" + bytes(signer.wallet.sign_message(signable).signature).hex()
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return Account.create().key.hex()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_matches_encode_typed_data(private_key, backend):
+    signer = OrderSigner(private_key, backend=backend)
+    for order in _random_orders(25):
+        assert signer.sign_order(order)["signature"] == _reference_signature(signer, order)
+
+
+def test_auto_prefers_coincurve_when_installed(private_key):
+    expected = "coincurve" if secp256k1.COINCURVE_AVAILABLE else "eth_account"
+    assert OrderSigner(private_key).backend.name == expected
+
+
+def test_unknown_backend_is_rejected(private_key):
+    with pytest.raises(ValueError):
+        OrderSigner(private_key, backend="openssl")
+
+
+def test_coincurve_request_without_coincurve_is_rejected(private_key, monkeypatch):
+    monkeypatch.setattr(secp256k1, "COINCURVE_AVAILABLE", False)
+    with pytest.raises(ValueError):
+        OrderSigner(private_key, backend="coincurve")